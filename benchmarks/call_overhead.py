@@ -0,0 +1,51 @@
+"""Benchmark the per-call overhead of the API functions.
+
+Calls an API function in prepare-only mode, so nothing is sent, and prints
+the time per call of its stages:
+
+- url: the URL from the precompiled `Endpoint`
+- prepare: the `Request`, with the query parameters, headers and
+  authentication
+- call: the whole API function
+
+    $ python benchmarks/call_overhead.py
+    $ python benchmarks/call_overhead.py --number 100000
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import tmdbapi  # noqa: E402
+from tmdbapi._core import prepare_only  # noqa: E402
+from tmdbapi.api3 import movies  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=50000)
+    args = parser.parse_args()
+
+    cred = tmdbapi.Credential()
+    cred.set(api_key="benchmark")
+    tmdbapi.setting.use_cred(cred)
+
+    endpoint = movies._ENDPOINTS["movie-details"]
+    path = {"movie_id": 550}
+    query = {"language": None, "append_to_response": "credits"}
+    stages = {
+        "url": lambda: endpoint.build_url(path),
+        "prepare": lambda: endpoint.prepare(path, query),
+        "call": lambda: movies.details(550),
+    }
+    with prepare_only():
+        for name, stage in stages.items():
+            seconds = min(timeit.repeat(stage, number=args.number, repeat=3))
+            print(f"  {name:12} {seconds / args.number * 1e6:7.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
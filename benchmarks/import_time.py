@@ -0,0 +1,80 @@
+"""Benchmark the time of `import tmdbapi`.
+
+Runs `python -X importtime -c "import tmdbapi"` in fresh interpreters and
+prints the median cumulative time of the package and of its slowest
+imports, and the heavy dependencies which were loaded eagerly.
+
+    $ python benchmarks/import_time.py
+    $ python benchmarks/import_time.py --statement "import tmdbapi.api3.search"
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# The dependencies which `import tmdbapi` should not load.
+HEAVY = (
+    "requests",
+    "urllib3",
+    "cryptography",
+    "asyncio",
+    "aiohttp",
+    "webbrowser",
+    "sqlite3",
+    "zlib",
+)
+
+
+def import_times(statement: str) -> dict:
+    """Get the cumulative import time of each module in microseconds.
+
+    The modules imported by the interpreter startup are left out.
+    """
+    times = {}
+    for code in ("pass", statement):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        startup, times = times, {}
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit() and name.strip() not in startup:
+                # the top-level imports are not indented
+                times[name.strip()] = (int(cumulative), name[1:] == name.strip())
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--statement", default="import tmdbapi")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    runs = [import_times(args.statement) for _ in range(args.runs)]
+    total = statistics.median(
+        sum(us for us, top in run.values() if top) for run in runs
+    )
+    medians = {
+        name: statistics.median(run.get(name, (0,))[0] for run in runs)
+        for name in runs[0]
+    }
+    print(f"{args.statement}: {total / 1000:.1f} ms")
+    for name, us in sorted(medians.items(), key=lambda x: -x[1])[: args.top]:
+        print(f"  {us / 1000:8.1f} ms  {name}")
+    eager = [name for name in HEAVY if name in medians]
+    print(f"heavy dependencies loaded: {', '.join(eager) or 'none'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""Benchmark the JSON decoders of the responses.
+
+Decodes TMDB response bodies with json, orjson and msgspec (the backends of
+`tmdbapi.decoding`) and prints the time per body and the speedup over the
+standard library. The backends which are not installed are reported so.
+
+By default, the bodies are the fixtures in `benchmarks/responses`: a movie
+details with a large `append_to_response` (credits, images, videos,
+keywords, ...), a discover page and the aggregate credits of a TV show.
+
+    $ python benchmarks/json_decode.py
+    $ python benchmarks/json_decode.py recorded/*.json
+    $ python benchmarks/json_decode.py --synthetic
+    $ python benchmarks/json_decode.py --record  # needs a credential
+
+`--record` fetches the fixtures again from TMDB with the credential of the
+environment variables. With `--fields`, the bodies are decoded with the
+projection instead:
+
+    $ python benchmarks/json_decode.py --fields id title credits.cast[].id
+"""
+
+import argparse
+import functools
+import json
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from tmdbapi.decoding import (  # noqa: E402
+    BACKENDS,
+    available,
+    get_decoder,
+    get_projection,
+)
+
+APPEND = "credits,images,videos,keywords,release_dates,translations,external_ids"
+
+FIXTURES = Path(__file__).resolve().parent / "responses"
+
+# The API function and arguments of each fixture.
+RECORDS = {
+    "movie_550_details.json": (
+        "movies.details",
+        (550,),
+        {"append_to_response": APPEND},
+    ),
+    "discover_movie_page_1.json": ("discover.movies", (), {"page": 1}),
+    "tv_1399_aggregate_credits.json": ("tv_series.aggregate_credits", (1399,), {}),
+}
+
+
+def synthetic(cast: int = 300, images: int = 400) -> bytes:
+    """Generate a movie details body with appended facets."""
+    rng = random.Random(550)
+
+    def person(i):
+        return {
+            "adult": False,
+            "gender": rng.randint(0, 2),
+            "id": rng.randint(1, 5_000_000),
+            "known_for_department": "Acting",
+            "name": f"Actor Name {i}",
+            "original_name": f"Actor Name {i}",
+            "popularity": round(rng.random() * 100, 3),
+            "profile_path": f"/{rng.getrandbits(64):x}.jpg",
+            "cast_id": i,
+            "character": f"Character {i} (voice)",
+            "credit_id": f"{rng.getrandbits(96):024x}",
+            "order": i,
+        }
+
+    def image():
+        return {
+            "aspect_ratio": 1.778,
+            "height": 2160,
+            "iso_639_1": rng.choice([None, "en", "fr", "ja"]),
+            "file_path": f"/{rng.getrandbits(64):x}.jpg",
+            "vote_average": round(rng.random() * 10, 3),
+            "vote_count": rng.randint(0, 50),
+            "width": 3840,
+        }
+
+    body = {
+        "id": 550,
+        "title": "Fight Club",
+        "overview": "A ticking-time-bomb insomniac and a slippery soap salesman. " * 4,
+        "genres": [{"id": 18, "name": "Drama"}],
+        "popularity": 61.416,
+        "release_date": "1999-10-15",
+        "credits": {
+            "cast": [person(i) for i in range(cast)],
+            "crew": [person(i) for i in range(cast)],
+        },
+        "images": {
+            "backdrops": [image() for _ in range(images)],
+            "posters": [image() for _ in range(images)],
+        },
+        "keywords": {"keywords": [{"id": i, "name": f"kw{i}"} for i in range(40)]},
+    }
+    return json.dumps(body).encode()
+
+
+def record(directory: Path) -> list:
+    """Fetch and save the bodies of the fixtures."""
+    import tmdbapi
+    from tmdbapi._core import prepare_only
+
+    cred = tmdbapi.Credential()
+    cred.load_env_var()
+    tmdbapi.setting.use_cred(cred)
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for filename, (name, args, kwargs) in RECORDS.items():
+        module, _, function = name.partition(".")
+        func = getattr(getattr(tmdbapi.api3, module), function)
+        with prepare_only():
+            request = func(*args, **kwargs)
+        response = tmdbapi.setting.get_transport().request(**request.kwargs())
+        response.raise_for_status()
+        path = directory / filename
+        path.write_bytes(response.content)
+        paths.append(path)
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="*", type=Path)
+    parser.add_argument("--record", action="store_true")
+    parser.add_argument("--synthetic", action="store_true")
+    parser.add_argument("--directory", type=Path, default=FIXTURES)
+    parser.add_argument("--number", type=int, default=200)
+    parser.add_argument("--fields", nargs="+", metavar="PATH")
+    args = parser.parse_args()
+
+    if args.record:
+        args.files += record(args.directory)
+    elif args.synthetic:
+        args.files = [None]
+    elif not args.files:
+        args.files = sorted(args.directory.glob("*.json"))
+    bodies = {
+        "synthetic"
+        if path is None
+        else path.name: (synthetic() if path is None else path.read_bytes())
+        for path in args.files
+    }
+    installed = available()
+    backends = sorted(BACKENDS, key=lambda name: name != "json")
+    print(f"{'body':34} {'KiB':>6}  " + "  ".join(f"{n:>17}" for n in backends))
+    for label, body in bodies.items():
+        times = {}
+        for name in installed:
+            loads = get_decoder(name)
+            if args.fields:
+                projection = get_projection(args.fields)
+                loads = functools.partial(projection.decode, decoder=name)
+            seconds = min(
+                timeit.repeat(lambda: loads(body), number=args.number, repeat=3)
+            )
+            times[name] = seconds / args.number
+        cells = []
+        for name in backends:
+            if name in times:
+                speedup = times["json"] / times[name]
+                cells.append(f"{times[name] * 1e6:8.1f} us {speedup:5.2f}x")
+            else:
+                cells.append(f"{'not installed':>17}")
+        print(f"{label:34} {len(body) / 1024:6.0f}  " + "  ".join(cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -9,14 +9,25 @@ Subpackages
 -----------
 - `api3`: TMDB API version 3 methods and endpoints.
 - `api4`: TMDB API version 4 methods and endpoints.
+- `aio`: Coroutine versions of the `api3` and `api4` methods (requires aiohttp).
 - `integration`: High-level functions and integration features for simplifying 
 interactions with TMDB.
 - `tests`: Contains unit tests using pytest.
 
 Modules
 -------
+- `client.py`: Clients with their own settings, for many credentials in one process.
 - `creds.py`: Manages credentials for API access.
+- `decoding.py`: Fast JSON decoders (orjson, msgspec).
+- `models.py`: Typed, slot-based models of the responses.
+- `streaming.py`: Incremental parsing of the lists of large responses.
 - `exceptions.py`: Contains custom exception and warning classes.
+- `transport.py`: The pooled, keep-alive HTTP transport.
+- `ratelimit.py`: Client-side rate limiters.
+- `cache.py`: Response caches.
+- `batch.py`: Concurrent batch requests.
+- `pages.py`: Iterators over the items of the paged methods.
+- `store.py`: Local SQLite mirror of the fetched entities.
 - `_core.py`: The main part of the TMDB request class and the Setting class 
 for API configuration.
 
@@ -61,11 +72,36 @@ from ._core import pprint
 setting = _Setting()
 
 
-from . import api3, api4, integration
-from .creds import Credential
-
-_submodules = ["api3", "api4", "integration", "tests", "cred", "exceptions"]
-__all__ = _submodules + ["Setting", "Credential", "pprint"]
+from .client import TmdbClient
+from .creds import Credential, CredentialPool
+
+# imported on first access (PEP 562), so `import tmdbapi` stays cheap
+_submodules = [
+    "api3",
+    "api4",
+    "aio",
+    "integration",
+    "tests",
+    "client",
+    "creds",
+    "decoding",
+    "exceptions",
+    "transport",
+    "ratelimit",
+    "cache",
+    "batch",
+    "pages",
+    "store",
+    "models",
+    "streaming",
+]
+__all__ = _submodules + [
+    "Setting",
+    "Credential",
+    "CredentialPool",
+    "TmdbClient",
+    "pprint",
+]
 
 
 _SESSION = None  # requests.Session
@@ -1,15 +1,54 @@
 """The Core of the TMDb Request API
 """
 
+import contextlib
+import contextvars
+import functools
 import json as Json
+import string
+import time
 from logging.handlers import TimedRotatingFileHandler
 from pathlib import Path
 from typing import Optional
 
-import requests
-
 import tmdbapi
+from tmdbapi.creds import CredentialPool
+from tmdbapi.decoding import get_decoder, get_projection
 from tmdbapi.exceptions import STATUS, TmdbApiException
+from tmdbapi.streaming import iter_items
+from tmdbapi.transport import (
+    AsyncSingleFlight,
+    Retry,
+    SingleFlight,
+    flight_key,
+    retry_after,
+)
+
+# Whether `Tmdb.request_raw` only prepares the request, see `prepare_only`.
+_PREPARE_ONLY = contextvars.ContextVar("tmdbapi_prepare_only", default=False)
+# The client activated in the current context, see `tmdbapi.client`.
+_CLIENT = contextvars.ContextVar("tmdbapi_client", default=None)
+# The compiled endpoints of each information dictionary, by its id. The
+# dictionaries are module constants, so they live as long as the process.
+_ENDPOINTS = {}
+# The base URL of the API.
+API_BASE = "https://api.themoviedb.org"
+# The query values of the booleans.
+_BOOLEANS = {True: "true", False: "false"}
+
+
+def _on_current(method):
+    """Make a mutator of `tmdbapi.setting` change the settings of the client
+    activated in the current context, as the reads do."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        setting = self.current()
+        if setting is not self:
+            return getattr(setting, method.__name__)(*args, **kwargs)
+        return method(self, *args, **kwargs)
+
+    return wrapper
 
 
 class Setting:
@@ -30,6 +69,17 @@ class Setting:
             "use_session": False,
             "log_file": None,
             "credential": None,
+            "pool_connections": 10,
+            "pool_maxsize": 10,
+            "pool_idle_timeout": 30.0,
+            "rate_limit": None,
+            "retry": Retry(),
+            "cache": None,
+            "coalesce": True,
+            "store": None,
+            "json_decoder": "auto",
+            "fields": None,
+            "stream": None,
         }
 
     """
@@ -43,10 +93,35 @@ class Setting:
             "use_session": False,
             "log_file": None,
             "credential": None,
+            "pool_connections": 10,
+            "pool_maxsize": 10,
+            "pool_idle_timeout": 30.0,
+            "rate_limit": None,
+            "retry": Retry(),
+            "cache": None,
+            "coalesce": True,
+            "store": None,
+            "json_decoder": "auto",
+            "fields": None,
+            "stream": None,
         }
+        self._override = contextvars.ContextVar("tmdbapi_setting_override")
+        self._transport = None  # tmdbapi.transport.Transport
+        self._async_transport = None  # tmdbapi.aio.transport.AsyncTransport
+        self._session = None  # requests.Session, see `use_session`
+        # the identical GET requests in flight
+        self._single_flight = SingleFlight()
+        self._async_single_flight = AsyncSingleFlight()
 
     def __getitem__(self, key):
-        return self.setting[key]
+        setting = self
+        client = _CLIENT.get()
+        if client is not None and self is tmdbapi.setting:
+            setting = client.setting
+        override = setting._override.get(None)
+        if override is not None and key in override:
+            return override[key]
+        return setting.setting[key]
 
     def __repr__(self):
         return repr(self.setting)
@@ -70,6 +145,22 @@ class Setting:
         """
         pprint(self.setting, indent=indent)
 
+    def current(self) -> "Setting":
+        """Get the settings of the requests made in the current context.
+
+        Reading or changing `tmdbapi.setting` inside `TmdbClient.activate`
+        reads or changes the settings of the client; the other settings
+        objects are their own.
+
+        Returns
+        -------
+        Setting
+        """
+        client = _CLIENT.get()
+        if client is not None and self is tmdbapi.setting:
+            return client.setting
+        return self
+
     def _check_cred_exist(self):
         """Check credential is load in setting."""
         if self.setting["credential"] is None:
@@ -77,6 +168,7 @@ class Setting:
         else:
             return True
 
+    @_on_current
     def set(self, **kwargs):
         """Change multiple settings at once.
 
@@ -102,6 +194,17 @@ class Setting:
                 "use_session": False,
                 "log_file": None,
                 "credential": None,
+                "pool_connections": 10,
+                "pool_maxsize": 10,
+                "pool_idle_timeout": 30.0,
+                "rate_limit": None,
+                "retry": Retry(),
+                "cache": None,
+                "coalesce": True,
+                "store": None,
+                "json_decoder": "auto",
+                "fields": None,
+                "stream": None,
             }
 
         You can pass one or more of these settings as keyword arguments in the format
@@ -133,7 +236,32 @@ class Setting:
             self.log(kwargs["log_file"])
         if "credential" in settings:
             self.use_cred(kwargs["credential"])
+        if "rate_limit" in settings:
+            self.rate_limit(kwargs["rate_limit"])
+        if "retry" in settings:
+            self.retry(kwargs["retry"])
+        if "cache" in settings:
+            self.cache(kwargs["cache"])
+        if "coalesce" in settings:
+            self.coalesce(kwargs["coalesce"])
+        if "store" in settings:
+            self.store(kwargs["store"])
+        if "json_decoder" in settings:
+            self.json_decoder(kwargs["json_decoder"])
+        if "fields" in settings:
+            self.fields(kwargs["fields"])
+        if "stream" in settings:
+            self.stream(kwargs["stream"])
+        pool_settings = {
+            "pool_connections": "connections",
+            "pool_maxsize": "maxsize",
+            "pool_idle_timeout": "idle_timeout",
+        }
+        pool_kwargs = {v: kwargs[k] for k, v in pool_settings.items() if k in settings}
+        if pool_kwargs:
+            self.pool(**pool_kwargs)
 
+    @_on_current
     def use_access_token(self, use: bool):
         """Toggle the use of an access token for API authentication.
 
@@ -152,12 +280,17 @@ class Setting:
         'use_cred' method to provide the necessary authentication information.
 
         """
+        self._use_access_token(use)
+
+    def _use_access_token(self, use: bool):
+        """Toggle the use of an access token in these settings, even inside
+        `TmdbClient.activate`; see `use_access_token`."""
         if self._check_cred_exist():
             cred = self.setting["credential"]
         else:
             raise Exception("Please setup the credential.")
         if use != self.setting["use_access_token"]:
-            if not cred.pass_check("access_token"):
+            if use and not cred.pass_check("access_token"):
                 tmdbapi.LOGGER.warning(
                     "access_token does not exist, use_access_token remain False."
                 )
@@ -165,6 +298,7 @@ class Setting:
                 self.setting["use_access_token"] = use
                 tmdbapi.LOGGER.info(f'Setting: "use_access_token": {use}.')
 
+    @_on_current
     def timeout(self, timeout: Optional[float | tuple] = None):
         """Set the HTTP request timeout for connecting and reading data.
 
@@ -206,6 +340,7 @@ class Setting:
         self.setting["timeout"] = timeout
         tmdbapi.LOGGER.info(f'Setting: "timeout": {timeout}.')
 
+    @_on_current
     def language(self, language: Optional[str]):
         """Set the default language for API requests.
 
@@ -234,6 +369,7 @@ class Setting:
         self.setting["default_language"] = language
         tmdbapi.LOGGER.info(f'Setting: "default_language": {language}.')
 
+    @_on_current
     def region(self, region: Optional[str]):
         """Set the default region for API requests.
 
@@ -261,6 +397,7 @@ class Setting:
         self.setting["default_region"] = region
         tmdbapi.LOGGER.info(f'Setting: "default_region": {region}.')
 
+    @_on_current
     def use_session(self, use: bool):
         """Toggle the use of session for HTTP requests.
 
@@ -273,21 +410,361 @@ class Setting:
         -----
         This method allows you to toggle the use of a session for HTTP requests. A session
         object helps in persisting certain parameters and cookies across multiple requests
-        made from the same session instance, leading to potential performance improvements
-        when making several requests to the same host.
+        made from the same session instance.
 
         If 'use' is set to True, a new session object will be created and used for subsequent
         requests. If 'use' is set to False, disabling the use of a session.
 
+        Connections are pooled and kept alive whether or not this is enabled, see `pool`.
+
         """
         if use != self.setting["use_session"]:
             if use:
-                tmdbapi._SESSION = requests.Session()
+                import requests
+
+                self._session = requests.Session()
             else:
-                tmdbapi._SESSION = None
+                self._session = None
+            if self is tmdbapi.setting:
+                tmdbapi._SESSION = self._session
             self.setting["use_session"] = use
             tmdbapi.LOGGER.info(f'Setting: "use_session": {use}.')
 
+    @_on_current
+    def pool(
+        self,
+        connections: Optional[int] = None,
+        maxsize: Optional[int] = None,
+        idle_timeout: Optional[float] = -1,
+    ):
+        """Configure the HTTP connection pool.
+
+        Parameters
+        ----------
+        connections : int, optional
+            The number of connection pools (one per host) to cache.
+        maxsize : int, optional
+            The maximum number of keep-alive connections per host. Set it to
+            at least the number of threads sending requests concurrently.
+        idle_timeout : float or None, optional
+            The seconds the pool may stay idle before its connections are
+            dropped and reopened. None to never recycle the pool.
+
+        Notes
+        -----
+        All API requests share one pooled, keep-alive transport, so the TCP and
+        TLS handshake is paid once per connection instead of once per request.
+        Parameters which are not given remain unchanged. The new pool takes effect
+        on the next request.
+
+        Example
+        -------
+        To keep up to 32 connections alive for a threaded crawler:
+        >>> setting.pool(maxsize=32)
+
+        """
+        if connections is not None:
+            self.setting["pool_connections"] = connections
+        if maxsize is not None:
+            self.setting["pool_maxsize"] = maxsize
+        if idle_timeout != -1:
+            self.setting["pool_idle_timeout"] = idle_timeout
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+        # Close the async pool with `await tmdbapi.aio.close()` before changing it.
+        self._async_transport = None
+        tmdbapi.LOGGER.info(
+            f'Setting: "pool_connections": {self.setting["pool_connections"]}, '
+            f'"pool_maxsize": {self.setting["pool_maxsize"]}, '
+            f'"pool_idle_timeout": {self.setting["pool_idle_timeout"]}.'
+        )
+
+    @_on_current
+    def rate_limit(self, limiter):
+        """Set the client-side rate limiter.
+
+        Parameters
+        ----------
+        limiter : tmdbapi.ratelimit.RateLimiter or None
+            The rate limiter shared by all requests. Pass None to disable
+            rate limiting (default).
+
+        Notes
+        -----
+        Every request waits for a token from the limiter before it is sent,
+        and an HTTP 429 response holds back the following requests for the
+        time given by its Retry-After header. Use
+        `tmdbapi.ratelimit.FileRateLimiter` to share one limit between the
+        processes on a host.
+
+        Example
+        -------
+        To send at most 40 requests per second:
+        >>> from tmdbapi.ratelimit import RateLimiter
+        >>> setting.rate_limit(RateLimiter(calls=40, period=1.0))
+
+        """
+        self.setting["rate_limit"] = limiter
+        tmdbapi.LOGGER.info(f'Setting: "rate_limit": {limiter}.')
+
+    @_on_current
+    def retry(self, retry: Optional[int | Retry] = None):
+        """Set the retry policy for transient failures.
+
+        Parameters
+        ----------
+        retry : int or tmdbapi.transport.Retry or None
+            The retry policy, or the maximum number of retries with the default
+            policy. Pass None or 0 to disable retries.
+
+        Notes
+        -----
+        By default, GET requests are retried up to 3 times on connection errors,
+        timeouts and HTTP 429, 502, 503 and 504, waiting for the Retry-After
+        header or a jittered exponential backoff. See `tmdbapi.transport.Retry`.
+
+        Use `override` to change the policy for some calls only.
+
+        Example
+        -------
+        To retry up to 5 times with a longer backoff:
+        >>> from tmdbapi.transport import Retry
+        >>> setting.retry(Retry(total=5, backoff_factor=1.0))
+
+        """
+        if retry is None:
+            retry = Retry(total=0)
+        elif isinstance(retry, int):
+            retry = Retry(total=retry)
+        self.setting["retry"] = retry
+        tmdbapi.LOGGER.info(f'Setting: "retry": {retry}.')
+
+    @_on_current
+    def cache(self, cache):
+        """Set the response cache.
+
+        Parameters
+        ----------
+        cache : tmdbapi.cache.MemoryCache or None
+            The response cache shared by all requests. Pass None to disable
+            caching (default).
+
+        Notes
+        -----
+        Successful GET responses are cached by method, URL and query
+        parameters (without the API key), for a time-to-live chosen per
+        endpoint. See `tmdbapi.cache.MemoryCache`.
+
+        Use `override(cache=None)` to bypass the cache for some calls.
+
+        Example
+        -------
+        To cache up to 10000 responses or 100 MB in memory:
+        >>> from tmdbapi.cache import MemoryCache
+        >>> setting.cache(MemoryCache(max_entries=10000, max_bytes=100_000_000))
+
+        """
+        self.setting["cache"] = cache
+        tmdbapi.LOGGER.info(f'Setting: "cache": {cache}.')
+
+    @_on_current
+    def coalesce(self, enable: bool = True):
+        """Enable or disable request coalescing.
+
+        When enabled, identical GET requests sent at the same time by
+        several threads or coroutines share one HTTP request, and each
+        caller decodes its own copy of the response. This prevents a burst
+        of cache misses for the same title from multiplying the outbound
+        requests.
+
+        Parameters
+        ----------
+        enable : bool, optional
+            Whether to coalesce identical concurrent GET requests,
+            by default True.
+
+        """
+        self.setting["coalesce"] = enable
+        tmdbapi.LOGGER.info(f'Setting: "coalesce": {enable}.')
+
+    @_on_current
+    def store(self, store):
+        """Set the local mirror store.
+
+        Parameters
+        ----------
+        store : tmdbapi.store.Store or None
+            The store which every movie, TV show, season, episode, person,
+            company and collection details response fetched from TMDB is
+            upserted into. Pass None to disable it (default).
+
+        Example
+        -------
+        >>> from tmdbapi.store import Store
+        >>> setting.store(Store("mirror.sqlite"))
+
+        """
+        self.setting["store"] = store
+        tmdbapi.LOGGER.info(f'Setting: "store": {store}.')
+
+    @_on_current
+    def json_decoder(self, decoder="auto"):
+        """Set the JSON decoder of the responses.
+
+        Parameters
+        ----------
+        decoder : str or callable, optional
+            "auto" (default) for the first installed of orjson, msgspec and
+            the standard library, or "orjson", "msgspec", "json", or a
+            function decoding the bytes of the body.
+
+        Notes
+        -----
+        orjson and msgspec decode the raw bytes several times faster than the
+        standard library. See `tmdbapi.decoding`.
+
+        Example
+        -------
+        >>> setting.json_decoder("orjson")
+
+        """
+        # fail now if the backend is not installed
+        get_decoder(decoder)
+        self.setting["json_decoder"] = decoder
+        tmdbapi.LOGGER.info(f'Setting: "json_decoder": {decoder}.')
+
+    @_on_current
+    def fields(self, fields=None):
+        """Set the paths of the responses to keep.
+
+        Parameters
+        ----------
+        fields : Iterable[str], optional
+            The paths, e.g. ["id", "title", "credits.cast[].id"], where "a.b"
+            is the key "b" of the object "a" and "a[].b" the key "b" of each
+            item of the list "a". None (default) keeps the whole responses.
+
+        Notes
+        -----
+        With msgspec installed, the other keys are skipped while decoding.
+        Use `override` to project some calls only; the paged iterators of
+        `tmdbapi.pages` need "page", "total_pages" and "results". See
+        `tmdbapi.decoding`.
+
+        Example
+        -------
+        >>> with setting.override(fields=["id", "title", "release_date"]):
+        ...     movie = api3.movies.details(550)
+
+        """
+        if fields is not None:
+            # fail now if a path is invalid
+            get_projection(fields)
+        self.setting["fields"] = fields
+        tmdbapi.LOGGER.info(f'Setting: "fields": {fields}.')
+
+    @_on_current
+    def stream(self, path: Optional[str] = None):
+        """Set the list of the responses to stream.
+
+        Parameters
+        ----------
+        path : str, optional
+            The keys to a list of the responses, separated by ".", e.g.
+            "cast" or "images.posters". The GET requests then return an
+            iterator over its items, parsed while the body arrives. None
+            (default) returns the whole responses.
+
+        Notes
+        -----
+        The streamed requests are not cached, coalesced nor stored. The
+        requests of the package itself, e.g. the lookup of the account ID,
+        are never streamed. Use `override` to stream some calls only. See
+        `tmdbapi.streaming`.
+
+        Example
+        -------
+        >>> with setting.override(stream="cast"):
+        ...     cast = api3.tv_series.aggregate_credits(1399)
+        >>> for member in cast:
+        ...     print(member["name"])
+
+        """
+        self.setting["stream"] = path
+        tmdbapi.LOGGER.info(f'Setting: "stream": {path}.')
+
+    @contextlib.contextmanager
+    def override(self, **kwargs):
+        """Override settings for the requests made inside the block.
+
+        The overrides only apply to the current thread or asyncio task, so
+        they can be used to change a setting for a single call.
+
+        Parameters
+        ----------
+        **kwargs : keyword arguments
+            Key-value pairs of the settings to override.
+
+        Example
+        -------
+        To fail fast without retrying:
+        >>> with setting.override(retry=Retry(total=0), timeout=3):
+        ...     api3.movies.details(550)
+
+        """
+        if not set(kwargs.keys()).issubset(self.setting.keys()):
+            raise KeyError(
+                "The setting you have provided is not among the available options."
+            )
+        setting = self.current()
+        override = {**(setting._override.get(None) or {}), **kwargs}
+        token = setting._override.set(override)
+        try:
+            yield setting
+        finally:
+            setting._override.reset(token)
+
+    def get_transport(self):
+        """Get the pooled transport, creating it on first use.
+
+        Returns
+        -------
+        tmdbapi.transport.Transport
+        """
+        if self.current() is not self:
+            return self.current().get_transport()
+        if self._transport is None:
+            from tmdbapi.transport import Transport
+
+            self._transport = Transport(
+                pool_connections=self.setting["pool_connections"],
+                pool_maxsize=self.setting["pool_maxsize"],
+                idle_timeout=self.setting["pool_idle_timeout"],
+            )
+        return self._transport
+
+    def get_async_transport(self):
+        """Get the pooled asyncio transport, creating it on first use.
+
+        Requires the optional dependency aiohttp.
+
+        Returns
+        -------
+        tmdbapi.aio.transport.AsyncTransport
+        """
+        if self.current() is not self:
+            return self.current().get_async_transport()
+        if self._async_transport is None:
+            from tmdbapi.aio.transport import AsyncTransport
+
+            self._async_transport = AsyncTransport(
+                pool_connections=self.setting["pool_connections"],
+                pool_maxsize=self.setting["pool_maxsize"],
+                idle_timeout=self.setting["pool_idle_timeout"],
+            )
+        return self._async_transport
+
     def log(self, directory: Optional[str]):
         """Enable or disable logging to a specified directory.
 
@@ -329,13 +806,15 @@ class Setting:
                 )
             self.setting["log_file"] = directory
 
+    @_on_current
     def use_cred(self, credential):
         """Set user credentials in the settings.
 
         Parameters
         ----------
-        credential : tmdbapi.creds.Credential
-            A object containing user credentials for the TMDB API.
+        credential : tmdbapi.creds.Credential or tmdbapi.creds.CredentialPool
+            A object containing user credentials for the TMDB API, or a pool
+            of the credentials of several applications.
 
         Notes
         -----
@@ -355,18 +834,319 @@ class Setting:
 
         """
         self.setting["credential"] = credential
+        if isinstance(credential, CredentialPool):
+            credential = credential.credentials[0]
+        if credential is not None:
+            # `Credential.set` updates "use_access_token" of these settings
+            credential._settings[id(self)] = self
         tmdbapi.LOGGER.info(
             "Setting: Your credentials have been successfully set in the settings."
         )
 
 
+class Endpoint:
+    """An immutable, compiled service of an information dictionary.
+
+    The API modules compile their services once at import with
+    `compile_endpoints`, so a call only fills the pre-split URL template and
+    builds its `Request`, e.g.
+
+    >>> _ENDPOINTS = compile_endpoints(_MOVIES_V3, 3, "/movie")
+    >>> _ENDPOINTS["movie-details"].request({"movie_id": 550})
+
+    Attributes
+    ----------
+    name : str
+        The key of the service in the information dictionary.
+    method : str
+        The uppercase request method.
+    url : str
+        The relative URL template, e.g. "/{movie_id}/credits".
+    params : frozenset
+        The names of the valid parameters.
+    template : str
+        The absolute URL template, e.g.
+        "https://api.themoviedb.org/3/movie/{movie_id}/credits".
+    access_token : bool
+        Whether the requests always authenticate with the access token, as
+        the API version 4 does.
+
+    """
+
+    __slots__ = (
+        "name",
+        "method",
+        "url",
+        "params",
+        "template",
+        "access_token",
+        "_head",
+        "_tail",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        info: dict,
+        version: int = 3,
+        category_path: str = "",
+        access_token: bool = False,
+        api_base: str = API_BASE,
+    ):
+        template = f"{api_base}/{version}{category_path}{info['url']}"
+        # "/{movie_id}/credits" -> "/", (("movie_id", "/credits"),)
+        parts = list(string.Formatter().parse(template))
+        init = functools.partial(object.__setattr__, self)
+        init("name", name)
+        init("method", info["method"].upper())
+        init("url", info["url"])
+        init("params", frozenset(p["name"] for p in info["params"]))
+        init("template", template)
+        init("access_token", access_token)
+        init("_head", parts[0][0])
+        init(
+            "_tail",
+            tuple(
+                (field, parts[i + 1][0] if i + 1 < len(parts) else "")
+                for i, (_, field, _, _) in enumerate(parts)
+                if field is not None
+            ),
+        )
+
+    def __setattr__(self, name, value):
+        raise AttributeError('"Endpoint" object is immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError('"Endpoint" object is immutable')
+
+    def __repr__(self):
+        return f"Endpoint({self.method} {self.template!r}, name={self.name!r})"
+
+    def build_url(self, path: dict = None) -> str:
+        """Fill the URL template.
+
+        Parameters
+        ----------
+        path : dict, optional
+            The values of the path arguments, e.g. {"movie_id": 550}.
+
+        Returns
+        -------
+        str
+            The URL without query parameters.
+        """
+        url = self._head
+        for field, literal in self._tail:
+            url += f"{path[field]}{literal}"
+        return url
+
+    def prepare(
+        self, path: dict = None, query: dict = None, json: dict = None
+    ) -> "Request":
+        """Build the request without sending it.
+
+        Parameters
+        ----------
+        path : dict, optional
+            The values of the path arguments.
+        query : dict, optional
+            The query parameters. The None values are dropped and the
+            booleans are sent as "true" or "false".
+        json : dict, optional
+            The JSON payload.
+
+        Returns
+        -------
+        Request
+        """
+        credential = tmdbapi.setting["credential"]
+        if credential is None:
+            raise Exception("No credential given.")
+        if query:
+            params = {
+                key: _BOOLEANS[value] if value.__class__ is bool else value
+                for key, value in query.items()
+                if value is not None
+            }
+        else:
+            params = {}
+        headers = Tmdb.headers.copy()
+        if self.access_token:
+            if not credential.pass_check("access_token"):
+                tmdbapi.LOGGER.error("No access_token.")
+                raise Exception("No access_token.")
+            headers["Authorization"] = f"Bearer {credential['access_token']}"
+        else:
+            api_auth(credential, headers, params)
+        if json is not None:
+            headers["content-type"] = "application/json"
+        return Request(
+            self.name, self.method, self.build_url(path), params, headers, None, json
+        )
+
+    def request(self, path: dict = None, query: dict = None, json: dict = None):
+        """Send the request, see `prepare` and `send`.
+
+        Returns
+        -------
+        dict
+            A JSON-formatted response, or the `Request` in `prepare_only`.
+        """
+        return send(self.prepare(path, query, json))
+
+
+def compile_endpoints(
+    info_var: dict,
+    version: int = 3,
+    category_path: str = "",
+    access_token: bool = False,
+    api_base: str = API_BASE,
+) -> dict:
+    """Compile the services of an information dictionary.
+
+    The result is cached, so each dictionary is compiled once per category.
+
+    Parameters
+    ----------
+    info_var : dict
+        The information dictionary, e.g. `api3.movies._MOVIES_V3`.
+    version : int, optional
+        The API version (3 or 4), by default 3.
+    category_path : str, optional
+        The relative path of the category, e.g. "/movie".
+    access_token : bool, optional
+        Whether the requests always authenticate with the access token, by
+        default False.
+    api_base : str, optional
+        The API base, by default "https://api.themoviedb.org".
+
+    Returns
+    -------
+    dict
+        {name: Endpoint}
+    """
+    key = (id(info_var), version, category_path, access_token, api_base)
+    endpoints = _ENDPOINTS.get(key)
+    if endpoints is None or endpoints[0] is not info_var:
+        endpoints = (
+            info_var,
+            {
+                name: Endpoint(
+                    name, info, version, category_path, access_token, api_base
+                )
+                for name, info in info_var.items()
+            },
+        )
+        _ENDPOINTS[key] = endpoints
+    return endpoints[1]
+
+
+def api_auth(credential, headers: dict, params: dict) -> tuple[dict, dict]:
+    """Authenticate a request with the API key or the access token, as the
+    "use_access_token" setting says.
+
+    Parameters
+    ----------
+    credential : tmdbapi.Credential or tmdbapi.CredentialPool
+        The credential.
+    headers : dict
+        The headers, updated.
+    params : dict
+        The query parameters, updated.
+
+    Returns
+    -------
+    tuple[dict, dict]
+        (headers, params)
+    """
+    if tmdbapi.setting["use_access_token"]:
+        token = credential["access_token"]
+        headers["Authorization"] = f"Bearer {token}"
+    else:
+        if credential.pass_check("api_key"):
+            params["api_key"] = credential["api_key"]
+        else:
+            tmdbapi.LOGGER.error("No API key provided. Please set the API key.")
+            raise Exception("No API key provided. Please set the API key.")
+    return headers, params
+
+
+def default_language(language: str = None) -> Optional[str]:
+    """Get the language of a request, by default the "default_language"
+    setting.
+
+    Parameters
+    ----------
+    language : str, optional
+        Format: `language-COUNTRY`, e.g. 'zh-TW', 'en-US'.
+        See: https://developer.themoviedb.org/docs/languages
+
+    Returns
+    -------
+    str or None
+    """
+    if language is not None:
+        return language
+    return tmdbapi.setting["default_language"]
+
+
+def default_region(region: str = None) -> Optional[str]:
+    """Get the region of a request, by default the "default_region" setting.
+
+    Parameters
+    ----------
+    region : str, optional
+        Format: ISO 3166-1
+
+    Returns
+    -------
+    str or None
+    """
+    if region is not None:
+        return region
+    return tmdbapi.setting["default_region"]
+
+
+def session_query(guest_session_id: str = None) -> dict:
+    """Get the query parameters of the session of a request.
+
+    The guest session if given. Otherwise, no session if the access token is
+    used, or the session ID of the credential, which is created if there is
+    neither a session ID nor an access token.
+
+    Parameters
+    ----------
+    guest_session_id : str, optional
+        The guest session ID.
+
+    Returns
+    -------
+    dict
+        The query parameters.
+    """
+    if guest_session_id is not None:
+        return {"guest_session_id": guest_session_id}
+    if tmdbapi.setting["use_access_token"]:
+        return {}
+    credential = tmdbapi.setting["credential"]
+    if credential.pass_check("session_id"):
+        return {"session_id": credential["session_id"]}
+    if credential.pass_check("access_token"):
+        tmdbapi.setting.use_access_token(True)
+        return {}
+    tmdbapi.LOGGER.info("No session_id, creating a session_id.")
+    with internal_request():
+        tmdbapi.integration.auth.create_session_id()
+    return {"session_id": credential["session_id"]}
+
+
 class Tmdb:
     """The Tmdb class provides a Python interface for making requests to the TMDb (The Movie Database) API."""
 
     headers = {
         "accept": "application/json",
     }
-    api_base = "https://api.themoviedb.org"
+    api_base = API_BASE
 
     def __init__(self):
         self.category_path = ""  # Relative path for each category.
@@ -377,10 +1157,11 @@ class Tmdb:
         self._json: dict = None  # Json payload.
         self._query = {}  # Query(parameters) for url.
         self._path_args = {}  # The values to replace the anchor in url.
-        if tmdbapi.setting["credential"] is None:
+        self._name: str = ""  # The key of the service in the information dictionary.
+        self._endpoint: Endpoint = None  # The compiled service.
+        self._cred = tmdbapi.setting["credential"]
+        if self._cred is None:
             raise Exception("No credential given.")
-        else:
-            self._cred = tmdbapi.setting["credential"]
 
     def _api_auth(self, headers: dict, params: dict) -> tuple[dict, dict]:
         """Set the headers and query parameters based on the 'use_access_token' setting.
@@ -398,16 +1179,7 @@ class Tmdb:
             (headers, query)
             A tuple containing the updated headers and query parameters.
         """
-        if tmdbapi.setting["use_access_token"]:
-            token = self._cred["access_token"]
-            headers["Authorization"] = f"Bearer {token}"
-        else:
-            if self._cred.pass_check("api_key"):
-                params["api_key"] = self._cred["api_key"]
-            else:
-                tmdbapi.LOGGER.error("No API key provided. Please set the API key.")
-                raise Exception("No API key provided. Please set the API key.")
-        return headers, params
+        return api_auth(self._cred, headers, params)
 
     def check_token(self) -> Optional[dict]:
         """Check if the application is currently using an access_token or api_key.
@@ -419,22 +1191,7 @@ class Tmdb:
         dict
             A dictionary with query parameters.
         """
-        # Check if session_id exists. If it doesn't, force the use of
-        # access_token. If both session_id and access_token don't exist
-        # , then create session_id.
-        if tmdbapi.setting["use_access_token"]:
-            return {}
-        else:
-            if self._cred.pass_check("session_id"):
-                return {"session_id": self._cred["session_id"]}
-            else:
-                if self._cred.pass_check("access_token"):
-                    tmdbapi.settings(use_access_token=True)
-                    return self.check_token()
-                else:
-                    tmdbapi.LOGGER.info("No session_id, creating a session_id.")
-                    tmdbapi.integration.auth.create_session_id()
-                    return {"session_id": self._cred["session_id"]}
+        return session_query()
 
     def choose_session_id(self, guest_session_id: str):
         """Choose a session_id based on the provided 'guest_session_id' or use the default 'session_id'.
@@ -444,10 +1201,7 @@ class Tmdb:
         guest_session_id : str
             The guest session ID.
         """
-        if guest_session_id is None:
-            self._query.update(self.check_token())
-        else:
-            self._query.update(guest_session_id=guest_session_id)
+        self._query.update(session_query(guest_session_id))
 
     def use(self, name: str):
         """Select a service from the information dictionary.
@@ -457,8 +1211,10 @@ class Tmdb:
         name : str
             The key in the information dictionary.
         """
-        self._ref = self.info_var[name]["url"]
-        self._method = self.info_var[name]["method"]
+        endpoint = compile_endpoints(self.info_var)[name]
+        self._endpoint = endpoint
+        self._ref = endpoint.url
+        self._method = endpoint.method
         self._name = name
 
     def load_query(self, query={}, **kwargs):
@@ -509,9 +1265,10 @@ class Tmdb:
         str
             The URL without query parameters.
         """
-        ref = f"{self.category_path}{self._ref}"
-        ref = ref.format(**self._path_args)
-        return f"{self.api_base}/{version}{ref}"
+        endpoints = compile_endpoints(
+            self.info_var, version, self.category_path, api_base=self.api_base
+        )
+        return endpoints[self._name].build_url(self._path_args)
 
     def sortby(self, asc: bool):
         """Update the query by specifying ascending or descending sorting order.
@@ -540,13 +1297,9 @@ class Tmdb:
             Example: 'zh-TW', 'en-US'.
             See: https://developer.themoviedb.org/docs/languages
         """
+        lang = default_language(lang)
         if lang is not None:
-            s = {"language": lang}
-        elif tmdbapi.setting["default_language"] is not None:
-            s = {"language": tmdbapi.setting["default_language"]}
-        else:
-            s = {}
-        self._query.update(s)
+            self._query.update(language=lang)
 
     def region(self, region: str = None):
         """Update the region parameter in the query.
@@ -556,18 +1309,15 @@ class Tmdb:
         region : str, optional
             Format: ISO 3166-1
         """
+        region = default_region(region)
         if region is not None:
-            s = {"region": region}
-        elif tmdbapi.setting["default_language"] is not None:
-            s = {"region": tmdbapi.setting["default_region"]}
-        else:
-            s = {}
-        self._query.update(s)
+            self._query.update(region=region)
 
     def reset(self):
         """Reset all content in instance variables."""
         self._ref = None
         self._method = None
+        self._endpoint = None
         self._json = None
         self._query = {}
         self._path_args = {}
@@ -587,20 +1337,17 @@ class Tmdb:
         bool
             Return True if pass the check; otherwise, return False.
         """
-        params_name = []
-        for p in self.info_var[self._name]["params"]:
-            params_name.append(p["name"])
-        return set(params.keys()).issubset(set(params_name))
+        return self._endpoint.params.issuperset(params)
 
-    def request_raw(
+    def prepare_request(
         self,
         url: str,
         method: str = None,
         params: dict = None,
         data=None,
         json: dict = None,
-    ) -> dict:
-        """Send a request and handle the response.
+    ) -> "Request":
+        """Build the request without sending it.
 
         Parameters
         ----------
@@ -617,13 +1364,8 @@ class Tmdb:
 
         Returns
         -------
-        dict
-             A JSON-formatted response.
-
-        Raises
-        ------
-        TmdbApiException
-            If the action is not successful.
+        Request
+            The prepared request.
         """
         # set method, query(params), headers, json payload
         if method is None:
@@ -633,58 +1375,376 @@ class Tmdb:
         if params is None:
             params = self._query
         params = {
-            k: str(v).lower() if isinstance(v, bool) else v for k, v in params.items()
+            k: str(v).lower() if isinstance(v, bool) else v
+            for k, v in params.items()
+            if v is not None
         }
         if json is None:
             json = self._json
         headers, params = self._api_auth(headers=self.headers.copy(), params=params)
         if json is not None:
             headers["content-type"] = "application/json"
+        return Request(self._name, method, url, params, headers, data, json)
 
-        # debug info #
-        tmdbapi.LOGGER.debug(f"Json payload: {json}")
-        tmdbapi.LOGGER.debug(f"Headers: {headers}")
+    def request_raw(
+        self,
+        url: str,
+        method: str = None,
+        params: dict = None,
+        data=None,
+        json: dict = None,
+    ) -> dict:
+        """Send a request and handle the response.
+
+        Parameters
+        ----------
+        url : str
+            The URL without query parameters.
+        method : str, optional
+            The request method, default is None.
+        params : dict, optional
+            The query parameters, default is None.
+        data : _type_, optional
+            The payload data, default is None.
+        json : dict, optional
+            The JSON payload, default is None.
+
+        Returns
+        -------
+        dict
+             A JSON-formatted response, or an iterator over the items of a
+             list of it if the "stream" setting is set, see `Setting.stream`.
+
+        Raises
+        ------
+        TmdbApiException
+            If the action is not successful.
+        """
+        return send(self.prepare_request(url, method, params, data, json))
 
-        # send request to tmdb api
-        if tmdbapi.setting["use_session"]:
-            request = tmdbapi._SESSION
-        else:
-            request = requests
 
+class Request:
+    """A request prepared by `Tmdb.prepare_request`.
+
+    Attributes
+    ----------
+    endpoint : str
+        The name of the endpoint in the information dictionary,
+        e.g. "movie-details".
+    method : str
+        The request method.
+    url : str
+        The URL without query parameters.
+    params : dict
+        The query parameters, including the API key if used.
+    headers : dict
+        The request headers.
+    data :
+        The payload data.
+    json : dict
+        The JSON payload.
+
+    """
+
+    __slots__ = ("endpoint", "method", "url", "params", "headers", "data", "json")
+
+    def __init__(self, endpoint, method, url, params, headers, data=None, json=None):
+        self.endpoint = endpoint
+        self.method = method
+        self.url = url
+        self.params = params
+        self.headers = headers
+        self.data = data
+        self.json = json
+
+    def __repr__(self):
+        return f"Request({self.endpoint!r}, {self.method}: {self.url})"
+
+    def kwargs(self) -> dict:
+        """The keyword arguments for `requests.request`."""
+        return {
+            "method": self.method,
+            "url": self.url,
+            "params": self.params,
+            "headers": self.headers,
+            "data": self.data,
+            "json": self.json,
+        }
+
+
+def send(request: "Request"):
+    """Send a request and handle the response.
+
+    Parameters
+    ----------
+    request : Request
+        The prepared request.
+
+    Returns
+    -------
+    dict
+         A JSON-formatted response, an iterator over the items of a list of
+         it if the "stream" setting is set (see `Setting.stream`), or the
+         request itself in `prepare_only`.
+
+    Raises
+    ------
+    TmdbApiException
+        If the action is not successful.
+    """
+    if _PREPARE_ONLY.get():
+        # the caller (e.g. tmdbapi.aio) sends the request itself.
+        return request
+
+    # debug info #
+    tmdbapi.LOGGER.debug(f"Json payload: {request.json}")
+    tmdbapi.LOGGER.debug(f"Headers: {request.headers}")
+
+    stream = tmdbapi.setting["stream"]
+    if stream is not None and request.method == "GET":
+        return _stream(request, stream)
+
+    if tmdbapi.setting["coalesce"] and request.method == "GET":
+        # the clients do not share their requests in flight
+        headers, content = tmdbapi.setting.current()._single_flight.do(
+            flight_key(request), lambda: _fetch(request)
+        )
+    else:
+        headers, content = _fetch(request)
+    return handle_response(headers, content)
+
+
+def _stream(request: "Request", path: str):
+    """Send the request and iterate over the items of a list of the body.
+
+    Parameters
+    ----------
+    request : Request
+        The prepared request.
+    path : str
+        The keys to the list, e.g. "credits.cast".
+
+    Returns
+    -------
+    Iterator
+        The items, parsed while the body arrives.
+
+    Raises
+    ------
+    TmdbApiException
+        If the action is not successful.
+    """
+    response = _send(request, stream=True)
+    if response.status_code >= 400:
+        handle_response(response.headers, response.content)
+        raise TmdbApiException(f"status_code: {response.status_code}")
+
+    def items():
+        with response:
+            yield from iter_items(response.iter_content(65536), path)
+
+    return items()
+
+
+def _fetch(request: "Request") -> tuple:
+    """Get the response from the cache or from TMDB.
+
+    Parameters
+    ----------
+    request : Request
+        The prepared request.
+
+    Returns
+    -------
+    tuple
+        (headers, content): the response headers and body.
+    """
+    cache = tmdbapi.setting["cache"]
+    entry = None
+    if cache is not None:
+        entry = cache.lookup(request)
+        if entry is not None:
+            if entry.is_fresh():
+                tmdbapi.LOGGER.info(f"cache hit, {request.method}: {request.url}")
+                return entry.headers, entry.content
+            # revalidate the stale entry
+            request.headers = {**request.headers, **entry.validators}
+
+    response = _send(request)
+    store = tmdbapi.setting["store"]
+    if store is not None and response.status_code == 200:
+        store.save(request, response.content)
+    if cache is not None:
+        entry = cache.store(request, response, entry)
+        if response.status_code == 304 and entry is not None:
+            return entry.headers, entry.content
+    return response.headers, response.content
+
+
+def _send(request: "Request", stream: bool = False):
+    """Send the request to TMDB with rate limiting and retries.
+
+    Parameters
+    ----------
+    request : Request
+        The prepared request.
+    stream : bool, optional
+        Whether to leave the body to be read from the response, by
+        default False.
+
+    Returns
+    -------
+    requests.Response
+    """
+    import requests
+
+    setting = tmdbapi.setting.current()
+    if setting["use_session"]:
+        session = setting._session
+    else:
+        session = setting.get_transport()
+
+    limiter = tmdbapi.setting["rate_limit"]
+    retry = tmdbapi.setting["retry"]
+    pool = tmdbapi.setting["credential"]
+    if not isinstance(pool, CredentialPool):
+        pool = None
+    method = request.method
+    attempt = 0
+    while True:
+        if limiter is not None:
+            limiter.acquire()
+        kwargs = request.kwargs()
+        credential = None
+        if pool is not None:
+            credential = pool.acquire()
+            kwargs["headers"], kwargs["params"] = pool.authorize(
+                credential, kwargs["headers"], kwargs["params"]
+            )
         try:
-            response = request.request(
-                method,
-                url,
-                data=data,
-                json=json,
-                params=params,
-                headers=headers,
+            response = session.request(
+                **kwargs,
                 timeout=tmdbapi.setting["timeout"],
+                stream=stream,
             )
+        except (requests.ConnectionError, requests.Timeout) as err:
+            if credential is not None:
+                pool.release(credential)
+            if retry.is_retry(method, attempt):
+                wait = retry.get_backoff(attempt)
+                tmdbapi.LOGGER.warning(
+                    f"{type(err).__name__}: {err}, retry in {wait:.2f}s."
+                )
+                time.sleep(wait)
+                attempt += 1
+                continue
+            tmdbapi.LOGGER.error(f"{type(err).__module__}.{type(err).__name__}: {err}")
+            raise err
         except Exception as err:
+            if credential is not None:
+                pool.release(credential)
             tmdbapi.LOGGER.error(f"{type(err).__module__}.{type(err).__name__}: {err}")
             raise err
 
-        headers = response.headers
-        header_status_code = response.status_code
         tmdbapi.LOGGER.info(
-            f"status_code: {header_status_code}, {method}: {response.url}"
+            f"status_code: {response.status_code}, {method}: {response.url}"
         )
-        # handle response
-        has_content = headers.get("content-length", "1") != "0"
-        if has_content:
-            if headers.get("Content-Type", "").startswith("application/json"):
-                content = response.json()
+        if credential is not None:
+            pool.release(
+                credential, response.status_code, retry_after(response.headers)
+            )
+        elif response.status_code == 429 and limiter is not None:
+            limiter.penalize(retry_after(response.headers) or 1.0)
+        if retry.is_retry(method, attempt, response.status_code):
+            if pool is not None and response.status_code == 429:
+                # the next attempt waits for a credential not throttled
+                wait = 0.0
             else:
-                content = response.text
-                TmdbApiException("The content is not json. Content:", content)
+                wait = retry.get_backoff(attempt, response.headers)
+            tmdbapi.LOGGER.warning(
+                f"status_code: {response.status_code}, retry in {wait:.2f}s."
+            )
+            if stream:
+                response.close()  # release the connection
+            time.sleep(wait)
+            attempt += 1
+            continue
+        return response
+
+
+def handle_response(headers, content: bytes):
+    """Decode the response body and check whether the action is successful.
+
+    Parameters
+    ----------
+    headers : Mapping
+        The case-insensitive response headers.
+    content : bytes
+        The raw response body.
+
+    Returns
+    -------
+    dict or str or None
+        The decoded JSON, the text if the content is not JSON, or None if
+        there is no content.
+
+    Raises
+    ------
+    TmdbApiException
+        If the action is not successful.
+    """
+    has_content = headers.get("content-length", "1") != "0" and content != b""
+    if has_content:
+        if headers.get("Content-Type", "").startswith("application/json"):
+            decoder = tmdbapi.setting["json_decoder"]
+            fields = tmdbapi.setting["fields"]
+            if fields is None:
+                content = get_decoder(decoder)(content)
+            else:
+                content = get_projection(fields).decode(content, decoder)
         else:
-            TmdbApiException("No content.")
-        if isinstance(content, dict):
-            is_success = content.get("success", None)
-            if is_success is not None and is_success == False:
-                raise TmdbApiException(content["status_message"])
-        return content
+            content = content.decode("utf-8", errors="replace")
+            TmdbApiException("The content is not json. Content:", content)
+    else:
+        content = None
+        TmdbApiException("No content.")
+    if isinstance(content, dict):
+        is_success = content.get("success", None)
+        if is_success is not None and is_success == False:
+            raise TmdbApiException(content["status_message"])
+    return content
+
+
+@contextlib.contextmanager
+def prepare_only(enable: bool = True):
+    """Make `Tmdb.request_raw` return the prepared request instead of sending it.
+
+    The API functions build and validate their request as usual, but the
+    return value is the `Request` from `Tmdb.prepare_request`. This lets
+    other transports (such as `tmdbapi.aio`) reuse every API function.
+
+    Parameters
+    ----------
+    enable : bool, optional
+        False to send requests normally inside an enabled block, by default True.
+    """
+    token = _PREPARE_ONLY.set(enable)
+    try:
+        yield
+    finally:
+        _PREPARE_ONLY.reset(token)
+
+
+@contextlib.contextmanager
+def internal_request():
+    """Send the requests of the package itself made inside the block.
+
+    Such requests, e.g. the lookup of the account ID, are sent even in a
+    `prepare_only` block, and return the whole response whatever the
+    "stream" and "fields" settings of the caller.
+    """
+    with prepare_only(False), tmdbapi.setting.override(stream=None, fields=None):
+        yield
 
 
 def query_yes_no(question: str, default="yes"):
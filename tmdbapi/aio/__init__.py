@@ -0,0 +1,29 @@
+"""Asyncio TMDB API
+
+Coroutine versions of every `api3` and `api4` function. All coroutines
+share one pooled asyncio transport, configured by `tmdbapi.setting.pool`.
+Requires the optional dependency aiohttp.
+
+    >>> import asyncio
+    >>> from tmdbapi import aio
+    >>> async def main():
+    ...     movies = await asyncio.gather(
+    ...         *(aio.api3.movies.details(i) for i in (550, 551, 552))
+    ...     )
+    ...     await aio.close()
+    ...     return movies
+    >>> asyncio.run(main())
+
+"""
+
+import tmdbapi
+
+from . import api3, api4
+from ._core import call
+
+__all__ = ["api3", "api4", "call", "close"]
+
+
+async def close():
+    """Close the pooled asyncio connections of every event loop."""
+    await tmdbapi.setting.get_async_transport().close()
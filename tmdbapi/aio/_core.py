@@ -0,0 +1,200 @@
+"""The Core of the Asyncio TMDB API
+
+The coroutines are generated from the synchronous API functions. Each API
+function builds its request from the endpoint table of its module (e.g.
+`_MOVIES_V3`) in prepare-only mode, and the request is then sent through
+the shared asyncio transport.
+"""
+
+import asyncio
+import functools
+import inspect
+import sys
+import types
+
+import tmdbapi
+from tmdbapi._core import handle_response, prepare_only
+from tmdbapi.creds import CredentialPool
+from tmdbapi.transport import flight_key, retry_after
+
+
+async def call(func, *args, **kwargs):
+    """Call a synchronous API function asynchronously.
+
+    Parameters
+    ----------
+    func : callable
+        An API function, e.g. `tmdbapi.api3.movies.details`.
+    *args, **kwargs
+        The arguments of the API function.
+
+    Returns
+    -------
+    dict
+        A JSON-formatted response.
+    """
+    with prepare_only():
+        request = func(*args, **kwargs)
+    tmdbapi.LOGGER.debug(f"Json payload: {request.json}")
+    tmdbapi.LOGGER.debug(f"Headers: {request.headers}")
+
+    if tmdbapi.setting["coalesce"] and request.method == "GET":
+        # the clients do not share their requests in flight
+        headers, content = await tmdbapi.setting.current()._async_single_flight.do(
+            flight_key(request), lambda: fetch(request)
+        )
+    else:
+        headers, content = await fetch(request)
+    return handle_response(headers, content)
+
+
+async def fetch(request) -> tuple:
+    """Get the response from the cache or from TMDB.
+
+    Parameters
+    ----------
+    request : tmdbapi._core.Request
+        The prepared request.
+
+    Returns
+    -------
+    tuple
+        (headers, content): the response headers and body.
+    """
+    cache = tmdbapi.setting["cache"]
+    entry = None
+    if cache is not None:
+        entry = cache.lookup(request)
+        if entry is not None:
+            if entry.is_fresh():
+                tmdbapi.LOGGER.info(f"cache hit, {request.method}: {request.url}")
+                return entry.headers, entry.content
+            # revalidate the stale entry
+            request.headers = {**request.headers, **entry.validators}
+
+    response = await send(request)
+    store = tmdbapi.setting["store"]
+    if store is not None and response.status_code == 200:
+        store.save(request, response.content)
+    if cache is not None:
+        entry = cache.store(request, response, entry)
+        if response.status_code == 304 and entry is not None:
+            return entry.headers, entry.content
+    return response.headers, response.content
+
+
+async def send(request):
+    """Send the request to TMDB with rate limiting and retries.
+
+    Parameters
+    ----------
+    request : tmdbapi._core.Request
+        The prepared request.
+
+    Returns
+    -------
+    tmdbapi.aio.transport.AsyncResponse
+    """
+    transport = tmdbapi.setting.get_async_transport()
+    limiter = tmdbapi.setting["rate_limit"]
+    retry = tmdbapi.setting["retry"]
+    pool = tmdbapi.setting["credential"]
+    if not isinstance(pool, CredentialPool):
+        pool = None
+    method = request.method
+    attempt = 0
+    while True:
+        if limiter is not None:
+            wait = limiter.reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+        kwargs = request.kwargs()
+        credential = None
+        if pool is not None:
+            credential, wait = pool.reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            kwargs["headers"], kwargs["params"] = pool.authorize(
+                credential, kwargs["headers"], kwargs["params"]
+            )
+        try:
+            response = await transport.request(
+                **kwargs, timeout=tmdbapi.setting["timeout"]
+            )
+        except transport.retry_exceptions as err:
+            if credential is not None:
+                pool.release(credential)
+            if retry.is_retry(method, attempt):
+                wait = retry.get_backoff(attempt)
+                tmdbapi.LOGGER.warning(
+                    f"{type(err).__name__}: {err}, retry in {wait:.2f}s."
+                )
+                await asyncio.sleep(wait)
+                attempt += 1
+                continue
+            tmdbapi.LOGGER.error(f"{type(err).__module__}.{type(err).__name__}: {err}")
+            raise err
+        except Exception as err:
+            if credential is not None:
+                pool.release(credential)
+            tmdbapi.LOGGER.error(f"{type(err).__module__}.{type(err).__name__}: {err}")
+            raise err
+        tmdbapi.LOGGER.info(
+            f"status_code: {response.status_code}, {method}: {response.url}"
+        )
+        if credential is not None:
+            pool.release(
+                credential, response.status_code, retry_after(response.headers)
+            )
+        elif response.status_code == 429 and limiter is not None:
+            limiter.penalize(retry_after(response.headers) or 1.0)
+        if retry.is_retry(method, attempt, response.status_code):
+            if pool is not None and response.status_code == 429:
+                # the next attempt waits for a credential not throttled
+                wait = 0.0
+            else:
+                wait = retry.get_backoff(attempt, response.headers)
+            tmdbapi.LOGGER.warning(
+                f"status_code: {response.status_code}, retry in {wait:.2f}s."
+            )
+            await asyncio.sleep(wait)
+            attempt += 1
+            continue
+        return response
+
+
+def coroutine(func):
+    """Wrap an API function as a coroutine function."""
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await call(func, *args, **kwargs)
+
+    return wrapper
+
+
+def mirror(name: str, module: types.ModuleType) -> types.ModuleType:
+    """Create a module with the coroutine versions of the API functions.
+
+    Parameters
+    ----------
+    name : str
+        The name of the new module, e.g. "tmdbapi.aio.api3.movies".
+    module : types.ModuleType
+        The synchronous API module, e.g. `tmdbapi.api3.movies`.
+
+    Returns
+    -------
+    types.ModuleType
+        The module, also registered in `sys.modules`.
+    """
+    aio_module = types.ModuleType(name, f"Coroutine version of `{module.__name__}`.")
+    functions = []
+    for func_name, func in inspect.getmembers(module, inspect.isfunction):
+        if func_name.startswith("_") or func.__module__ != module.__name__:
+            continue
+        setattr(aio_module, func_name, coroutine(func))
+        functions.append(func_name)
+    aio_module.__all__ = functions
+    sys.modules[name] = aio_module
+    return aio_module
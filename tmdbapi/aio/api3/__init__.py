@@ -0,0 +1,42 @@
+"""Coroutine version of the TMDB APIs version 3.
+"""
+
+import functools as _functools
+
+import tmdbapi as _tmdbapi
+from tmdbapi import api3 as _api3
+from tmdbapi._core import internal_request as _internal_request
+from tmdbapi.aio._core import call as _call
+from tmdbapi.aio._core import mirror as _mirror
+
+for _name in _api3.__all__:
+    globals()[_name] = _mirror(f"{__name__}.{_name}", getattr(_api3, _name))
+
+
+@_functools.wraps(_api3.account.details)
+async def _account_details() -> dict:
+    # the synchronous function keeps the account ID after sending
+    json = await _call(_api3.account.details)
+    _api3.account._save_account_id(json)
+    return json
+
+
+def _with_account_id(func):
+    """Wrap an account function to look up the account ID asynchronously."""
+
+    @_functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        # instead of the blocking lookup of the synchronous function
+        if not _tmdbapi.setting["credential"].pass_check("account_id"):
+            with _internal_request():
+                await _account_details()
+        return await _call(func, *args, **kwargs)
+
+    return wrapper
+
+
+for _name in account.__all__:
+    setattr(account, _name, _with_account_id(getattr(_api3.account, _name)))
+account.details = _account_details
+
+__all__ = list(_api3.__all__)
@@ -0,0 +1,10 @@
+"""Coroutine version of the TMDB APIs version 4.
+"""
+
+from tmdbapi import api4 as _api4
+from tmdbapi.aio._core import mirror as _mirror
+
+for _name in _api4.__all__:
+    globals()[_name] = _mirror(f"{__name__}.{_name}", getattr(_api4, _name))
+
+__all__ = list(_api4.__all__)
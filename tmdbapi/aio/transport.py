@@ -0,0 +1,184 @@
+"""Asyncio HTTP Transport
+
+Provides the pooled, keep-alive asyncio transport shared by every
+`tmdbapi.aio` coroutine. Requires the optional dependency aiohttp.
+"""
+
+import asyncio
+from typing import Optional
+
+import tmdbapi
+
+try:
+    import aiohttp
+except ImportError as err:
+    raise ImportError(
+        "tmdbapi.aio requires aiohttp, install it with `pip install TMDB-Py[aio]`."
+    ) from err
+
+
+class AsyncResponse:
+    """A response with its body already read.
+
+    The attributes are named after `requests.Response`, so the response
+    can be handled the same way as a synchronous one.
+    """
+
+    __slots__ = ("status_code", "headers", "content", "url")
+
+    def __init__(self, status_code: int, headers, content: bytes, url: str):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.url = url
+
+
+class AsyncTransport:
+    """A pooled asyncio HTTP transport.
+
+    The transport keeps one `aiohttp.ClientSession` per event loop, so all
+    coroutines share the keep-alive connections to api.themoviedb.org.
+
+    Attributes
+    ----------
+    pool_connections : int
+        The number of hosts to keep connections for.
+    pool_maxsize : int
+        The maximum number of connections per host.
+    idle_timeout : float or None
+        The number of seconds an idle connection is kept alive.
+        None to keep idle connections open.
+
+    """
+
+    # The exceptions of transient failures which can be retried.
+    retry_exceptions = (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        idle_timeout: Optional[float] = 30.0,
+    ):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.idle_timeout = idle_timeout
+        # the sessions by event loop, the connections are bound to their loop
+        self._sessions = {}
+
+    def __repr__(self):
+        return (
+            f"AsyncTransport(pool_connections={self.pool_connections}, "
+            f"pool_maxsize={self.pool_maxsize}, idle_timeout={self.idle_timeout})"
+        )
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the session of the running event loop."""
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            self._discard_closed_loops()
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_connections * self.pool_maxsize,
+                limit_per_host=self.pool_maxsize,
+                keepalive_timeout=self.idle_timeout,
+            )
+            session = aiohttp.ClientSession(connector=connector)
+            self._sessions[loop] = session
+        return session
+
+    def _discard_closed_loops(self):
+        """Drop the sessions of the event loops already closed."""
+        for loop in [loop for loop in self._sessions if loop.is_closed()]:
+            if not self._sessions.pop(loop).closed:
+                tmdbapi.LOGGER.warning(
+                    "The event loop closed before its connections, close them "
+                    "with `await tmdbapi.aio.close()` before the loop ends."
+                )
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: dict = None,
+        headers: dict = None,
+        data=None,
+        json: dict = None,
+        timeout: Optional[float | tuple] = None,
+    ) -> AsyncResponse:
+        """Send a request through the connection pool.
+
+        The body is read before the connection is returned to the pool.
+
+        Parameters
+        ----------
+        method : str
+            The request method.
+        url : str
+            The URL without query parameters.
+        params : dict, optional
+            The query parameters.
+        headers : dict, optional
+            The request headers.
+        data : optional
+            The payload data.
+        json : dict, optional
+            The JSON payload.
+        timeout : float or tuple, optional
+            The same format as `tmdbapi.setting.timeout`.
+
+        Returns
+        -------
+        AsyncResponse
+        """
+        session = self._get_session()
+        if params is not None:
+            params = {k: str(v) for k, v in params.items()}
+        async with session.request(
+            method,
+            url,
+            params=params,
+            headers=headers,
+            data=data,
+            json=json,
+            timeout=_client_timeout(timeout),
+        ) as response:
+            return AsyncResponse(
+                response.status,
+                response.headers,
+                await response.read(),
+                str(response.url),
+            )
+
+    async def close(self):
+        """Close all pooled connections of every event loop.
+
+        The sessions of other event loops are closed in their own loop.
+        """
+        loop = asyncio.get_running_loop()
+        self._discard_closed_loops()
+        sessions, self._sessions = self._sessions, {}
+        for session_loop, session in sessions.items():
+            if session.closed:
+                continue
+            if session_loop is loop:
+                await session.close()
+            elif session_loop.is_running():
+                await asyncio.wrap_future(
+                    asyncio.run_coroutine_threadsafe(session.close(), session_loop)
+                )
+            else:
+                await asyncio.to_thread(
+                    session_loop.run_until_complete, session.close()
+                )
+
+
+def _client_timeout(timeout: Optional[float | tuple]) -> aiohttp.ClientTimeout:
+    """Convert a requests style timeout to `aiohttp.ClientTimeout`."""
+    if timeout is None:
+        return aiohttp.ClientTimeout(total=None)
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+    else:
+        connect = read = timeout
+    return aiohttp.ClientTimeout(total=None, sock_connect=connect, sock_read=read)
@@ -1,35 +1,7 @@
 """The version 3 of TMDB APIs.
 """
 
-from . import (
-    account,
-    authentication,
-    certifications,
-    changes,
-    collections,
-    companies,
-    configuration,
-    credits,
-    discover,
-    find,
-    genres,
-    guest_sessions,
-    keywords,
-    lists,
-    movie_lists,
-    movies,
-    networks,
-    people,
-    reviews,
-    search,
-    trending,
-    tv_episode_groups,
-    tv_episodes,
-    tv_seasons,
-    tv_series,
-    tv_series_lists,
-    watch_providers,
-)
+import importlib as _importlib
 
 __all__ = [
     "account",
@@ -60,3 +32,10 @@ __all__ = [
     "tv_series_lists",
     "watch_providers",
 ]
+
+
+def __getattr__(name):
+    # the modules are imported on first access (PEP 562)
+    if name in __all__:
+        return _importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f'Package "{__name__}" has no attribute "{name}"')
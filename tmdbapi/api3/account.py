@@ -3,7 +3,13 @@
 """
 
 import tmdbapi
-from tmdbapi._core import Tmdb
+from tmdbapi._core import (
+    Request,
+    compile_endpoints,
+    default_language,
+    internal_request,
+    session_query,
+)
 from tmdbapi.exceptions import type_checking
 
 _ACCOUNT_V3 = {
@@ -123,148 +129,148 @@ _ACCOUNT_V3 = {
 }
 
 
-class _Account(Tmdb):
-    def __init__(self, info_var):
-        super().__init__()
-        self.category_path = "/account"
-        self.info_var = info_var
-
-    def request(self) -> dict:
-        """Send a request."""
-        self.check_account_id()
-        self.load_path_arg(account_id=tmdbapi.setting["credential"]["account_id"])
-        url = self.build_url(3)
-        self.load_query(self.check_token())
-        return self.request_raw(
-            url=url,
-        )
-
-    def check_account_id(self):
-        """Check if `account_id` exists.
-
-        This method checks whether an `account_id` exists. If it doesn't,
-        it runs the 'details()' function to obtain the `account_id`.
-        """
-        if not tmdbapi.setting["credential"].pass_check("account_id"):
+_ENDPOINTS = compile_endpoints(_ACCOUNT_V3, 3, "/account")
+
+
+def _request(name: str, query: dict = None, json: dict = None) -> dict:
+    """Send a request with the account ID and the session of the credential."""
+    _check_account_id()
+    return _ENDPOINTS[name].request(
+        {"account_id": tmdbapi.setting["credential"]["account_id"]},
+        {**(query or {}), **session_query()},
+        json,
+    )
+
+
+def _check_account_id():
+    """Check if `account_id` exists.
+
+    This function checks whether an `account_id` exists. If it doesn't,
+    it runs the 'details()' function to obtain the `account_id`.
+    """
+    if not tmdbapi.setting["credential"].pass_check("account_id"):
+        # send it even when only preparing this request, tmdbapi.aio looks it
+        # up asynchronously before
+        with internal_request():
             details()
 
 
 def details() -> dict:
-    account = _Account(_ACCOUNT_V3)
-    account.reset()
-    account.use("account-details")
-    url = account.build_url(3)
-    account.load_query(account.check_token())
-    json = account.request_raw(url=url)
+    json = _ENDPOINTS["account-details"].request(None, session_query())
+    if isinstance(json, Request):
+        # prepare only, the caller (e.g. tmdbapi.aio) saves the account ID
+        return json
+    _save_account_id(json)
+    return json
+
+
+def _save_account_id(json: dict):
+    """Keep the account ID of the `details` response in the credential."""
     id = json["id"]
     if tmdbapi.setting["credential"]["account_id"] != id:
         tmdbapi.setting["credential"].set(account_id=id)
-    return json
 
 
 def add_favorite(media_id: int, media_type: str, favorite=True) -> dict:
-    account = _Account(_ACCOUNT_V3)
     type_checking("media_type", media_type)
-    account.reset()
-    account.use("account-add-favorite")
-    account.load_json(
-        {
+    return _request(
+        "account-add-favorite",
+        json={
             "media_type": media_type,
             "media_id": media_id,
             "favorite": favorite,
-        }
+        },
     )
-    return account.request()
 
 
 def add_to_watchlist(media_id: int, media_type: str, watchlist=True) -> dict:
-    account = _Account(_ACCOUNT_V3)
     type_checking("media_type", media_type)
-    account.reset()
-    account.use("account-add-to-watchlist")
-    account.load_json(
-        {
+    return _request(
+        "account-add-to-watchlist",
+        json={
             "media_type": media_type,
             "media_id": media_id,
             "watchlist": watchlist,
-        }
+        },
     )
-    return account.request()
 
 
 def favorite_movies(asc_sort=True, page=1, language: str = None) -> dict:
-    account = _Account(_ACCOUNT_V3)
-    account.reset()
-    account.use("account-get-favorites")
-    account.sortby(asc_sort)
-    account.language(language)
-    account.load_query(page=page)
-    return account.request()
+    return _request(
+        "account-get-favorites",
+        {
+            "sort_by": "created_at.asc" if asc_sort else "created_at.desc",
+            "language": default_language(language),
+            "page": page,
+        },
+    )
 
 
 def favorite_tv_shows(asc_sort=True, page=1, language: str = None) -> dict:
-    account = _Account(_ACCOUNT_V3)
-    account.reset()
-    account.use("account-favorite-tv")
-    account.sortby(asc_sort)
-    account.language(language)
-    account.load_query(page=page)
-    return account.request()
+    return _request(
+        "account-favorite-tv",
+        {
+            "sort_by": "created_at.asc" if asc_sort else "created_at.desc",
+            "language": default_language(language),
+            "page": page,
+        },
+    )
 
 
 def get_list(page=1) -> dict:
-    account = _Account(_ACCOUNT_V3)
-    account.reset()
-    account.use("account-lists")
-    account.load_query(page=page)
-    return account.request()
+    return _request("account-lists", {"page": page})
 
 
 def rated_movies(asc_sort=True, page=1, language: str = None) -> dict:
-    account = _Account(_ACCOUNT_V3)
-    account.reset()
-    account.use("account-rated-movies")
-    account.sortby(asc_sort)
-    account.language(language)
-    account.load_query(page=page)
-    return account.request()
+    return _request(
+        "account-rated-movies",
+        {
+            "sort_by": "created_at.asc" if asc_sort else "created_at.desc",
+            "language": default_language(language),
+            "page": page,
+        },
+    )
 
 
 def rated_tv_shows(asc_sort=True, page=1, language: str = None) -> dict:
-    account = _Account(_ACCOUNT_V3)
-    account.reset()
-    account.use("account-rated-tv")
-    account.sortby(asc_sort)
-    account.language(language)
-    account.load_query(page=page)
-    return account.request()
+    return _request(
+        "account-rated-tv",
+        {
+            "sort_by": "created_at.asc" if asc_sort else "created_at.desc",
+            "language": default_language(language),
+            "page": page,
+        },
+    )
 
 
 def rated_tv_episodes(asc_sort=True, page=1, language: str = None) -> dict:
-    account = _Account(_ACCOUNT_V3)
-    account.reset()
-    account.use("account-rated-tv-episodes")
-    account.sortby(asc_sort)
-    account.language(language)
-    account.load_query(page=page)
-    return account.request()
+    return _request(
+        "account-rated-tv-episodes",
+        {
+            "sort_by": "created_at.asc" if asc_sort else "created_at.desc",
+            "language": default_language(language),
+            "page": page,
+        },
+    )
 
 
 def movie_watchlist(asc_sort=True, page=1, language: str = None) -> dict:
-    account = _Account(_ACCOUNT_V3)
-    account.reset()
-    account.use("account-watchlist-movies")
-    account.sortby(asc_sort)
-    account.language(language)
-    account.load_query(page=page)
-    return account.request()
+    return _request(
+        "account-watchlist-movies",
+        {
+            "sort_by": "created_at.asc" if asc_sort else "created_at.desc",
+            "language": default_language(language),
+            "page": page,
+        },
+    )
 
 
 def tv_show_watchlist(asc_sort=True, page=1, language: str = None) -> dict:
-    account = _Account(_ACCOUNT_V3)
-    account.reset()
-    account.use("account-watchlist-tv")
-    account.sortby(asc_sort)
-    account.language(language)
-    account.load_query(page=page)
-    return account.request()
+    return _request(
+        "account-watchlist-tv",
+        {
+            "sort_by": "created_at.asc" if asc_sort else "created_at.desc",
+            "language": default_language(language),
+            "page": page,
+        },
+    )
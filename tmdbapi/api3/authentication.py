@@ -2,7 +2,7 @@
 
 """
 
-from tmdbapi._core import Tmdb
+from tmdbapi._core import compile_endpoints
 
 _AUTHENTICATION_V3 = {
     "authentication-create-guest-session": {
@@ -43,73 +43,44 @@ _AUTHENTICATION_V3 = {
 }
 
 
-class _Authentication(Tmdb):
-    def __init__(self, info_var):
-        super().__init__()
-        self.category_path = "/authentication"
-        self.info_var = info_var
-
-    def request(self) -> dict:
-        url = self.build_url(3)
-        return self.request_raw(
-            url=url,
-        )
+_ENDPOINTS = compile_endpoints(_AUTHENTICATION_V3, 3, "/authentication")
 
 
 def create_guest_session() -> dict:
-    authentication = _Authentication(_AUTHENTICATION_V3)
-    authentication.reset()
-    authentication.use("authentication-create-guest-session")
-    return authentication.request()
+    return _ENDPOINTS["authentication-create-guest-session"].request()
 
 
 def create_request_token() -> dict:
-    authentication = _Authentication(_AUTHENTICATION_V3)
-    authentication.reset()
-    authentication.use("authentication-create-request-token")
-    return authentication.request()
+    return _ENDPOINTS["authentication-create-request-token"].request()
 
 
 def create_session(request_token: str) -> dict:
-    authentication = _Authentication(_AUTHENTICATION_V3)
-    authentication.reset()
-    authentication.use("authentication-create-session")
-    authentication.load_json({"request_token": request_token})
-    return authentication.request()
+    return _ENDPOINTS["authentication-create-session"].request(
+        json={"request_token": request_token}
+    )
 
 
 def create_session_from_login(username: str, password: str, request_token: str) -> dict:
-    authentication = _Authentication(_AUTHENTICATION_V3)
-    authentication.reset()
-    authentication.use("authentication-create-session-from-login")
-    authentication.load_json(
-        {
+    return _ENDPOINTS["authentication-create-session-from-login"].request(
+        json={
             "username": username,
             "password": password,
             "request_token": request_token,
         }
     )
-    return authentication.request()
 
 
 def create_session_from_v4_token(access_token: str) -> dict:
-    authentication = _Authentication(_AUTHENTICATION_V3)
-    authentication.reset()
-    authentication.use("authentication-create-session-from-v4-token")
-    authentication.load_json({"access_token": access_token})
-    return authentication.request()
+    return _ENDPOINTS["authentication-create-session-from-v4-token"].request(
+        json={"access_token": access_token}
+    )
 
 
 def delete_session(session_id: str) -> dict:
-    authentication = _Authentication(_AUTHENTICATION_V3)
-    authentication.reset()
-    authentication.use("authentication-delete-session")
-    authentication.load_json({"session_id": session_id})
-    return authentication.request()
+    return _ENDPOINTS["authentication-delete-session"].request(
+        json={"session_id": session_id}
+    )
 
 
 def validate_key() -> dict:
-    authentication = _Authentication(_AUTHENTICATION_V3)
-    authentication.reset()
-    authentication.use("authentication-validate-key")
-    return authentication.request()
+    return _ENDPOINTS["authentication-validate-key"].request()
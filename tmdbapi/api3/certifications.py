@@ -2,7 +2,7 @@
 
 """
 
-from tmdbapi._core import Tmdb
+from tmdbapi._core import compile_endpoints
 
 _CERTIFICATION_V3 = {
     "certification-movie-list": {
@@ -18,29 +18,13 @@ _CERTIFICATION_V3 = {
 }
 
 
-class _Certification(Tmdb):
-    def __init__(self, info_var):
-        super().__init__()
-        self.category_path = "/certification"
-        self.info_var = info_var
-
-    def request(self) -> dict:
-        url = self.build_url(3)
-        return self.request_raw(
-            url=url,
-        )
+_ENDPOINTS = compile_endpoints(_CERTIFICATION_V3, 3, "/certification")
 
 
 def movie_list() -> dict:
     """Get an up to date list of the officially supported movie certifications on TMDB."""
-    certification = _Certification(_CERTIFICATION_V3)
-    certification.reset()
-    certification.use("certification-movie-list")
-    return certification.request()
+    return _ENDPOINTS["certification-movie-list"].request()
 
 
 def tv_list() -> dict:
-    certification = _Certification(_CERTIFICATION_V3)
-    certification.reset()
-    certification.use("certifications-tv-list")
-    return certification.request()
+    return _ENDPOINTS["certifications-tv-list"].request()
@@ -2,7 +2,7 @@
 
 """
 
-from tmdbapi._core import Tmdb
+from tmdbapi._core import compile_endpoints
 from tmdbapi.exceptions import type_checking
 
 _CHANGES_V3 = {
@@ -36,30 +36,19 @@ _CHANGES_V3 = {
 }
 
 
-class _Changes(Tmdb):
-    def __init__(self, info_var):
-        super().__init__()
-        self.category_path = ""
-        self.info_var = info_var
-
-    def request(self) -> dict:
-        url = self.build_url(3)
-        return self.request_raw(
-            url=url,
-        )
-
-    def change_list(self, use_name, start_date="", end_date="", page=1) -> dict:
-        """Wrap the same process for get th change list"""
-        self.reset()
-        self.use(use_name)
-        if start_date != "":
-            type_checking("date", start_date)
-            self.load_query(start_date=start_date)
-        if end_date != "":
-            type_checking("date", end_date)
-            self.load_query(end_date=end_date)
-        self.load_query(page=page)
-        return self.request()
+_ENDPOINTS = compile_endpoints(_CHANGES_V3, 3, "")
+
+
+def _change_list(name: str, start_date="", end_date="", page=1) -> dict:
+    """Wrap the same process for get th change list"""
+    if start_date != "":
+        type_checking("date", start_date)
+    if end_date != "":
+        type_checking("date", end_date)
+    return _ENDPOINTS[name].request(
+        None,
+        {"start_date": start_date or None, "end_date": end_date or None, "page": page},
+    )
 
 
 def movie_list(start_date="", end_date="", page=1) -> dict:
@@ -69,8 +58,7 @@ def movie_list(start_date="", end_date="", page=1) -> dict:
     `start_date` and `start_date` is lte and gte
     Format: YYYY-MM-DD
     """
-    changes = _Changes(_CHANGES_V3)
-    return changes.change_list(
+    return _change_list(
         "changes-movie-list", start_date=start_date, end_date=end_date, page=page
     )
 
@@ -81,8 +69,7 @@ def tv_list(start_date="", end_date="", page=1) -> dict:
     `start_date` and `start_date` is lte and gte
     Format: YYYY-MM-DD
     """
-    changes = _Changes(_CHANGES_V3)
-    return changes.change_list(
+    return _change_list(
         "changes-tv-list", start_date=start_date, end_date=end_date, page=page
     )
 
@@ -93,7 +80,6 @@ def person_list(start_date="", end_date="", page=1) -> dict:
     `start_date` and `start_date` is lte and gte
     Format: YYYY-MM-DD
     """
-    changes = _Changes(_CHANGES_V3)
-    return changes.change_list(
+    return _change_list(
         "changes-people-list", start_date=start_date, end_date=end_date, page=page
     )
@@ -2,7 +2,7 @@
 
 """
 
-from tmdbapi._core import Tmdb
+from tmdbapi._core import compile_endpoints, default_language
 
 _COLLECTION_V3 = {
     "collection-details": {
@@ -30,44 +30,28 @@ _COLLECTION_V3 = {
 }
 
 
-class _Collection(Tmdb):
-    def __init__(self, info_var):
-        super().__init__()
-        self.category_path = "/collection"
-        self.info_var = info_var
-
-    def request(self) -> dict:
-        url = self.build_url(3)
-        return self.request_raw(
-            url=url,
-        )
+_ENDPOINTS = compile_endpoints(_COLLECTION_V3, 3, "/collection")
 
 
 def details(collection_id: int, language: str = None) -> dict:
     """Get collection (movie series) details by ID."""
-    collection = _Collection(_COLLECTION_V3)
-    collection.reset()
-    collection.use("collection-details")
-    collection.load_path_arg(collection_id=collection_id)
-    collection.language(language)
-    return collection.request()
+    return _ENDPOINTS["collection-details"].request(
+        {"collection_id": collection_id}, {"language": default_language(language)}
+    )
 
 
 def images(collection_id: int, language: str = None, include_image_language="") -> dict:
     """Get the images that belong to a collection."""
-    collection = _Collection(_COLLECTION_V3)
-    collection.reset()
-    collection.use("collection-images")
-    collection.load_path_arg(collection_id=collection_id)
-    collection.language(language)
-    if include_image_language != "":
-        collection.load_query(include_image_language=include_image_language)
-    return collection.request()
+    return _ENDPOINTS["collection-images"].request(
+        {"collection_id": collection_id},
+        {
+            "language": default_language(language),
+            "include_image_language": include_image_language or None,
+        },
+    )
 
 
 def translations(collection_id: int) -> dict:
-    collection = _Collection(_COLLECTION_V3)
-    collection.reset()
-    collection.use("collection-translations")
-    collection.load_path_arg(collection_id=collection_id)
-    return collection.request()
+    return _ENDPOINTS["collection-translations"].request(
+        {"collection_id": collection_id}
+    )
@@ -2,7 +2,7 @@
 
 """
 
-from tmdbapi._core import Tmdb
+from tmdbapi._core import compile_endpoints
 
 _COMPANIES_V3 = {
     "company-alternative-names": {
@@ -23,40 +23,18 @@ _COMPANIES_V3 = {
 }
 
 
-class _Companies(Tmdb):
-    def __init__(self, info_var):
-        super().__init__()
-        self.category_path = "/company/{company_id}"
-        self.info_var = info_var
-
-    def request(self) -> dict:
-        url = self.build_url(3)
-        return self.request_raw(
-            url=url,
-        )
+_ENDPOINTS = compile_endpoints(_COMPANIES_V3, 3, "/company/{company_id}")
 
 
 def alternative_names(company_id: int) -> dict:
-    companies = _Companies(_COMPANIES_V3)
-    companies.reset()
-    companies.use("company-alternative-names")
-    companies.load_path_arg(company_id=company_id)
-    return companies.request()
+    return _ENDPOINTS["company-alternative-names"].request({"company_id": company_id})
 
 
 def details(company_id: int) -> dict:
     """Get the company details by ID."""
-    companies = _Companies(_COMPANIES_V3)
-    companies.reset()
-    companies.use("company-details")
-    companies.load_path_arg(company_id=company_id)
-    return companies.request()
+    return _ENDPOINTS["company-details"].request({"company_id": company_id})
 
 
 def images(company_id: int) -> dict:
     """Get the company logos by id."""
-    companies = _Companies(_COMPANIES_V3)
-    companies.reset()
-    companies.use("company-images")
-    companies.load_path_arg(company_id=company_id)
-    return companies.request()
+    return _ENDPOINTS["company-images"].request({"company_id": company_id})
@@ -2,7 +2,7 @@
 
 """
 
-from tmdbapi._core import Tmdb
+from tmdbapi._core import compile_endpoints, default_language
 
 _CONFIGURATION_V3 = {
     "configuration-countries": {
@@ -34,65 +34,38 @@ _CONFIGURATION_V3 = {
 }
 
 
-class _Configuration(Tmdb):
-    def __init__(self, info_var):
-        super().__init__()
-        self.category_path = "/configuration"
-        self.info_var = info_var
-
-    def request(self) -> dict:
-        url = self.build_url(3)
-        return self.request_raw(
-            url=url,
-        )
+_ENDPOINTS = compile_endpoints(_CONFIGURATION_V3, 3, "/configuration")
 
 
 def details() -> dict:
     """Query the API configuration details."""
-    configuration = _Configuration(_CONFIGURATION_V3)
-    configuration.reset()
-    configuration.use("configuration-details")
-    return configuration.request()
+    return _ENDPOINTS["configuration-details"].request()
 
 
 def countries(language: str = None) -> dict:
     """Get the list of countries (ISO 3166-1 tags) used throughout
     TMDB.
     """
-    configuration = _Configuration(_CONFIGURATION_V3)
-    configuration.reset()
-    configuration.use("configuration-countries")
-    configuration.language(language)
-    return configuration.request()
+    return _ENDPOINTS["configuration-countries"].request(
+        None, {"language": default_language(language)}
+    )
 
 
 def jobs() -> dict:
     """Get the list of the jobs and departments we use on TMDB."""
-    configuration = _Configuration(_CONFIGURATION_V3)
-    configuration.reset()
-    configuration.use("configuration-jobs")
-    return configuration.request()
+    return _ENDPOINTS["configuration-jobs"].request()
 
 
 def languages() -> dict:
     """Get the list of languages (ISO 639-1 tags) used throughout TMDB."""
-    configuration = _Configuration(_CONFIGURATION_V3)
-    configuration.reset()
-    configuration.use("configuration-languages")
-    return configuration.request()
+    return _ENDPOINTS["configuration-languages"].request()
 
 
 def primary_translations() -> dict:
     """Get a list of the officially supported translations on TMDB."""
-    configuration = _Configuration(_CONFIGURATION_V3)
-    configuration.reset()
-    configuration.use("configuration-primary-translations")
-    return configuration.request()
+    return _ENDPOINTS["configuration-primary-translations"].request()
 
 
 def timezones() -> dict:
     """Get the list of timezones used throughout TMDB."""
-    configuration = _Configuration(_CONFIGURATION_V3)
-    configuration.reset()
-    configuration.use("configuration-timezones")
-    return configuration.request()
+    return _ENDPOINTS["configuration-timezones"].request()
@@ -2,7 +2,7 @@
 
 """
 
-from tmdbapi._core import Tmdb
+from tmdbapi._core import compile_endpoints
 
 _CREDITS_V3 = {
     "credit-details": {
@@ -13,23 +13,9 @@ _CREDITS_V3 = {
 }
 
 
-class _Credits(Tmdb):
-    def __init__(self, info_var):
-        super().__init__()
-        self.category_path = "/credit"
-        self.info_var = info_var
-
-    def request(self) -> dict:
-        url = self.build_url(3)
-        return self.request_raw(
-            url=url,
-        )
+_ENDPOINTS = compile_endpoints(_CREDITS_V3, 3, "/credit")
 
 
 def details(credit_id: str) -> dict:
     """Get a movie or TV credit details by ID."""
-    credits = _Credits(_CREDITS_V3)
-    credits.reset()
-    credits.use("credit-details")
-    credits.load_path_arg(credit_id=credit_id)
-    return credits.request()
+    return _ENDPOINTS["credit-details"].request({"credit_id": credit_id})
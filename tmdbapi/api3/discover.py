@@ -1,7 +1,7 @@
 """API v3 discover category
 
 """
-from tmdbapi._core import Tmdb
+from tmdbapi._core import compile_endpoints, default_language, default_region
 
 _DISCOVER_V3 = {
     "discover-movie": {
@@ -90,42 +90,26 @@ _DISCOVER_V3 = {
 }
 
 
-class _Discover(Tmdb):
-    def __init__(self, info_var):
-        super().__init__()
-        self.category_path = "/discover"
-        self.info_var = info_var
-
-    def request(self) -> dict:
-        url = self.build_url(3)
-        return self.request_raw(
-            url=url,
-        )
+_ENDPOINTS = compile_endpoints(_DISCOVER_V3, 3, "/discover")
 
 
 def movies(params: dict = {}, **kwargs) -> dict:
     """Find movies using over 30 filters and sort options."""
-    discover = _Discover(_DISCOVER_V3)
-    discover.reset()
-    discover.use("discover-movie")
-    params.update(kwargs)
-    if not discover.check_params(params):
+    endpoint = _ENDPOINTS["discover-movie"]
+    params = {**params, **kwargs}
+    if not endpoint.params.issuperset(params):
         raise KeyError("The keyword in params is invalid")
-    discover.load_query(params)
-    discover.language(params.get("language", None))
-    discover.region(params.get("region", None))
-    return discover.request()
+    params["language"] = default_language(params.get("language", None))
+    params["region"] = default_region(params.get("region", None))
+    return endpoint.request(None, params)
 
 
 def tv(params: dict = {}, **kwargs) -> dict:
     """Find TV shows using over 30 filters and sort options."""
-    discover = _Discover(_DISCOVER_V3)
-    discover.reset()
-    discover.use("discover-tv")
-    params.update(kwargs)
-    if not discover.check_params(params):
+    endpoint = _ENDPOINTS["discover-tv"]
+    params = {**params, **kwargs}
+    if not endpoint.params.issuperset(params):
         raise KeyError("params error")
-    discover.load_query(params)
-    discover.language(params.get("language", None))
-    discover.region(params.get("region", None))
-    return discover.request()
+    params["language"] = default_language(params.get("language", None))
+    params["region"] = default_region(params.get("region", None))
+    return endpoint.request(None, params)
@@ -2,7 +2,7 @@
 
 """
 
-from tmdbapi._core import Tmdb
+from tmdbapi._core import compile_endpoints, default_language
 from tmdbapi.exceptions import type_checking
 
 _FIND_V3 = {
@@ -18,17 +18,7 @@ _FIND_V3 = {
 }
 
 
-class _Find(Tmdb):
-    def __init__(self, info_var):
-        super().__init__()
-        self.category_path = "/find"
-        self.info_var = info_var
-
-    def request(self) -> dict:
-        url = self.build_url(3)
-        return self.request_raw(
-            url=url,
-        )
+_ENDPOINTS = compile_endpoints(_FIND_V3, 3, "/find")
 
 
 def find(external_id: str, external_source: str, language: str = None) -> dict:
@@ -54,11 +44,8 @@ def find(external_id: str, external_source: str, language: str = None) -> dict:
         ```
     language : str, optional
     """
-    find = _Find(_FIND_V3)
     type_checking("external_source", external_source)
-    find.reset()
-    find.use("find-by-id")
-    find.load_path_arg(external_id=external_id)
-    find.language(language)
-    find.load_query(external_source=external_source)
-    return find.request()
+    return _ENDPOINTS["find-by-id"].request(
+        {"external_id": external_id},
+        {"language": default_language(language), "external_source": external_source},
+    )
@@ -2,7 +2,7 @@
 
 """
 
-from tmdbapi._core import Tmdb
+from tmdbapi._core import compile_endpoints, default_language
 
 _GENRES_V3 = {
     "genre-movie-list": {
@@ -18,32 +18,18 @@ _GENRES_V3 = {
 }
 
 
-class _Genres(Tmdb):
-    def __init__(self, info_var):
-        super().__init__()
-        self.category_path = "/genre"
-        self.info_var = info_var
-
-    def request(self) -> dict:
-        url = self.build_url(3)
-        return self.request_raw(
-            url=url,
-        )
+_ENDPOINTS = compile_endpoints(_GENRES_V3, 3, "/genre")
 
 
 def movie_list(language: str = None) -> dict:
     """Get the list of official genres for movies."""
-    genres = _Genres(_GENRES_V3)
-    genres.reset()
-    genres.use("genre-movie-list")
-    genres.language(language)
-    return genres.request()
+    return _ENDPOINTS["genre-movie-list"].request(
+        None, {"language": default_language(language)}
+    )
 
 
 def tv_list(language: str = None) -> dict:
     """Get the list of official genres for TV shows."""
-    genres = _Genres(_GENRES_V3)
-    genres.reset()
-    genres.use("genre-tv-list")
-    genres.language(language)
-    return genres.request()
+    return _ENDPOINTS["genre-tv-list"].request(
+        None, {"language": default_language(language)}
+    )
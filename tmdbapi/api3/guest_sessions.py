@@ -2,7 +2,7 @@
 
 """
 
-from tmdbapi._core import Tmdb
+from tmdbapi._core import compile_endpoints, default_language
 
 _GUEST_SESSIONS_V3 = {
     "guest-session-rated-movies": {
@@ -38,56 +38,46 @@ _GUEST_SESSIONS_V3 = {
 }
 
 
-class _GuestSession(Tmdb):
-    def __init__(self, info_var):
-        super().__init__()
-        self.category_path = "/guest_session"
-        self.info_var = info_var
-
-    def request(self) -> dict:
-        url = self.build_url(3)
-        return self.request_raw(
-            url=url,
-        )
+_ENDPOINTS = compile_endpoints(_GUEST_SESSIONS_V3, 3, "/guest_session")
 
 
 def rated_movies(
     guest_session_id: str, language: str = None, page=1, asc_sort=True
 ) -> dict:
     """Get the rated movies for a guest session."""
-    guest_session = _GuestSession(_GUEST_SESSIONS_V3)
-    guest_session.reset()
-    guest_session.use("guest-session-rated-movies")
-    guest_session.load_path_arg(guest_session_id=guest_session_id)
-    guest_session.language(language)
-    guest_session.sortby(asc_sort)
-    guest_session.load_query(page=page)
-    return guest_session.request()
+    return _ENDPOINTS["guest-session-rated-movies"].request(
+        {"guest_session_id": guest_session_id},
+        {
+            "language": default_language(language),
+            "sort_by": "created_at.asc" if asc_sort else "created_at.desc",
+            "page": page,
+        },
+    )
 
 
 def rated_tv(
     guest_session_id: str, language: str = None, page=1, asc_sort=True
 ) -> dict:
     """Get the rated TV shows for a guest session."""
-    guest_session = _GuestSession(_GUEST_SESSIONS_V3)
-    guest_session.reset()
-    guest_session.use("guest-session-rated-tv")
-    guest_session.load_path_arg(guest_session_id=guest_session_id)
-    guest_session.language(language)
-    guest_session.sortby(asc_sort)
-    guest_session.load_query(page=page)
-    return guest_session.request()
+    return _ENDPOINTS["guest-session-rated-tv"].request(
+        {"guest_session_id": guest_session_id},
+        {
+            "language": default_language(language),
+            "sort_by": "created_at.asc" if asc_sort else "created_at.desc",
+            "page": page,
+        },
+    )
 
 
 def rated_tv_episodes(
     guest_session_id: str, language: str = None, page=1, asc_sort=True
 ) -> dict:
     """Get the rated TV episodes for a guest session."""
-    guest_session = _GuestSession(_GUEST_SESSIONS_V3)
-    guest_session.reset()
-    guest_session.use("guest-session-rated-tv-episodes")
-    guest_session.load_path_arg(guest_session_id=guest_session_id)
-    guest_session.language(language)
-    guest_session.sortby(asc_sort)
-    guest_session.load_query(page=page)
-    return guest_session.request()
+    return _ENDPOINTS["guest-session-rated-tv-episodes"].request(
+        {"guest_session_id": guest_session_id},
+        {
+            "language": default_language(language),
+            "sort_by": "created_at.asc" if asc_sort else "created_at.desc",
+            "page": page,
+        },
+    )
@@ -2,7 +2,7 @@
 
 """
 
-from tmdbapi._core import Tmdb
+from tmdbapi._core import compile_endpoints, default_language
 from tmdbapi.exceptions import ServiceDeprecationWarning
 
 _KEYWORDS_V3 = {
@@ -24,35 +24,22 @@ _KEYWORDS_V3 = {
 }
 
 
-class _Keywords(Tmdb):
-    def __init__(self, info_var):
-        super().__init__()
-        self.category_path = "/keyword"
-        self.info_var = info_var
-
-    def request(self) -> dict:
-        url = self.build_url(3)
-        return self.request_raw(
-            url=url,
-        )
+_ENDPOINTS = compile_endpoints(_KEYWORDS_V3, 3, "/keyword")
 
 
 def details(keyword_id: int) -> dict:
-    keywords = _Keywords(_KEYWORDS_V3)
-    keywords.reset()
-    keywords.use("keyword-details")
-    keywords.load_path_arg(keyword_id=keyword_id)
-    return keywords.request()
+    return _ENDPOINTS["keyword-details"].request({"keyword_id": keyword_id})
 
 
 def movies(keyword_id: int, include_adult=False, language: str = None, page=1) -> dict:
     ServiceDeprecationWarning(
         "keywords.movies method is deprecated, you should use discover.movie instead."
     )
-    keywords = _Keywords(_KEYWORDS_V3)
-    keywords.reset()
-    keywords.use("keyword-movies")
-    keywords.load_path_arg(keyword_id=keyword_id)
-    keywords.language(language)
-    keywords.load_query(include_adult=include_adult, page=page)
-    return keywords.request()
+    return _ENDPOINTS["keyword-movies"].request(
+        {"keyword_id": keyword_id},
+        {
+            "language": default_language(language),
+            "include_adult": include_adult,
+            "page": page,
+        },
+    )
@@ -2,7 +2,7 @@
 
 """
 
-from tmdbapi._core import Tmdb
+from tmdbapi._core import compile_endpoints, default_language, session_query
 
 _LISTS_V3 = {
     "list-add-movie": {
@@ -68,88 +68,54 @@ _LISTS_V3 = {
 }
 
 
-class _Lists(Tmdb):
-    def __init__(self, info_var):
-        super().__init__()
-        self.category_path = "/list"
-        self.info_var = info_var
-
-    def request(self) -> dict:
-        url = self.build_url(3)
-        return self.request_raw(
-            url=url,
-        )
+_ENDPOINTS = compile_endpoints(_LISTS_V3, 3, "/list")
 
 
 def add_movie(list_id: int, movie_id: int) -> dict:
     """Add a movie to a list."""
-    lists = _Lists(_LISTS_V3)
-    lists.reset()
-    lists.use("list-add-movie")
-    lists.load_path_arg(list_id=list_id)
-    lists.load_query(lists.check_token())
-    lists.load_json({"media_id": movie_id})
-    return lists.request()
+    return _ENDPOINTS["list-add-movie"].request(
+        {"list_id": list_id}, session_query(), json={"media_id": movie_id}
+    )
 
 
 def check_item_status(list_id: int, movie_id: int, language: str = None) -> dict:
     """Use this method to check if an item has already been added
     to the list.
     """
-    lists = _Lists(_LISTS_V3)
-    lists.reset()
-    lists.use("list-check-item-status")
-    lists.load_path_arg(list_id=list_id)
-    lists.language(language)
-    lists.load_query(movie_id=movie_id)
-    return lists.request()
+    return _ENDPOINTS["list-check-item-status"].request(
+        {"list_id": list_id},
+        {"language": default_language(language), "movie_id": movie_id},
+    )
 
 
 def clear(list_id: int) -> dict:
     """Clear all items from a list."""
-    lists = _Lists(_LISTS_V3)
-    lists.reset()
-    lists.use("list-clear")
-    lists.load_path_arg(list_id=list_id)
-    lists.load_query(lists.check_token())
-    lists.load_query(confirm=True)
-    return lists.request()
+    return _ENDPOINTS["list-clear"].request(
+        {"list_id": list_id}, {**session_query(), "confirm": True}
+    )
 
 
 def create(name: str, description: str, language="en") -> dict:
-    lists = _Lists(_LISTS_V3)
-    lists.reset()
-    lists.use("list-create")
-    lists.load_query(lists.check_token())
-    lists.load_json({"name": name, "description": description, "language": language})
-    return lists.request()
+    return _ENDPOINTS["list-create"].request(
+        None,
+        session_query(),
+        json={"name": name, "description": description, "language": language},
+    )
 
 
 def delete(list_id: int) -> dict:
     """Delete a list."""
-    lists = _Lists(_LISTS_V3)
-    lists.reset()
-    lists.use("list-delete")
-    lists.load_path_arg(list_id=list_id)
-    lists.load_query(lists.check_token())
-    return lists.request()
+    return _ENDPOINTS["list-delete"].request({"list_id": list_id}, session_query())
 
 
 def details(list_id: int, language: str = None) -> dict:
-    lists = _Lists(_LISTS_V3)
-    lists.reset()
-    lists.use("list-details")
-    lists.load_path_arg(list_id=list_id)
-    lists.language(language)
-    return lists.request()
+    return _ENDPOINTS["list-details"].request(
+        {"list_id": list_id}, {"language": default_language(language)}
+    )
 
 
 def remove_movie(list_id: int, movie_id: int) -> dict:
     """Remove a movie from a list."""
-    lists = _Lists(_LISTS_V3)
-    lists.reset()
-    lists.use("list-remove-movie")
-    lists.load_path_arg(list_id=list_id)
-    lists.load_query(lists.check_token())
-    lists.load_json({"media_id": movie_id})
-    return lists.request()
+    return _ENDPOINTS["list-remove-movie"].request(
+        {"list_id": list_id}, session_query(), json={"media_id": movie_id}
+    )
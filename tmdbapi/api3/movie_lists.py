@@ -2,7 +2,7 @@
 
 """
 
-from tmdbapi._core import Tmdb
+from tmdbapi._core import compile_endpoints, default_language, default_region
 
 _MOVIE_LISTS_V3 = {
     "movie-now-playing-list": {
@@ -44,55 +44,40 @@ _MOVIE_LISTS_V3 = {
 }
 
 
-class _MovieLists(Tmdb):
-    def __init__(self, info_var):
-        super().__init__()
-        self.category_path = "/movie"
-        self.info_var = info_var
+_ENDPOINTS = compile_endpoints(_MOVIE_LISTS_V3, 3, "/movie")
 
-    def request(self) -> dict:
-        url = self.build_url(3)
-        return self.request_raw(
-            url=url,
-        )
 
-    def get_list(self, use_name, language, region, page=1) -> dict:
-        """Wrap the process for getting list"""
-        self.reset()
-        self.use(use_name)
-        self.language(language)
-        self.region(region)
-        self.load_query(page=page)
-        return self.request()
+def _get_list(name: str, language, region, page=1) -> dict:
+    """Wrap the process for getting list"""
+    return _ENDPOINTS[name].request(
+        None,
+        {
+            "language": default_language(language),
+            "region": default_region(region),
+            "page": page,
+        },
+    )
 
 
 def now_playing(language: str = None, region: str = None, page=1) -> dict:
     """Get a list of movies that are currently in theatres."""
-    movie_lists = _MovieLists(_MOVIE_LISTS_V3)
-    return movie_lists.get_list(
+    return _get_list(
         "movie-now-playing-list", language=language, region=region, page=page
     )
 
 
 def popular(language: str = None, region: str = None, page=1) -> dict:
     """Get a list of movies ordered by popularity."""
-    movie_lists = _MovieLists(_MOVIE_LISTS_V3)
-    return movie_lists.get_list(
-        "movie-popular-list", language=language, region=region, page=page
-    )
+    return _get_list("movie-popular-list", language=language, region=region, page=page)
 
 
 def top_rated(language: str = None, region: str = None, page=1) -> dict:
     """Get a list of movies ordered by rating."""
-    movie_lists = _MovieLists(_MOVIE_LISTS_V3)
-    return movie_lists.get_list(
+    return _get_list(
         "movie-top-rated-list", language=language, region=region, page=page
     )
 
 
 def upcoming(language: str = None, region: str = None, page=1) -> dict:
     """Get a list of movies that are being released soon."""
-    movie_lists = _MovieLists(_MOVIE_LISTS_V3)
-    return movie_lists.get_list(
-        "movie-upcoming-list", language=language, region=region, page=page
-    )
+    return _get_list("movie-upcoming-list", language=language, region=region, page=page)
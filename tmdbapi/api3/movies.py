@@ -2,7 +2,7 @@
 
 """
 
-from tmdbapi._core import Tmdb
+from tmdbapi._core import compile_endpoints, default_language, session_query
 from tmdbapi.exceptions import type_checking
 
 _MOVIES_V3 = {
@@ -153,17 +153,7 @@ _MOVIES_V3 = {
 }
 
 
-class _Movies(Tmdb):
-    def __init__(self, info_var):
-        super().__init__()
-        self.category_path = "/movie"
-        self.info_var = info_var
-
-    def request(self) -> dict:
-        url = self.build_url(3)
-        return self.request_raw(
-            url=url,
-        )
+_ENDPOINTS = compile_endpoints(_MOVIES_V3, 3, "/movie")
 
 
 def details(
@@ -172,23 +162,20 @@ def details(
     language: str = None,
 ) -> dict:
     """Get the top level details of a movie by ID."""
-    movies = _Movies(_MOVIES_V3)
-    movies.reset()
-    movies.use("movie-details")
-    movies.load_path_arg(movie_id=movie_id)
-    movies.language(language)
-    movies.load_query(append_to_response=append_to_response)
-    return movies.request()
+    return _ENDPOINTS["movie-details"].request(
+        {"movie_id": movie_id},
+        {
+            "language": default_language(language),
+            "append_to_response": append_to_response,
+        },
+    )
 
 
 def account_states(movie_id: str, guest_session_id: str = None) -> dict:
     """Get the rating, watchlist and favorite status of an account."""
-    movies = _Movies(_MOVIES_V3)
-    movies.reset()
-    movies.use("movie-account-states")
-    movies.load_path_arg(movie_id=movie_id)
-    movies.choose_session_id(guest_session_id)
-    return movies.request()
+    return _ENDPOINTS["movie-account-states"].request(
+        {"movie_id": movie_id}, session_query(guest_session_id)
+    )
 
 
 def alternative_titles(movie_id: str, country: str = None) -> dict:
@@ -196,12 +183,9 @@ def alternative_titles(movie_id: str, country: str = None) -> dict:
 
     country: format ISO-3166-1
     """
-    movies = _Movies(_MOVIES_V3)
-    movies.reset()
-    movies.use("movie-alternative-titles")
-    movies.load_path_arg(movie_id=movie_id)
-    movies.load_query(country=country)
-    return movies.request()
+    return _ENDPOINTS["movie-alternative-titles"].request(
+        {"movie_id": movie_id}, {"country": country}
+    )
 
 
 def changes(movie_id: str, start_date="", end_date="", page=1) -> dict:
@@ -210,35 +194,24 @@ def changes(movie_id: str, start_date="", end_date="", page=1) -> dict:
     `start_date` and `start_date` is lte and gte
     Format: YYYY-MM-DD
     """
-    movies = _Movies(_MOVIES_V3)
-    movies.reset()
-    movies.use("movie-changes")
-    movies.load_path_arg(movie_id=movie_id)
     if start_date != "":
         type_checking("date", start_date)
-        movies.load_query(start_date=start_date)
     if end_date != "":
         type_checking("date", end_date)
-        movies.load_query(end_date=end_date)
-    movies.load_query(page=page)
-    return movies.request()
+    return _ENDPOINTS["movie-changes"].request(
+        {"movie_id": movie_id},
+        {"start_date": start_date or None, "end_date": end_date or None, "page": page},
+    )
 
 
 def credits(movie_id: str, language: str = None) -> dict:
-    movies = _Movies(_MOVIES_V3)
-    movies.reset()
-    movies.use("movie-credits")
-    movies.load_path_arg(movie_id=movie_id)
-    movies.language(language)
-    return movies.request()
+    return _ENDPOINTS["movie-credits"].request(
+        {"movie_id": movie_id}, {"language": default_language(language)}
+    )
 
 
 def external_ids(movie_id: str) -> dict:
-    movies = _Movies(_MOVIES_V3)
-    movies.reset()
-    movies.use("movie-external-ids")
-    movies.load_path_arg(movie_id=movie_id)
-    return movies.request()
+    return _ENDPOINTS["movie-external-ids"].request({"movie_id": movie_id})
 
 
 def images(
@@ -250,108 +223,69 @@ def images(
     specify a comma separated list of ISO-639-1 values to query,
     for example: en,null
     """
-    movies = _Movies(_MOVIES_V3)
-    movies.reset()
-    movies.use("movie-images")
-    movies.load_path_arg(movie_id=movie_id)
-    movies.language(language)
-    if include_image_language is not None:
-        movies.load_query(include_image_language=include_image_language)
-    return movies.request()
+    return _ENDPOINTS["movie-images"].request(
+        {"movie_id": movie_id},
+        {
+            "language": default_language(language),
+            "include_image_language": include_image_language,
+        },
+    )
 
 
 def keywords(movie_id: str) -> dict:
-    movies = _Movies(_MOVIES_V3)
-    movies.reset()
-    movies.use("movie-keywords")
-    movies.load_path_arg(movie_id=movie_id)
-    return movies.request()
+    return _ENDPOINTS["movie-keywords"].request({"movie_id": movie_id})
 
 
 def latest() -> dict:
     """Get the newest movie ID."""
-    movies = _Movies(_MOVIES_V3)
-    movies.reset()
-    movies.use("movie-latest-id")
-    return movies.request()
+    return _ENDPOINTS["movie-latest-id"].request()
 
 
 def lists(movie_id: str, page=1, language: str = None) -> dict:
-    movies = _Movies(_MOVIES_V3)
-    movies.reset()
-    movies.use("movie-lists")
-    movies.load_path_arg(movie_id=movie_id)
-    movies.language(language)
-    movies.load_query(page=page)
-    return movies.request()
+    return _ENDPOINTS["movie-lists"].request(
+        {"movie_id": movie_id}, {"language": default_language(language), "page": page}
+    )
 
 
 def recommendations(movie_id: str, page=1, language: str = None) -> dict:
-    movies = _Movies(_MOVIES_V3)
-    movies.reset()
-    movies.use("movie-recommendations")
-    movies.load_path_arg(movie_id=movie_id)
-    movies.language(language)
-    movies.load_query(page=page)
-    return movies.request()
+    return _ENDPOINTS["movie-recommendations"].request(
+        {"movie_id": movie_id}, {"language": default_language(language), "page": page}
+    )
 
 
 def release_dates(movie_id: str) -> dict:
     """Get the release dates and certifications for a movie."""
-    movies = _Movies(_MOVIES_V3)
-    movies.reset()
-    movies.use("movie-release-dates")
-    movies.load_path_arg(movie_id=movie_id)
-    return movies.request()
+    return _ENDPOINTS["movie-release-dates"].request({"movie_id": movie_id})
 
 
 def reviews(movie_id: str, page=1, language: str = None) -> dict:
     """Get the user reviews for a movie."""
-    movies = _Movies(_MOVIES_V3)
-    movies.reset()
-    movies.use("movie-reviews")
-    movies.load_path_arg(movie_id=movie_id)
-    movies.language(language)
-    movies.load_query(page=page)
-    return movies.request()
+    return _ENDPOINTS["movie-reviews"].request(
+        {"movie_id": movie_id}, {"language": default_language(language), "page": page}
+    )
 
 
 def similar(movie_id: str, page=1, language: str = None) -> dict:
     """Get the similar movies based on genres and " "keywords."""
-    movies = _Movies(_MOVIES_V3)
-    movies.reset()
-    movies.use("movie-similar")
-    movies.load_path_arg(movie_id=movie_id)
-    movies.language(language)
-    movies.load_query(page=page)
-    return movies.request()
+    return _ENDPOINTS["movie-similar"].request(
+        {"movie_id": movie_id}, {"language": default_language(language), "page": page}
+    )
 
 
 def translations(movie_id: str) -> dict:
     """Get the translations for a movie."""
-    movies = _Movies(_MOVIES_V3)
-    movies.reset()
-    movies.use("movie-translations")
-    movies.load_path_arg(movie_id=movie_id)
-    return movies.request()
+    return _ENDPOINTS["movie-translations"].request({"movie_id": movie_id})
 
 
 def videos(movie_id: str, language: str = None) -> dict:
-    movies = _Movies(_MOVIES_V3)
-    movies.reset()
-    movies.use("movie-videos")
-    movies.load_path_arg(movie_id=movie_id)
-    movies.language(language)
-    return movies.request()
+    return _ENDPOINTS["movie-videos"].request(
+        {"movie_id": movie_id}, {"language": default_language(language)}
+    )
 
 
 def watch_providers(movie_id: str) -> dict:
     """Get the list of streaming providers we have for a movie."""
-    movies = _Movies(_MOVIES_V3)
-    movies.reset()
-    movies.use("movie-watch-providers")
-    movies.load_path_arg(movie_id=movie_id)
-    return movies.request()
+    return _ENDPOINTS["movie-watch-providers"].request({"movie_id": movie_id})
 
 
 def add_rating(movie_id: str, rating: int, guest_session_id: str = None) -> dict:
@@ -359,21 +293,14 @@ def add_rating(movie_id: str, rating: int, guest_session_id: str = None) -> dict
 
     rating: 0~10
     """
-    movies = _Movies(_MOVIES_V3)
     type_checking("rating", rating)
-    movies.reset()
-    movies.use("movie-add-rating")
-    movies.load_path_arg(movie_id=movie_id)
-    movies.choose_session_id(guest_session_id)
-    movies.load_json({"value": rating})
-    return movies.request()
+    return _ENDPOINTS["movie-add-rating"].request(
+        {"movie_id": movie_id}, session_query(guest_session_id), json={"value": rating}
+    )
 
 
 def delete_rating(movie_id: str, guest_session_id: str = None) -> dict:
     """Delete a user rating."""
-    movies = _Movies(_MOVIES_V3)
-    movies.reset()
-    movies.use("movie-delete-rating")
-    movies.load_path_arg(movie_id=movie_id)
-    movies.choose_session_id(guest_session_id)
-    return movies.request()
+    return _ENDPOINTS["movie-delete-rating"].request(
+        {"movie_id": movie_id}, session_query(guest_session_id)
+    )
@@ -4,7 +4,7 @@ The network id is available at: http://files.tmdb.org/p/exports/tv_network_ids_M
 More information: https://developer.themoviedb.org/docs/daily-id-exports
 """
 
-from tmdbapi._core import Tmdb
+from tmdbapi._core import compile_endpoints
 
 # The names of keys in the dictionary might be incorrect,
 # but the TMDB API documentation hasn't been corrected yet.
@@ -27,40 +27,18 @@ _NETWORKS_V3 = {
 }
 
 
-class _Networks(Tmdb):
-    def __init__(self, info_var):
-        super().__init__()
-        self.category_path = "/network"
-        self.info_var = info_var
-
-    def request(self) -> dict:
-        url = self.build_url(3)
-        return self.request_raw(
-            url=url,
-        )
+_ENDPOINTS = compile_endpoints(_NETWORKS_V3, 3, "/network")
 
 
 def details(network_id: int) -> dict:
-    networks = _Networks(_NETWORKS_V3)
-    networks.reset()
-    networks.use("network-details")
-    networks.load_path_arg(network_id=network_id)
-    return networks.request()
+    return _ENDPOINTS["network-details"].request({"network_id": network_id})
 
 
 def alternative_names(network_id: int) -> dict:
     """Get the alternative names of a network."""
-    networks = _Networks(_NETWORKS_V3)
-    networks.reset()
-    networks.use("details-copy")
-    networks.load_path_arg(network_id=network_id)
-    return networks.request()
+    return _ENDPOINTS["details-copy"].request({"network_id": network_id})
 
 
 def images(network_id: int) -> dict:
     """Get the TV network logos by id."""
-    networks = _Networks(_NETWORKS_V3)
-    networks.reset()
-    networks.use("alternative-names-copy")
-    networks.load_path_arg(network_id=network_id)
-    return networks.request()
+    return _ENDPOINTS["alternative-names-copy"].request({"network_id": network_id})
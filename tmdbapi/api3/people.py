@@ -2,7 +2,7 @@
 
 """
 
-from tmdbapi._core import Tmdb
+from tmdbapi._core import compile_endpoints, default_language
 from tmdbapi.exceptions import ServiceDeprecationWarning, type_checking
 
 _PEOPLE_V3 = {
@@ -84,40 +84,27 @@ _PEOPLE_V3 = {
 }
 
 
-class _People(Tmdb):
-    def __init__(self, info_var):
-        super().__init__()
-        self.category_path = "/person"
-        self.info_var = info_var
-
-    def request(self) -> dict:
-        url = self.build_url(3)
-        return self.request_raw(
-            url=url,
-        )
+_ENDPOINTS = compile_endpoints(_PEOPLE_V3, 3, "/person")
 
 
 def popular(page=1, language: str = None) -> dict:
     """Get a list of people ordered by popularity."""
-    people = _People(_PEOPLE_V3)
-    people.reset()
-    people.use("person-popular-list")
-    people.language(language)
-    people.load_query(page=page)
-    return people.request()
+    return _ENDPOINTS["person-popular-list"].request(
+        None, {"language": default_language(language), "page": page}
+    )
 
 
 def details(
     person_id: int, append_to_response="videos,images", language: str = None
 ) -> dict:
     """Query the top level details of a person."""
-    people = _People(_PEOPLE_V3)
-    people.reset()
-    people.use("person-details")
-    people.load_path_arg(person_id=person_id)
-    people.language(language)
-    people.load_query(append_to_response=append_to_response)
-    return people.request()
+    return _ENDPOINTS["person-details"].request(
+        {"person_id": person_id},
+        {
+            "language": default_language(language),
+            "append_to_response": append_to_response,
+        },
+    )
 
 
 def changes(person_id: int, start_date="", end_date="", page=1) -> dict:
@@ -126,93 +113,62 @@ def changes(person_id: int, start_date="", end_date="", page=1) -> dict:
     `start_date` and `start_date` is lte and gte
     Format: YYYY-MM-DD
     """
-    people = _People(_PEOPLE_V3)
-    people.reset()
-    people.use("person-changes")
-    people.load_path_arg(person_id=person_id)
     if start_date != "":
         type_checking("date", start_date)
-        people.load_query(start_date=start_date)
     if end_date != "":
         type_checking("date", end_date)
-        people.load_query(end_date=end_date)
-    people.load_query(page=page)
-    return people.request()
+    return _ENDPOINTS["person-changes"].request(
+        {"person_id": person_id},
+        {"start_date": start_date or None, "end_date": end_date or None, "page": page},
+    )
 
 
 def combined_credits(person_id: int, language: str = None) -> dict:
     """Get the combined movie and TV credits that belong to a person."""
-    people = _People(_PEOPLE_V3)
-    people.reset()
-    people.use("person-combined-credits")
-    people.load_path_arg(person_id=person_id)
-    people.language(language)
-    return people.request()
+    return _ENDPOINTS["person-combined-credits"].request(
+        {"person_id": person_id}, {"language": default_language(language)}
+    )
 
 
 def external_ids(person_id: int) -> dict:
     """Get the external ID's that belong to a person."""
-    people = _People(_PEOPLE_V3)
-    people.reset()
-    people.use("person-external-ids")
-    people.load_path_arg(person_id=person_id)
-    return people.request()
+    return _ENDPOINTS["person-external-ids"].request({"person_id": person_id})
 
 
 def images(person_id: int) -> dict:
     """Get the profile images that belong to a person."""
-    people = _People(_PEOPLE_V3)
-    people.reset()
-    people.use("person-images")
-    people.load_path_arg(person_id=person_id)
-    return people.request()
+    return _ENDPOINTS["person-images"].request({"person_id": person_id})
 
 
 def latest() -> dict:
     """Get the newest created person. This is a live response and
     will continuously change.
     """
-    people = _People(_PEOPLE_V3)
-    people.reset()
-    people.use("person-latest-id")
-    return people.request()
+    return _ENDPOINTS["person-latest-id"].request()
 
 
 def movie_credits(person_id: int, language: str = None) -> dict:
     """Get the movie credits for a person."""
-    people = _People(_PEOPLE_V3)
-    people.reset()
-    people.use("person-movie-credits")
-    people.load_path_arg(person_id=person_id)
-    people.language(language)
-    return people.request()
+    return _ENDPOINTS["person-movie-credits"].request(
+        {"person_id": person_id}, {"language": default_language(language)}
+    )
 
 
 def tv_credits(person_id: int, language: str = None) -> dict:
     """Get the TV credits that belong to a person."""
-    people = _People(_PEOPLE_V3)
-    people.reset()
-    people.use("person-tv-credits")
-    people.load_path_arg(person_id=person_id)
-    people.language(language)
-    return people.request()
+    return _ENDPOINTS["person-tv-credits"].request(
+        {"person_id": person_id}, {"language": default_language(language)}
+    )
 
 
 def tagged_images(person_id: int, page=1) -> dict:
     """Get the tagged images for a person."""
-    people = _People(_PEOPLE_V3)
     ServiceDeprecationWarning("people.tagged_images method is deprecated.")
-    people.reset()
-    people.use("person-tagged-images")
-    people.load_path_arg(person_id=person_id)
-    people.load_query(page=page)
-    return people.request()
+    return _ENDPOINTS["person-tagged-images"].request(
+        {"person_id": person_id}, {"page": page}
+    )
 
 
 def translations(person_id: int) -> dict:
     """Get the translations that belong to a person."""
-    people = _People(_PEOPLE_V3)
-    people.reset()
-    people.use("translations")
-    people.load_path_arg(person_id=person_id)
-    return people.request()
+    return _ENDPOINTS["translations"].request({"person_id": person_id})
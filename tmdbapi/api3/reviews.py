@@ -2,7 +2,7 @@
 
 """
 
-from tmdbapi._core import Tmdb
+from tmdbapi._core import compile_endpoints
 
 _REVIEWS_V3 = {
     "review-details": {
@@ -13,23 +13,9 @@ _REVIEWS_V3 = {
 }
 
 
-class _Review(Tmdb):
-    def __init__(self, info_var):
-        super().__init__()
-        self.category_path = "/review"
-        self.info_var = info_var
-
-    def request(self) -> dict:
-        url = self.build_url(3)
-        return self.request_raw(
-            url=url,
-        )
+_ENDPOINTS = compile_endpoints(_REVIEWS_V3, 3, "/review")
 
 
 def details(review_id: str) -> dict:
     """Retrieve the details of a movie or TV show review."""
-    review = _Review(_REVIEWS_V3)
-    review.reset()
-    review.use("review-details")
-    review.load_path_arg(review_id=review_id)
-    return review.request()
+    return _ENDPOINTS["review-details"].request({"review_id": review_id})
@@ -4,7 +4,7 @@ query: Use '+' between the keywords
     For more information: https://developer.themoviedb.org/docs/search-and-query-for-details
 """
 
-from tmdbapi._core import Tmdb
+from tmdbapi._core import compile_endpoints, default_language, default_region
 from tmdbapi.exceptions import type_checking
 
 _SEARCH_V3 = {
@@ -77,17 +77,7 @@ _SEARCH_V3 = {
 }
 
 
-class _Search(Tmdb):
-    def __init__(self, info_var):
-        super().__init__()
-        self.category_path = "/search"
-        self.info_var = info_var
-
-    def request(self) -> dict:
-        url = self.build_url(3)
-        return self.request_raw(
-            url=url,
-        )
+_ENDPOINTS = compile_endpoints(_SEARCH_V3, 3, "/search")
 
 
 def collections(
@@ -96,31 +86,26 @@ def collections(
     """Search for collections by their original, translated and
     alternative names.
     """
-    search = _Search(_SEARCH_V3)
-    search.reset()
-    search.use("search-collection")
-    search.language(language)
-    search.region(region)
-    search.load_query({"query": query}, include_adult=include_adult, page=page)
-    return search.request()
+    return _ENDPOINTS["search-collection"].request(
+        None,
+        {
+            "language": default_language(language),
+            "region": default_region(region),
+            "query": query,
+            "include_adult": include_adult,
+            "page": page,
+        },
+    )
 
 
 def companies(query: str, page=1) -> dict:
     """Search for companies by their original and alternative names."""
-    search = _Search(_SEARCH_V3)
-    search.reset()
-    search.use("search-company")
-    search.load_query({"query": query}, page=page)
-    return search.request()
+    return _ENDPOINTS["search-company"].request(None, {"query": query, "page": page})
 
 
 def keywords(query: str, page=1) -> dict:
     """Search for keywords by their name."""
-    search = _Search(_SEARCH_V3)
-    search.reset()
-    search.use("search-keyword")
-    search.load_query({"query": query}, page=page)
-    return search.request()
+    return _ENDPOINTS["search-keyword"].request(None, {"query": query, "page": page})
 
 
 def movies(
@@ -135,41 +120,50 @@ def movies(
     """Search for movies by their original, translated and
     alternative titles.
     """
-    search = _Search(_SEARCH_V3)
-    search.reset()
-    search.use("search-movie")
-    search.language(language)
-    search.region(region)
-    search.load_query({"query": query}, include_adult=include_adult, page=page)
     if year != "":
         type_checking("year", year)
-        search.load_query(year=year)
     if primary_release_year != "":
         type_checking("year", primary_release_year)
-        search.load_query(primary_release_year=primary_release_year)
-    return search.request()
+    return _ENDPOINTS["search-movie"].request(
+        None,
+        {
+            "language": default_language(language),
+            "region": default_region(region),
+            "query": query,
+            "include_adult": include_adult,
+            "page": page,
+            "year": year or None,
+            "primary_release_year": primary_release_year or None,
+        },
+    )
 
 
 def multi(query: str, include_adult=False, language: str = None, page=1) -> dict:
     """Use multi search when you want to search for movies,
     TV shows and people in a single request.
     """
-    search = _Search(_SEARCH_V3)
-    search.reset()
-    search.use("search-multi")
-    search.language(language)
-    search.load_query({"query": query}, include_adult=include_adult, page=page)
-    return search.request()
+    return _ENDPOINTS["search-multi"].request(
+        None,
+        {
+            "language": default_language(language),
+            "query": query,
+            "include_adult": include_adult,
+            "page": page,
+        },
+    )
 
 
 def person(query: str, include_adult=False, language: str = None, page=1) -> dict:
     """Search for people by their name and also " "known as names."""
-    search = _Search(_SEARCH_V3)
-    search.reset()
-    search.use("search-person")
-    search.language(language)
-    search.load_query({"query": query}, include_adult=include_adult, page=page)
-    return search.request()
+    return _ENDPOINTS["search-person"].request(
+        None,
+        {
+            "language": default_language(language),
+            "query": query,
+            "include_adult": include_adult,
+            "page": page,
+        },
+    )
 
 
 def tv(
@@ -183,15 +177,18 @@ def tv(
     """Search for TV shows by their original, translated and also
     known as names.
     """
-    search = _Search(_SEARCH_V3)
-    search.reset()
-    search.use("search-tv")
-    search.language(language)
-    search.load_query({"query": query}, include_adult=include_adult, page=page)
     if year != "":
         type_checking("year", year)
-        search.load_query(year=year)
     if first_air_date_year != "":
         type_checking("year", first_air_date_year)
-        search.load_query(first_air_date_year=first_air_date_year)
-    return search.request()
+    return _ENDPOINTS["search-tv"].request(
+        None,
+        {
+            "language": default_language(language),
+            "query": query,
+            "include_adult": include_adult,
+            "page": page,
+            "year": year or None,
+            "first_air_date_year": first_air_date_year or None,
+        },
+    )
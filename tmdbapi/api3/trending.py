@@ -2,7 +2,7 @@
 
 """
 
-from tmdbapi._core import Tmdb
+from tmdbapi._core import compile_endpoints, default_language
 from tmdbapi.exceptions import type_checking
 
 _TRENDING_V3 = {
@@ -41,25 +41,15 @@ _TRENDING_V3 = {
 }
 
 
-class _Trending(Tmdb):
-    def __init__(self, info_var):
-        super().__init__()
-        self.category_path = "/trending"
-        self.info_var = info_var
+_ENDPOINTS = compile_endpoints(_TRENDING_V3, 3, "/trending")
 
-    def request(self) -> dict:
-        url = self.build_url(3)
-        return self.request_raw(
-            url=url,
-        )
 
-    def get(self, use_name, time_window, language) -> dict:
-        """Wrap for the same process"""
-        self.reset()
-        self.use(use_name)
-        self.load_path_arg(time_window=time_window)
-        self.language(language)
-        return self.request()
+def _get(name: str, time_window, language) -> dict:
+    """Wrap for the same process"""
+    type_checking("time_window", time_window)
+    return _ENDPOINTS[name].request(
+        {"time_window": time_window}, {"language": default_language(language)}
+    )
 
 
 def all(time_window="day", language: str = None) -> dict:
@@ -67,27 +57,19 @@ def all(time_window="day", language: str = None) -> dict:
 
     time_window: 'day' or 'week'
     """
-    trending = _Trending(_TRENDING_V3)
-    type_checking("time_window", time_window)
-    return trending.get("trending-all", time_window, language)
+    return _get("trending-all", time_window, language)
 
 
 def movies(time_window="day", language: str = None) -> dict:
     """Get the trending movies on TMDB."""
-    trending = _Trending(_TRENDING_V3)
-    type_checking("time_window", time_window)
-    return trending.get("trending-movies", time_window, language)
+    return _get("trending-movies", time_window, language)
 
 
 def people(time_window="day", language: str = None) -> dict:
     """Get the trending people on TMDB."""
-    trending = _Trending(_TRENDING_V3)
-    type_checking("time_window", time_window)
-    return trending.get("trending-people", time_window, language)
+    return _get("trending-people", time_window, language)
 
 
 def tv(time_window="day", language: str = None) -> dict:
     """Get the trending TV shows on TMDB."""
-    trending = _Trending(_TRENDING_V3)
-    type_checking("time_window", time_window)
-    return trending.get("trending-tv", time_window, language)
+    return _get("trending-tv", time_window, language)
@@ -2,7 +2,7 @@
 
 """
 
-from tmdbapi._core import Tmdb
+from tmdbapi._core import compile_endpoints
 
 _TV_EPISODE_GROUPS_V3 = {
     "tv-episode-group-details": {
@@ -13,23 +13,11 @@ _TV_EPISODE_GROUPS_V3 = {
 }
 
 
-class _Group(Tmdb):
-    def __init__(self, info_var):
-        super().__init__()
-        self.category_path = "/tv/episode_group"
-        self.info_var = info_var
-
-    def request(self) -> dict:
-        url = self.build_url(3)
-        return self.request_raw(
-            url=url,
-        )
+_ENDPOINTS = compile_endpoints(_TV_EPISODE_GROUPS_V3, 3, "/tv/episode_group")
 
 
 def details(tv_episode_group_id: str) -> dict:
     """Get the details of a TV episode group."""
-    group = _Group(_TV_EPISODE_GROUPS_V3)
-    group.reset()
-    group.use("tv-episode-group-details")
-    group.load_path_arg(tv_episode_group_id=tv_episode_group_id)
-    return group.request()
+    return _ENDPOINTS["tv-episode-group-details"].request(
+        {"tv_episode_group_id": tv_episode_group_id}
+    )
@@ -2,7 +2,7 @@
 
 """
 
-from tmdbapi._core import Tmdb
+from tmdbapi._core import compile_endpoints, default_language, session_query
 from tmdbapi.exceptions import type_checking
 
 _TV_EPISODES_V3 = {
@@ -111,17 +111,7 @@ _TV_EPISODES_V3 = {
 }
 
 
-class _TvEpisodes(Tmdb):
-    def __init__(self, info_var):
-        super().__init__()
-        self.category_path = "/tv"
-        self.info_var = info_var
-
-    def request(self) -> dict:
-        url = self.build_url(3)
-        return self.request_raw(
-            url=url,
-        )
+_ENDPOINTS = compile_endpoints(_TV_EPISODES_V3, 3, "/tv")
 
 
 def details(
@@ -132,15 +122,17 @@ def details(
     language: str = None,
 ) -> dict:
     """Query the details of a TV episode."""
-    tv_episodes = _TvEpisodes(_TV_EPISODES_V3)
-    tv_episodes.reset()
-    tv_episodes.use("tv-episode-details")
-    tv_episodes.load_path_arg(
-        series_id=series_id, season_number=season_number, episode_number=episode_number
+    return _ENDPOINTS["tv-episode-details"].request(
+        {
+            "series_id": series_id,
+            "season_number": season_number,
+            "episode_number": episode_number,
+        },
+        {
+            "language": default_language(language),
+            "append_to_response": append_to_response,
+        },
     )
-    tv_episodes.language(language)
-    tv_episodes.load_query(append_to_response=append_to_response)
-    return tv_episodes.request()
 
 
 def account_states(
@@ -150,47 +142,43 @@ def account_states(
     guest_session_id: str = None,
 ) -> dict:
     """Get the rating, watchlist and " "favorite status."""
-    tv_episodes = _TvEpisodes(_TV_EPISODES_V3)
-    tv_episodes.reset()
-    tv_episodes.use("tv-episode-account-states")
-    tv_episodes.load_path_arg(
-        series_id=series_id, season_number=season_number, episode_number=episode_number
+    return _ENDPOINTS["tv-episode-account-states"].request(
+        {
+            "series_id": series_id,
+            "season_number": season_number,
+            "episode_number": episode_number,
+        },
+        session_query(guest_session_id),
     )
-    tv_episodes.choose_session_id(guest_session_id)
-    return tv_episodes.request()
 
 
 def changes(episode_id: int) -> dict:
     """Get the recent changes for a TV episode."""
-    tv_episodes = _TvEpisodes(_TV_EPISODES_V3)
-    tv_episodes.reset()
-    tv_episodes.use("tv-episode-changes-by-id")
-    tv_episodes.load_path_arg(episode_id=episode_id)
-    return tv_episodes.request()
+    return _ENDPOINTS["tv-episode-changes-by-id"].request({"episode_id": episode_id})
 
 
 def credits(
     series_id: int, season_number: int, episode_number: int, language: str = None
 ) -> dict:
-    tv_episodes = _TvEpisodes(_TV_EPISODES_V3)
-    tv_episodes.reset()
-    tv_episodes.use("tv-episode-credits")
-    tv_episodes.load_path_arg(
-        series_id=series_id, season_number=season_number, episode_number=episode_number
+    return _ENDPOINTS["tv-episode-credits"].request(
+        {
+            "series_id": series_id,
+            "season_number": season_number,
+            "episode_number": episode_number,
+        },
+        {"language": default_language(language)},
     )
-    tv_episodes.language(language)
-    return tv_episodes.request()
 
 
 def external_ids(series_id: int, season_number: int, episode_number: int) -> dict:
     """Get a list of external IDs that have been added to a TV episode."""
-    tv_episodes = _TvEpisodes(_TV_EPISODES_V3)
-    tv_episodes.reset()
-    tv_episodes.use("tv-episode-external-ids")
-    tv_episodes.load_path_arg(
-        series_id=series_id, season_number=season_number, episode_number=episode_number
+    return _ENDPOINTS["tv-episode-external-ids"].request(
+        {
+            "series_id": series_id,
+            "season_number": season_number,
+            "episode_number": episode_number,
+        }
     )
-    return tv_episodes.request()
 
 
 def images(
@@ -206,27 +194,28 @@ def images(
     specify a comma separated list of ISO-639-1 values to query,
     for example: en,null
     """
-    tv_episodes = _TvEpisodes(_TV_EPISODES_V3)
-    tv_episodes.reset()
-    tv_episodes.use("tv-episode-images")
-    tv_episodes.load_path_arg(
-        series_id=series_id, season_number=season_number, episode_number=episode_number
+    return _ENDPOINTS["tv-episode-images"].request(
+        {
+            "series_id": series_id,
+            "season_number": season_number,
+            "episode_number": episode_number,
+        },
+        {
+            "language": default_language(language),
+            "include_image_language": include_image_language,
+        },
     )
-    tv_episodes.language(language)
-    if include_image_language is not None:
-        tv_episodes.load_query(include_image_language=include_image_language)
-    return tv_episodes.request()
 
 
 def translations(series_id: int, season_number: int, episode_number: int) -> dict:
     """Get the translations that have been added to a TV episode."""
-    tv_episodes = _TvEpisodes(_TV_EPISODES_V3)
-    tv_episodes.reset()
-    tv_episodes.use("tv-episode-translations")
-    tv_episodes.load_path_arg(
-        series_id=series_id, season_number=season_number, episode_number=episode_number
+    return _ENDPOINTS["tv-episode-translations"].request(
+        {
+            "series_id": series_id,
+            "season_number": season_number,
+            "episode_number": episode_number,
+        }
     )
-    return tv_episodes.request()
 
 
 def videos(
@@ -241,16 +230,17 @@ def videos(
     include_video_language:
     filter the list results by language, supports more than one value by using a comma
     """
-    tv_episodes = _TvEpisodes(_TV_EPISODES_V3)
-    tv_episodes.reset()
-    tv_episodes.use("tv-episode-videos")
-    tv_episodes.load_path_arg(
-        series_id=series_id, season_number=season_number, episode_number=episode_number
+    return _ENDPOINTS["tv-episode-videos"].request(
+        {
+            "series_id": series_id,
+            "season_number": season_number,
+            "episode_number": episode_number,
+        },
+        {
+            "language": default_language(language),
+            "include_video_language": include_video_language,
+        },
     )
-    tv_episodes.language(language)
-    if include_video_language is not None:
-        tv_episodes.load_query(include_video_language=include_video_language)
-    return tv_episodes.request()
 
 
 def add_rating(
@@ -264,16 +254,16 @@ def add_rating(
 
     rating: 0~10
     """
-    tv_episodes = _TvEpisodes(_TV_EPISODES_V3)
     type_checking("rating", rating)
-    tv_episodes.reset()
-    tv_episodes.use("tv-episode-add-rating")
-    tv_episodes.load_path_arg(
-        series_id=series_id, season_number=season_number, episode_number=episode_number
+    return _ENDPOINTS["tv-episode-add-rating"].request(
+        {
+            "series_id": series_id,
+            "season_number": season_number,
+            "episode_number": episode_number,
+        },
+        session_query(guest_session_id),
+        json={"value": rating},
     )
-    tv_episodes.choose_session_id(guest_session_id)
-    tv_episodes.load_json({"value": rating})
-    return tv_episodes.request()
 
 
 def delete_rating(
@@ -283,11 +273,11 @@ def delete_rating(
     guest_session_id: str = None,
 ) -> dict:
     """Delete your rating on a TV episode."""
-    tv_episodes = _TvEpisodes(_TV_EPISODES_V3)
-    tv_episodes.reset()
-    tv_episodes.use("tv-episode-delete-rating")
-    tv_episodes.load_path_arg(
-        series_id=series_id, season_number=season_number, episode_number=episode_number
+    return _ENDPOINTS["tv-episode-delete-rating"].request(
+        {
+            "series_id": series_id,
+            "season_number": season_number,
+            "episode_number": episode_number,
+        },
+        session_query(guest_session_id),
     )
-    tv_episodes.choose_session_id(guest_session_id)
-    return tv_episodes.request()
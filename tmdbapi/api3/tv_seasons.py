@@ -2,7 +2,7 @@
 
 """
 
-from tmdbapi._core import Tmdb
+from tmdbapi._core import compile_endpoints, default_language, session_query
 from tmdbapi.exceptions import type_checking
 
 _TV_SEASONS_V3 = {
@@ -102,17 +102,7 @@ _TV_SEASONS_V3 = {
 }
 
 
-class _TvSeasons(Tmdb):
-    def __init__(self, info_var):
-        super().__init__()
-        self.category_path = "/tv"
-        self.info_var = info_var
-
-    def request(self) -> dict:
-        url = self.build_url(3)
-        return self.request_raw(
-            url=url,
-        )
+_ENDPOINTS = compile_endpoints(_TV_SEASONS_V3, 3, "/tv")
 
 
 def details(
@@ -122,37 +112,33 @@ def details(
     language: str = None,
 ) -> dict:
     """Query the details of a TV season."""
-    tv_seasons = _TvSeasons(_TV_SEASONS_V3)
-    tv_seasons.reset()
-    tv_seasons.use("tv-season-details")
-    tv_seasons.load_path_arg(series_id=series_id, season_number=season_number)
-    tv_seasons.language(language)
-    tv_seasons.load_query(append_to_response=append_to_response)
-    return tv_seasons.request()
+    return _ENDPOINTS["tv-season-details"].request(
+        {"series_id": series_id, "season_number": season_number},
+        {
+            "language": default_language(language),
+            "append_to_response": append_to_response,
+        },
+    )
 
 
 def account_states(
     series_id: int, season_number: int, guest_session_id: str = None
 ) -> dict:
     """Get the rating, watchlist and " "favorite status."""
-    tv_seasons = _TvSeasons(_TV_SEASONS_V3)
-    tv_seasons.reset()
-    tv_seasons.use("tv-season-account-states")
-    tv_seasons.load_path_arg(series_id=series_id, season_number=season_number)
-    tv_seasons.choose_session_id(guest_session_id)
-    return tv_seasons.request()
+    return _ENDPOINTS["tv-season-account-states"].request(
+        {"series_id": series_id, "season_number": season_number},
+        session_query(guest_session_id),
+    )
 
 
 def aggregate_credits(series_id: int, season_number: int, language: str = None) -> dict:
     """Get the aggregate credits (cast and crew) that have been
     added to a TV season.
     """
-    tv_seasons = _TvSeasons(_TV_SEASONS_V3)
-    tv_seasons.reset()
-    tv_seasons.use("tv-season-aggregate-credits")
-    tv_seasons.load_path_arg(series_id=series_id, season_number=season_number)
-    tv_seasons.language(language)
-    return tv_seasons.request()
+    return _ENDPOINTS["tv-season-aggregate-credits"].request(
+        {"series_id": series_id, "season_number": season_number},
+        {"language": default_language(language)},
+    )
 
 
 def changes(season_id: int, start_date="", end_date="", page=1) -> dict:
@@ -161,36 +147,28 @@ def changes(season_id: int, start_date="", end_date="", page=1) -> dict:
     `start_date` and `start_date` is lte and gte
     Format: YYYY-MM-DD
     """
-    tv_seasons = _TvSeasons(_TV_SEASONS_V3)
-    tv_seasons.reset()
-    tv_seasons.use("tv-season-changes-by-id")
-    tv_seasons.load_path_arg(season_id=season_id)
     if start_date != "":
         type_checking("date", start_date)
-        tv_seasons.load_query(start_date=start_date)
     if end_date != "":
         type_checking("date", end_date)
-        tv_seasons.load_query(end_date=end_date)
-    tv_seasons.load_query(page=page)
-    return tv_seasons.request()
+    return _ENDPOINTS["tv-season-changes-by-id"].request(
+        {"season_id": season_id},
+        {"start_date": start_date or None, "end_date": end_date or None, "page": page},
+    )
 
 
 def credits(series_id: int, season_number: int, language: str = None) -> dict:
-    tv_seasons = _TvSeasons(_TV_SEASONS_V3)
-    tv_seasons.reset()
-    tv_seasons.use("tv-season-credits")
-    tv_seasons.load_path_arg(series_id=series_id, season_number=season_number)
-    tv_seasons.language(language)
-    return tv_seasons.request()
+    return _ENDPOINTS["tv-season-credits"].request(
+        {"series_id": series_id, "season_number": season_number},
+        {"language": default_language(language)},
+    )
 
 
 def external_ids(series_id: int, season_number: int) -> dict:
     """Get a list of external IDs that have been added to a TV season."""
-    tv_seasons = _TvSeasons(_TV_SEASONS_V3)
-    tv_seasons.reset()
-    tv_seasons.use("tv-season-external-ids")
-    tv_seasons.load_path_arg(series_id=series_id, season_number=season_number)
-    return tv_seasons.request()
+    return _ENDPOINTS["tv-season-external-ids"].request(
+        {"series_id": series_id, "season_number": season_number}
+    )
 
 
 def images(
@@ -205,23 +183,20 @@ def images(
     specify a comma separated list of ISO-639-1 values to query,
     for example: en,null
     """
-    tv_seasons = _TvSeasons(_TV_SEASONS_V3)
-    tv_seasons.reset()
-    tv_seasons.use("tv-season-images")
-    tv_seasons.load_path_arg(series_id=series_id, season_number=season_number)
-    tv_seasons.language(language)
-    if include_image_language is not None:
-        tv_seasons.load_query(include_image_language=include_image_language)
-    return tv_seasons.request()
+    return _ENDPOINTS["tv-season-images"].request(
+        {"series_id": series_id, "season_number": season_number},
+        {
+            "language": default_language(language),
+            "include_image_language": include_image_language,
+        },
+    )
 
 
 def translations(series_id: int, season_number: int) -> dict:
     """Get the translations for a TV season."""
-    tv_seasons = _TvSeasons(_TV_SEASONS_V3)
-    tv_seasons.reset()
-    tv_seasons.use("tv-season-translations")
-    tv_seasons.load_path_arg(series_id=series_id, season_number=season_number)
-    return tv_seasons.request()
+    return _ENDPOINTS["tv-season-translations"].request(
+        {"series_id": series_id, "season_number": season_number}
+    )
 
 
 def videos(
@@ -235,21 +210,18 @@ def videos(
     include_video_language:
     filter the list results by language, supports more than one value by using a comma
     """
-    tv_seasons = _TvSeasons(_TV_SEASONS_V3)
-    tv_seasons.reset()
-    tv_seasons.use("tv-season-videos")
-    tv_seasons.load_path_arg(series_id=series_id, season_number=season_number)
-    tv_seasons.language(language)
-    if include_video_language is not None:
-        tv_seasons.load_query(include_video_language=include_video_language)
-    return tv_seasons.request()
+    return _ENDPOINTS["tv-season-videos"].request(
+        {"series_id": series_id, "season_number": season_number},
+        {
+            "language": default_language(language),
+            "include_video_language": include_video_language,
+        },
+    )
 
 
 def watch_providers(series_id: int, season_number: int, language: str = None) -> dict:
     """Get the list of streaming providers we have for a TV season."""
-    tv_seasons = _TvSeasons(_TV_SEASONS_V3)
-    tv_seasons.reset()
-    tv_seasons.use("tv-season-watch-providers")
-    tv_seasons.load_path_arg(series_id=series_id, season_number=season_number)
-    tv_seasons.language(language)
-    return tv_seasons.request()
+    return _ENDPOINTS["tv-season-watch-providers"].request(
+        {"series_id": series_id, "season_number": season_number},
+        {"language": default_language(language)},
+    )
@@ -2,7 +2,7 @@
 
 """
 
-from tmdbapi._core import Tmdb
+from tmdbapi._core import compile_endpoints, default_language, session_query
 from tmdbapi.exceptions import type_checking
 
 _TV_SERIES_V3 = {
@@ -160,17 +160,7 @@ _TV_SERIES_V3 = {
 }
 
 
-class _TvSeries(Tmdb):
-    def __init__(self, info_var):
-        super().__init__()
-        self.category_path = "/tv"
-        self.info_var = info_var
-
-    def request(self) -> dict:
-        url = self.build_url(3)
-        return self.request_raw(
-            url=url,
-        )
+_ENDPOINTS = compile_endpoints(_TV_SERIES_V3, 3, "/tv")
 
 
 def details(
@@ -179,44 +169,34 @@ def details(
     language: str = None,
 ) -> dict:
     """Get the details of a TV show."""
-    tv_series = _TvSeries(_TV_SERIES_V3)
-    tv_series.reset()
-    tv_series.use("tv-series-details")
-    tv_series.load_path_arg(series_id=series_id)
-    tv_series.language(language)
-    tv_series.load_query(append_to_response=append_to_response)
-    return tv_series.request()
+    return _ENDPOINTS["tv-series-details"].request(
+        {"series_id": series_id},
+        {
+            "language": default_language(language),
+            "append_to_response": append_to_response,
+        },
+    )
 
 
 def account_states(series_id: int, guest_session_id: str = None) -> dict:
     """Get the rating, watchlist and favorite status."""
-    tv_series = _TvSeries(_TV_SERIES_V3)
-    tv_series.reset()
-    tv_series.use("tv-series-account-states")
-    tv_series.load_path_arg(series_id=series_id)
-    tv_series.choose_session_id(guest_session_id)
-    return tv_series.request()
+    return _ENDPOINTS["tv-series-account-states"].request(
+        {"series_id": series_id}, session_query(guest_session_id)
+    )
 
 
 def aggregate_credits(series_id: int, language: str = None) -> dict:
     """Get the aggregate credits (cast and crew) that have been added
     to a TV show.
     """
-    tv_series = _TvSeries(_TV_SERIES_V3)
-    tv_series.reset()
-    tv_series.use("tv-series-aggregate-credits")
-    tv_series.load_path_arg(series_id=series_id)
-    tv_series.language(language)
-    return tv_series.request()
+    return _ENDPOINTS["tv-series-aggregate-credits"].request(
+        {"series_id": series_id}, {"language": default_language(language)}
+    )
 
 
 def alternative_titles(series_id: int) -> dict:
     """Get the alternative titles that have been added to a TV show."""
-    tv_series = _TvSeries(_TV_SERIES_V3)
-    tv_series.reset()
-    tv_series.use("tv-series-alternative-titles")
-    tv_series.load_path_arg(series_id=series_id)
-    return tv_series.request()
+    return _ENDPOINTS["tv-series-alternative-titles"].request({"series_id": series_id})
 
 
 def changes(series_id: int, start_date="", end_date="", page=1) -> dict:
@@ -225,55 +205,36 @@ def changes(series_id: int, start_date="", end_date="", page=1) -> dict:
     `start_date` and `start_date` is lte and gte
     Format: YYYY-MM-DD
     """
-    tv_series = _TvSeries(_TV_SERIES_V3)
-    tv_series.reset()
-    tv_series.use("tv-series-changes")
-    tv_series.load_path_arg(series_id=series_id)
     if start_date != "":
         type_checking("date", start_date)
-        tv_series.load_query(start_date=start_date)
     if end_date != "":
         type_checking("date", end_date)
-        tv_series.load_query(end_date=end_date)
-    tv_series.load_query(page=page)
-    return tv_series.request()
+    return _ENDPOINTS["tv-series-changes"].request(
+        {"series_id": series_id},
+        {"start_date": start_date or None, "end_date": end_date or None, "page": page},
+    )
 
 
 def content_ratings(series_id: int) -> dict:
     """Get the content ratings that have been added to a TV show."""
-    tv_series = _TvSeries(_TV_SERIES_V3)
-    tv_series.reset()
-    tv_series.use("tv-series-content-ratings")
-    tv_series.load_path_arg(series_id=series_id)
-    return tv_series.request()
+    return _ENDPOINTS["tv-series-content-ratings"].request({"series_id": series_id})
 
 
 def credits(series_id: int, language: str = None) -> dict:
     """Get the latest season credits of a TV show."""
-    tv_series = _TvSeries(_TV_SERIES_V3)
-    tv_series.reset()
-    tv_series.use("tv-series-credits")
-    tv_series.load_path_arg(series_id=series_id)
-    tv_series.language(language)
-    return tv_series.request()
+    return _ENDPOINTS["tv-series-credits"].request(
+        {"series_id": series_id}, {"language": default_language(language)}
+    )
 
 
 def episode_groups(series_id: int) -> dict:
     """Get the episode groups that have been added to a TV show."""
-    tv_series = _TvSeries(_TV_SERIES_V3)
-    tv_series.reset()
-    tv_series.use("tv-series-episode-groups")
-    tv_series.load_path_arg(series_id=series_id)
-    return tv_series.request()
+    return _ENDPOINTS["tv-series-episode-groups"].request({"series_id": series_id})
 
 
 def external_ids(series_id: int) -> dict:
     """Get a list of external IDs that have been added to a TV show."""
-    tv_series = _TvSeries(_TV_SERIES_V3)
-    tv_series.reset()
-    tv_series.use("tv-series-external-ids")
-    tv_series.load_path_arg(series_id=series_id)
-    return tv_series.request()
+    return _ENDPOINTS["tv-series-external-ids"].request({"series_id": series_id})
 
 
 def images(
@@ -285,81 +246,55 @@ def images(
     specify a comma separated list of ISO-639-1 values to query,
     for example: en,null
     """
-    tv_series = _TvSeries(_TV_SERIES_V3)
-    tv_series.reset()
-    tv_series.use("tv-series-images")
-    tv_series.load_path_arg(series_id=series_id)
-    tv_series.language(language)
-    if include_image_language is not None:
-        tv_series.load_query(include_image_language=include_image_language)
-    return tv_series.request()
+    return _ENDPOINTS["tv-series-images"].request(
+        {"series_id": series_id},
+        {
+            "language": default_language(language),
+            "include_image_language": include_image_language,
+        },
+    )
 
 
 def keywords(series_id: int) -> dict:
     """Get a list of keywords that have been added to a TV show."""
-    tv_series = _TvSeries(_TV_SERIES_V3)
-    tv_series.reset()
-    tv_series.use("tv-series-keywords")
-    tv_series.load_path_arg(series_id=series_id)
-    return tv_series.request()
+    return _ENDPOINTS["tv-series-keywords"].request({"series_id": series_id})
 
 
 def latest() -> dict:
     """Get the newest TV show ID."""
-    tv_series = _TvSeries(_TV_SERIES_V3)
-    tv_series.reset()
-    tv_series.use("tv-series-latest-id")
-    return tv_series.request()
+    return _ENDPOINTS["tv-series-latest-id"].request()
 
 
 def recommendations(series_id: int, page=1, language: str = None) -> dict:
-    tv_series = _TvSeries(_TV_SERIES_V3)
-    tv_series.reset()
-    tv_series.use("tv-series-recommendations")
-    tv_series.load_path_arg(series_id=series_id)
-    tv_series.language(language)
-    tv_series.load_query(page=page)
-    return tv_series.request()
+    return _ENDPOINTS["tv-series-recommendations"].request(
+        {"series_id": series_id}, {"language": default_language(language), "page": page}
+    )
 
 
 def reviews(series_id: int, page=1, language: str = None) -> dict:
     """Get the reviews that have been added to a TV show."""
-    tv_series = _TvSeries(_TV_SERIES_V3)
-    tv_series.reset()
-    tv_series.use("tv-series-reviews")
-    tv_series.load_path_arg(series_id=series_id)
-    tv_series.language(language)
-    tv_series.load_query(page=page)
-    return tv_series.request()
+    return _ENDPOINTS["tv-series-reviews"].request(
+        {"series_id": series_id}, {"language": default_language(language), "page": page}
+    )
 
 
 def screened_theatrically(series_id: int) -> dict:
     """Get the seasons and episodes that have screened theatrically."""
-    tv_series = _TvSeries(_TV_SERIES_V3)
-    tv_series.reset()
-    tv_series.use("tv-series-screened-theatrically")
-    tv_series.load_path_arg(series_id=series_id)
-    return tv_series.request()
+    return _ENDPOINTS["tv-series-screened-theatrically"].request(
+        {"series_id": series_id}
+    )
 
 
 def similar(series_id: int, page=1, language: str = None) -> dict:
     """Get the similar TV shows."""
-    tv_series = _TvSeries(_TV_SERIES_V3)
-    tv_series.reset()
-    tv_series.use("tv-series-similar")
-    tv_series.load_path_arg(series_id=series_id)
-    tv_series.language(language)
-    tv_series.load_query(page=page)
-    return tv_series.request()
+    return _ENDPOINTS["tv-series-similar"].request(
+        {"series_id": series_id}, {"language": default_language(language), "page": page}
+    )
 
 
 def translations(series_id: int) -> dict:
     """Get the translations that have been added to a TV show."""
-    tv_series = _TvSeries(_TV_SERIES_V3)
-    tv_series.reset()
-    tv_series.use("tv-series-translations")
-    tv_series.load_path_arg(series_id=series_id)
-    return tv_series.request()
+    return _ENDPOINTS["tv-series-translations"].request({"series_id": series_id})
 
 
 def videos(
@@ -370,23 +305,18 @@ def videos(
     include_video_language:
     filter the list results by language, supports more than one value by using a comma
     """
-    tv_series = _TvSeries(_TV_SERIES_V3)
-    tv_series.reset()
-    tv_series.use("tv-series-videos")
-    tv_series.load_path_arg(series_id=series_id)
-    tv_series.language(language)
-    if include_video_language is not None:
-        tv_series.load_query(include_video_language=include_video_language)
-    return tv_series.request()
+    return _ENDPOINTS["tv-series-videos"].request(
+        {"series_id": series_id},
+        {
+            "language": default_language(language),
+            "include_video_language": include_video_language,
+        },
+    )
 
 
 def watch_providers(series_id: int) -> dict:
     """Get the list of streaming providers we have for a TV show."""
-    tv_series = _TvSeries(_TV_SERIES_V3)
-    tv_series.reset()
-    tv_series.use("tv-series-watch-providers")
-    tv_series.load_path_arg(series_id=series_id)
-    return tv_series.request()
+    return _ENDPOINTS["tv-series-watch-providers"].request({"series_id": series_id})
 
 
 def add_rating(series_id: int, rating: int, guest_session_id: str = None) -> dict:
@@ -394,21 +324,16 @@ def add_rating(series_id: int, rating: int, guest_session_id: str = None) -> dic
 
     rating: 0~10
     """
-    tv_series = _TvSeries(_TV_SERIES_V3)
     type_checking("rating", rating)
-    tv_series.reset()
-    tv_series.use("tv-series-add-rating")
-    tv_series.load_path_arg(series_id=series_id)
-    tv_series.choose_session_id(guest_session_id)
-    tv_series.load_json({"value": rating})
-    return tv_series.request()
+    return _ENDPOINTS["tv-series-add-rating"].request(
+        {"series_id": series_id},
+        session_query(guest_session_id),
+        json={"value": rating},
+    )
 
 
 def delete_rating(series_id: int, guest_session_id: str = None) -> dict:
     """Get the details of a TV show."""
-    tv_series = _TvSeries(_TV_SERIES_V3)
-    tv_series.reset()
-    tv_series.use("tv-series-delete-rating")
-    tv_series.load_path_arg(series_id=series_id)
-    tv_series.choose_session_id(guest_session_id)
-    return tv_series.request()
+    return _ENDPOINTS["tv-series-delete-rating"].request(
+        {"series_id": series_id}, session_query(guest_session_id)
+    )
@@ -2,7 +2,7 @@
 
 """
 
-from tmdbapi._core import Tmdb
+from tmdbapi._core import compile_endpoints, default_language
 
 _TV_SERIES_LISTS_V3 = {
     "tv-series-airing-today-list": {
@@ -42,17 +42,7 @@ _TV_SERIES_LISTS_V3 = {
 }
 
 
-class _TvSeriesLists(Tmdb):
-    def __init__(self, info_var):
-        super().__init__()
-        self.category_path = "/tv"
-        self.info_var = info_var
-
-    def request(self) -> dict:
-        url = self.build_url(3)
-        return self.request_raw(
-            url=url,
-        )
+_ENDPOINTS = compile_endpoints(_TV_SERIES_LISTS_V3, 3, "/tv")
 
 
 def airing_today(page=1, language: str = None, timezone: str = None) -> dict:
@@ -61,14 +51,10 @@ def airing_today(page=1, language: str = None, timezone: str = None) -> dict:
     timezone:
     Get the list of timezones from configuration.timezones
     """
-    tv_series_lists = _TvSeriesLists(_TV_SERIES_LISTS_V3)
-    tv_series_lists.reset()
-    tv_series_lists.use("tv-series-airing-today-list")
-    tv_series_lists.language(language)
-    tv_series_lists.load_query(page=page)
-    if timezone is not None:
-        tv_series_lists.load_query(timezone=timezone)
-    return tv_series_lists.request()
+    return _ENDPOINTS["tv-series-airing-today-list"].request(
+        None,
+        {"language": default_language(language), "page": page, "timezone": timezone},
+    )
 
 
 def on_the_air(page=1, language: str = None, timezone: str = None) -> dict:
@@ -77,30 +63,20 @@ def on_the_air(page=1, language: str = None, timezone: str = None) -> dict:
     timezone:
     Get the list of timezones from configuration.timezones
     """
-    tv_series_lists = _TvSeriesLists(_TV_SERIES_LISTS_V3)
-    tv_series_lists.reset()
-    tv_series_lists.use("tv-series-on-the-air-list")
-    tv_series_lists.language(language)
-    tv_series_lists.load_query(page=page)
-    if timezone is not None:
-        tv_series_lists.load_query(timezone=timezone)
-    return tv_series_lists.request()
+    return _ENDPOINTS["tv-series-on-the-air-list"].request(
+        None,
+        {"language": default_language(language), "page": page, "timezone": timezone},
+    )
 
 
 def popular(page=1, language: str = None) -> dict:
     """Get a list of TV shows ordered by popularity."""
-    tv_series_lists = _TvSeriesLists(_TV_SERIES_LISTS_V3)
-    tv_series_lists.reset()
-    tv_series_lists.use("tv-series-popular-list")
-    tv_series_lists.language(language)
-    tv_series_lists.load_query(page=page)
-    return tv_series_lists.request()
+    return _ENDPOINTS["tv-series-popular-list"].request(
+        None, {"language": default_language(language), "page": page}
+    )
 
 
 def top_rated(page=1, language: str = None) -> dict:
-    tv_series_lists = _TvSeriesLists(_TV_SERIES_LISTS_V3)
-    tv_series_lists.reset()
-    tv_series_lists.use("tv-series-top-rated-list")
-    tv_series_lists.language(language)
-    tv_series_lists.load_query(page=page)
-    return tv_series_lists.request()
+    return _ENDPOINTS["tv-series-top-rated-list"].request(
+        None, {"language": default_language(language), "page": page}
+    )
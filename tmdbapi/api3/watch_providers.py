@@ -2,7 +2,7 @@
 
 """
 
-from tmdbapi._core import Tmdb
+from tmdbapi._core import compile_endpoints, default_language
 
 _WATCH_PROVIDERS_V3 = {
     "watch-provider-tv-list": {
@@ -29,47 +29,27 @@ _WATCH_PROVIDERS_V3 = {
 }
 
 
-class _WatchProviders(Tmdb):
-    def __init__(self, info_var):
-        super().__init__()
-        self.category_path = "/watch/providers"
-        self.info_var = info_var
-
-    def request(self) -> dict:
-        url = self.build_url(3)
-        return self.request_raw(
-            url=url,
-        )
+_ENDPOINTS = compile_endpoints(_WATCH_PROVIDERS_V3, 3, "/watch/providers")
 
 
 def available_regions(language: str = None) -> dict:
     """Get the list of the countries we have watch provider
     (OTT/streaming) data for.
     """
-    watch_providers = _WatchProviders(_WATCH_PROVIDERS_V3)
-    watch_providers.reset()
-    watch_providers.use("watch-providers-available-regions")
-    watch_providers.language(language)
-    return watch_providers.request()
+    return _ENDPOINTS["watch-providers-available-regions"].request(
+        None, {"language": default_language(language)}
+    )
 
 
 def movie_providers(watch_region: str = None, language: str = None) -> dict:
     """Get the list of streaming providers we have for movies."""
-    watch_providers = _WatchProviders(_WATCH_PROVIDERS_V3)
-    watch_providers.reset()
-    watch_providers.use("watch-providers-movie-list")
-    watch_providers.language(language)
-    if watch_region is not None:
-        watch_providers.load_query(watch_region=watch_region)
-    return watch_providers.request()
+    return _ENDPOINTS["watch-providers-movie-list"].request(
+        None, {"language": default_language(language), "watch_region": watch_region}
+    )
 
 
 def tv_providers(watch_region: str = None, language: str = None) -> dict:
     """Get the list of streaming providers we have for TV shows."""
-    watch_providers = _WatchProviders(_WATCH_PROVIDERS_V3)
-    watch_providers.reset()
-    watch_providers.use("watch-provider-tv-list")
-    watch_providers.language(language)
-    if watch_region is not None:
-        watch_providers.load_query(watch_region=watch_region)
-    return watch_providers.request()
+    return _ENDPOINTS["watch-provider-tv-list"].request(
+        None, {"language": default_language(language), "watch_region": watch_region}
+    )
@@ -1,6 +1,13 @@
 """The version 4 of TMDB APIs.
 """
 
-from . import account, auth, lists
+import importlib as _importlib
 
 __all__ = ["account", "auth", "lists"]
+
+
+def __getattr__(name):
+    # the modules are imported on first access (PEP 562)
+    if name in __all__:
+        return _importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f'Package "{__name__}" has no attribute "{name}"')
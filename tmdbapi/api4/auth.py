@@ -2,7 +2,7 @@
 
 """
 
-from tmdbapi._core import Tmdb
+from tmdbapi._core import compile_endpoints
 
 _AUTH_V4 = {
     "auth-create-access-token": {
@@ -23,39 +23,21 @@ _AUTH_V4 = {
 }
 
 
-class _Auth(Tmdb):
-    def __init__(self, info_var):
-        super().__init__()
-        self.category_path = "/auth"
-        self.info_var = info_var
-
-    def request(self) -> dict:
-        url = self.build_url(4)
-        return self.request_raw(
-            url=url,
-        )
+_ENDPOINTS = compile_endpoints(_AUTH_V4, 4, "/auth")
 
 
 def create_access_token(request_token: str) -> dict:
-    auth = _Auth(_AUTH_V4)
-    auth.reset()
-    auth.use("auth-create-access-token")
-    auth.load_json({"request_token": request_token})
-    return auth.request()
+    return _ENDPOINTS["auth-create-access-token"].request(
+        json={"request_token": request_token}
+    )
 
 
 def create_request_token() -> dict:
-    auth = _Auth(_AUTH_V4)
-    auth.reset()
-    auth.use("auth-create-request-token")
-    auth.load_json({"redirect_to": "https://www.themoviedb.org/"})
-    return auth.request()
+    return _ENDPOINTS["auth-create-request-token"].request(
+        json={"redirect_to": "https://www.themoviedb.org/"}
+    )
 
 
 def logout(access_token: str) -> dict:
     """Log out of a session."""
-    auth = _Auth(_AUTH_V4)
-    auth.reset()
-    auth.use("auth-logout")
-    auth.load_json({"access_token": access_token})
-    return auth.request()
+    return _ENDPOINTS["auth-logout"].request(json={"access_token": access_token})
@@ -2,8 +2,7 @@
 
 """
 
-import tmdbapi
-from tmdbapi._core import Tmdb
+from tmdbapi._core import compile_endpoints
 from tmdbapi.exceptions import type_checking
 
 _LISTS_V4 = {
@@ -68,27 +67,12 @@ _LISTS_V4 = {
 }
 
 
-class _Lists(Tmdb):
-    def __init__(self, info_var):
-        super().__init__()
-        self.category_path = "/list"
-        self.info_var = info_var
-
-    def request(self) -> dict:
-        tmdbapi.setting.set(use_access_token=True)
-        url = self.build_url(4)
-        return self.request_raw(
-            url=url,
-        )
+_ENDPOINTS = compile_endpoints(_LISTS_V4, 4, "/list", access_token=True)
 
 
 def details(list_id: int) -> dict:
     """Retrieve a list by id."""
-    lists = _Lists(_LISTS_V4)
-    lists.reset()
-    lists.use("list-details")
-    lists.load_path_arg(list_id=list_id)
-    return lists.request()
+    return _ENDPOINTS["list-details"].request({"list_id": list_id})
 
 
 def add_items(list_id: int, items: list) -> dict:
@@ -136,21 +120,14 @@ def add_items(list_id: int, items: list) -> dict:
     dict
         The response from the API.
     """
-    lists = _Lists(_LISTS_V4)
-    lists.reset()
-    lists.use("list-add-items")
-    lists.load_path_arg(list_id=list_id)
-    lists.load_json(_pack_items(items))
-    return lists.request()
+    return _ENDPOINTS["list-add-items"].request(
+        {"list_id": list_id}, json=_pack_items(items)
+    )
 
 
 def clear(list_id: int) -> dict:
     """Clear all of the items on a list."""
-    lists = _Lists(_LISTS_V4)
-    lists.reset()
-    lists.use("list-clear")
-    lists.load_path_arg(list_id=list_id)
-    return lists.request()
+    return _ENDPOINTS["list-clear"].request({"list_id": list_id})
 
 
 def create(
@@ -194,10 +171,7 @@ def create(
     dict
         return from api
     """
-    lists = _Lists(_LISTS_V4)
     type_checking("list_sort_by", sort_by)
-    lists.reset()
-    lists.use("list-create")
     payload = {
         "description": description,
         "name": name,
@@ -210,28 +184,20 @@ def create(
         payload["iso_639_1"] = language
     if country is not None:
         payload["iso_3166_1"] = country
-    lists.load_json(payload)
-    return lists.request()
+    return _ENDPOINTS["list-create"].request(json=payload)
 
 
 def delete(list_id: int) -> dict:
     """Delete a list."""
-    lists = _Lists(_LISTS_V4)
-    lists.reset()
-    lists.use("list-delete")
-    lists.load_path_arg(list_id=list_id)
-    return lists.request()
+    return _ENDPOINTS["list-delete"].request({"list_id": list_id})
 
 
 def item_status(list_id: int, media_id: int, media_type: str) -> dict:
     """Check if an item is on a list."""
-    lists = _Lists(_LISTS_V4)
     type_checking("media_type", media_type)
-    lists.reset()
-    lists.use("list-item-status")
-    lists.load_path_arg(list_id=list_id)
-    lists.load_query(media_id=media_id, media_type=media_type)
-    return lists.request()
+    return _ENDPOINTS["list-item-status"].request(
+        {"list_id": list_id}, {"media_id": media_id, "media_type": media_type}
+    )
 
 
 def remove_items(list_id: int, items: list) -> dict:
@@ -275,12 +241,9 @@ def remove_items(list_id: int, items: list) -> dict:
     dict
         return from api
     """
-    lists = _Lists(_LISTS_V4)
-    lists.reset()
-    lists.use("list-remove-items")
-    lists.load_path_arg(list_id=list_id)
-    lists.load_json(_pack_items(items))
-    return lists.request()
+    return _ENDPOINTS["list-remove-items"].request(
+        {"list_id": list_id}, json=_pack_items(items)
+    )
 
 
 def update(
@@ -327,11 +290,7 @@ def update(
     dict
         return from api
     """
-    lists = _Lists(_LISTS_V4)
     type_checking("list_sort_by", sort_by)
-    lists.reset()
-    lists.use("list-update")
-    lists.load_path_arg(list_id=list_id)
     payload = {}
     if language is not None:
         payload["iso_639_1"] = language
@@ -345,8 +304,7 @@ def update(
         payload["public"] = public
     if sort_by is not None:
         payload["sort_by"] = sort_by
-    lists.load_json(payload)
-    return lists.request()
+    return _ENDPOINTS["list-update"].request({"list_id": list_id}, json=payload)
 
 
 def update_items(list_id: int, items: list) -> dict:
@@ -395,12 +353,9 @@ def update_items(list_id: int, items: list) -> dict:
     dict
         return from api
     """
-    lists = _Lists(_LISTS_V4)
-    lists.reset()
-    lists.use("list-update-items")
-    lists.load_path_arg(list_id=list_id)
-    lists.load_json(_pack_items(items))
-    return lists.request()
+    return _ENDPOINTS["list-update-items"].request(
+        {"list_id": list_id}, json=_pack_items(items)
+    )
 
 
 def _pack_items(items: list) -> dict:
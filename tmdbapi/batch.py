@@ -0,0 +1,157 @@
+"""Concurrent Batch Requests
+
+Provides `map` to call an API function for many items in parallel with
+bounded concurrency. All workers share the pooled keep-alive transport,
+the rate limiter and the cache of `tmdbapi.setting`.
+
+    >>> import tmdbapi
+    >>> from tmdbapi import batch
+    >>> for result in batch.map(tmdbapi.api3.movies.details, [550, 551, 552]):
+    ...     if result.ok:
+    ...         print(result.item, result.value["title"])
+    ...     else:
+    ...         print(result.item, result.error)
+
+An error of one item is captured in its result and does not abort the
+batch.
+"""
+
+import contextvars
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Iterable, Iterator, Optional
+
+import tmdbapi
+
+__all__ = ["BatchResult", "map"]
+
+
+class BatchResult:
+    """The result of one item of a batch.
+
+    Attributes
+    ----------
+    item : Any
+        The item passed to the API function.
+    value : Any
+        The return value of the API function, None if it failed.
+    error : Exception or None
+        The exception raised by the API function, None if it succeeded.
+
+    """
+
+    __slots__ = ("item", "value", "error")
+
+    def __init__(self, item, value=None, error=None):
+        self.item = item
+        self.value = value
+        self.error = error
+
+    def __repr__(self):
+        if self.error is not None:
+            return f"BatchResult(item={self.item!r}, error={self.error!r})"
+        return f"BatchResult(item={self.item!r}, ok=True)"
+
+    @property
+    def ok(self) -> bool:
+        """Whether the API function succeeded."""
+        return self.error is None
+
+    def unwrap(self):
+        """Get the value, or raise the error of the item."""
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+def _call(func, item, kwargs) -> BatchResult:
+    try:
+        return BatchResult(item, func(item, **kwargs))
+    except Exception as err:
+        tmdbapi.LOGGER.warning(f"batch item {item!r} failed: {err!r}")
+        return BatchResult(item, error=err)
+
+
+def map(
+    func: Callable,
+    items: Iterable,
+    concurrency: Optional[int] = None,
+    ordered: bool = True,
+    **kwargs,
+) -> Iterator[BatchResult]:
+    """Call an API function for each item concurrently.
+
+    Parameters
+    ----------
+    func : callable
+        The API function, e.g. `tmdbapi.api3.movies.details`. It is called
+        as `func(item, **kwargs)`.
+    items : Iterable
+        The first argument of each call, e.g. movie IDs. It is consumed
+        lazily, so it can be a generator of any length.
+    concurrency : int, optional
+        The maximum number of calls in flight. By default, the pool size
+        `tmdbapi.setting["pool_maxsize"]`.
+    ordered : bool, optional
+        Whether to yield the results in the order of `items` (default), or
+        as soon as they complete.
+    **kwargs
+        The other arguments of every call, e.g. `language="en-US"`.
+
+    Yields
+    ------
+    BatchResult
+        The result of each item.
+
+    Notes
+    -----
+    The calls run in the context (e.g. `tmdbapi.setting.override`) of the
+    caller. A pool smaller than `concurrency` is grown to it with
+    `tmdbapi.setting.pool(maxsize=concurrency)`, so that every worker keeps
+    its connection alive.
+
+    Example
+    -------
+    >>> results = list(batch.map(api3.movies.details, ids, concurrency=16))
+    >>> movies = [r.value for r in results if r.ok]
+
+    """
+    if concurrency is None:
+        concurrency = tmdbapi.setting["pool_maxsize"]
+    if concurrency < 1:
+        raise ValueError("concurrency should be at least 1.")
+    if (
+        not tmdbapi.setting["use_session"]
+        and tmdbapi.setting["pool_maxsize"] < concurrency
+    ):
+        tmdbapi.setting.pool(maxsize=concurrency)
+    items = iter(items)
+    with ThreadPoolExecutor(concurrency, thread_name_prefix="tmdbapi-batch") as pool:
+
+        def submit() -> bool:
+            for item in items:
+                context = contextvars.copy_context()
+                pending.append(pool.submit(context.run, _call, func, item, kwargs))
+                return True
+            return False
+
+        pending = deque()
+        # keep the workers busy while the results are consumed
+        for _ in range(concurrency * 2):
+            if not submit():
+                break
+        try:
+            while pending:
+                if ordered:
+                    future = pending.popleft()
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    future = done.pop()
+                    pending.remove(future)
+                result = future.result()
+                submit()
+                yield result
+        finally:
+            # cancel the calls not started yet if the caller stopped early
+            for future in pending:
+                future.cancel()
@@ -0,0 +1,551 @@
+"""Response Cache
+
+Provides caches for successful GET responses, so repeated requests for
+the same data are served from the cache instead of the TMDB API.
+`MemoryCache` keeps the responses in the memory of one process, and
+`SQLiteCache` in a local SQLite file shared by processes and restarts.
+
+    >>> import tmdbapi
+    >>> from tmdbapi.cache import MemoryCache
+    >>> tmdbapi.setting.cache(MemoryCache(max_entries=10000))
+
+The cache key is the request method, the URL and the sorted query
+parameters without the API key. The language and region are query
+parameters, so each language has its own entry.
+
+Entries with an ETag or Last-Modified validator are kept after they go
+stale. The next request for a stale entry is sent with If-None-Match or
+If-Modified-Since, and a 304 Not Modified response refreshes the entry
+without downloading the body again.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlencode
+
+__all__ = [
+    "DEFAULT_TTLS",
+    "BaseCache",
+    "CacheEntry",
+    "MemoryCache",
+    "SQLiteCache",
+    "cache_key",
+]
+
+# The time-to-live in seconds of the endpoints which rarely change.
+DEFAULT_TTLS = {
+    "certification-movie-list": 86400,
+    "certifications-tv-list": 86400,
+    "configuration-countries": 86400,
+    "configuration-details": 86400,
+    "configuration-jobs": 86400,
+    "configuration-languages": 86400,
+    "configuration-primary-translations": 86400,
+    "configuration-timezones": 86400,
+    "genre-movie-list": 86400,
+    "genre-tv-list": 86400,
+    "watch-provider-tv-list": 86400,
+    "watch-providers-available-regions": 86400,
+    "watch-providers-movie-list": 86400,
+}
+
+# The endpoints with user state or one-time tokens, which are not cached
+# unless they are given a time-to-live explicitly.
+_PRIVATE_PREFIXES = ("account-", "authentication-", "guest-session-", "list-")
+_PRIVATE_SUFFIXES = ("-account-states",)
+
+# The query parameters which are credentials and not part of the cache key.
+_CREDENTIAL_PARAMS = ("api_key",)
+
+
+def cache_key(request) -> str:
+    """Get the cache key of a request.
+
+    Parameters
+    ----------
+    request : tmdbapi._core.Request
+        The prepared request.
+
+    Returns
+    -------
+    str
+        The method, URL and sorted query parameters without credentials.
+    """
+    params = sorted(
+        (k, str(v)) for k, v in request.params.items() if k not in _CREDENTIAL_PARAMS
+    )
+    return f"{request.method} {request.url}?{urlencode(params)}"
+
+
+class CacheEntry:
+    """A cached response.
+
+    Attributes
+    ----------
+    content : bytes
+        The response body.
+    content_type : str
+        The Content-Type header of the response.
+    expires : float
+        The time (`time.time()`) when the entry goes stale.
+    etag : str or None
+        The ETag header of the response.
+    last_modified : str or None
+        The Last-Modified header of the response.
+
+    """
+
+    __slots__ = ("content", "content_type", "expires", "etag", "last_modified")
+
+    def __init__(
+        self,
+        content: bytes,
+        content_type: str,
+        expires: float,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ):
+        self.content = content
+        self.content_type = content_type
+        self.expires = expires
+        self.etag = etag
+        self.last_modified = last_modified
+
+    def __repr__(self):
+        return f"CacheEntry(size={self.size}, expires={self.expires})"
+
+    @property
+    def size(self) -> int:
+        """The size of the body in bytes."""
+        return len(self.content)
+
+    @property
+    def headers(self) -> dict:
+        """The response headers needed to handle the cached body."""
+        return {"Content-Type": self.content_type, "content-length": str(self.size)}
+
+    @property
+    def validators(self) -> dict:
+        """The request headers to revalidate the entry, empty if it has no
+        validator."""
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        """Check whether the entry has not expired."""
+        return (time.time() if now is None else now) < self.expires
+
+    def is_revalidatable(self) -> bool:
+        """Check whether the entry can be revalidated once it is stale."""
+        return self.etag is not None or self.last_modified is not None
+
+
+class BaseCache:
+    """The base class of the response caches.
+
+    The subclasses implement the storage: `get`, `set`, `delete` and `clear`.
+
+    Attributes
+    ----------
+    default_ttl : float
+        The time-to-live in seconds of the endpoints not in `ttls`.
+    ttls : dict
+        The time-to-live in seconds by endpoint name, e.g.
+        {"movie-details": 3600}. Set 0 to not cache an endpoint.
+
+    """
+
+    def __init__(self, default_ttl: float = 300, ttls: Optional[dict] = None):
+        self.default_ttl = default_ttl
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+
+    def get_ttl(self, endpoint: str) -> float:
+        """Get the time-to-live of an endpoint.
+
+        Parameters
+        ----------
+        endpoint : str
+            The endpoint name, e.g. "movie-details".
+
+        Returns
+        -------
+        float
+            The time-to-live in seconds, 0 if the endpoint is not cached.
+        """
+        if endpoint in self.ttls:
+            return self.ttls[endpoint]
+        if endpoint.startswith(_PRIVATE_PREFIXES) or endpoint.endswith(
+            _PRIVATE_SUFFIXES
+        ):
+            return 0
+        return self.default_ttl
+
+    def lookup(self, request) -> Optional[CacheEntry]:
+        """Get the cached response of a request.
+
+        Parameters
+        ----------
+        request : tmdbapi._core.Request
+            The prepared request.
+
+        Returns
+        -------
+        CacheEntry or None
+            The cached response, or None if there is none. The entry is
+            stale (`is_fresh()` is False) when it should be revalidated
+            with its `validators` before use.
+        """
+        if request.method != "GET" or self.get_ttl(request.endpoint) <= 0:
+            return None
+        entry = self.get(cache_key(request))
+        if entry is None or not (entry.is_fresh() or entry.is_revalidatable()):
+            return None
+        return entry
+
+    def store(
+        self, request, response, stale: Optional[CacheEntry] = None
+    ) -> Optional[CacheEntry]:
+        """Cache the response of a request if it is cacheable.
+
+        Parameters
+        ----------
+        request : tmdbapi._core.Request
+            The prepared request.
+        response : requests.Response
+            The response, or any object with `status_code`, `headers` and
+            `content`.
+        stale : CacheEntry, optional
+            The stale entry the request was revalidating. A 304 response
+            refreshes it.
+
+        Returns
+        -------
+        CacheEntry or None
+            The cached entry, or None if the response is not cacheable.
+        """
+        if request.method != "GET":
+            return None
+        ttl = self.get_ttl(request.endpoint)
+        if ttl <= 0:
+            return None
+        headers = response.headers
+        if response.status_code == 304 and stale is not None:
+            entry = CacheEntry(
+                stale.content,
+                stale.content_type,
+                time.time() + ttl,
+                headers.get("ETag", stale.etag),
+                headers.get("Last-Modified", stale.last_modified),
+            )
+        elif response.status_code == 200:
+            entry = CacheEntry(
+                response.content,
+                headers.get("Content-Type", ""),
+                time.time() + ttl,
+                headers.get("ETag"),
+                headers.get("Last-Modified"),
+            )
+        else:
+            return None
+        self.set(cache_key(request), entry)
+        return entry
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Get an entry by key, or None."""
+        raise NotImplementedError
+
+    def set(self, key: str, entry: CacheEntry):
+        """Set an entry."""
+        raise NotImplementedError
+
+    def delete(self, key: str):
+        """Delete an entry if it exists."""
+        raise NotImplementedError
+
+    def clear(self):
+        """Delete all entries."""
+        raise NotImplementedError
+
+
+class MemoryCache(BaseCache):
+    """A thread-safe in-memory LRU response cache.
+
+    When the cache is full, the least recently used entries are evicted
+    until both the number of entries and the total size of the bodies are
+    within the limits.
+
+    Attributes
+    ----------
+    max_entries : int
+        The maximum number of entries.
+    max_bytes : int
+        The maximum total size of the cached bodies in bytes.
+    default_ttl : float
+        The time-to-live in seconds of the endpoints not in `ttls`.
+    ttls : dict
+        The time-to-live in seconds by endpoint name.
+
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        default_ttl: float = 300,
+        ttls: Optional[dict] = None,
+    ):
+        """Create the cache.
+
+        Parameters
+        ----------
+        max_entries : int, optional
+            The maximum number of entries, by default 1024.
+        max_bytes : int, optional
+            The maximum total size of the cached bodies, by default 64 MiB.
+        default_ttl : float, optional
+            The time-to-live in seconds of the endpoints not in `ttls`,
+            by default 300.
+        ttls : dict, optional
+            The time-to-live in seconds by endpoint name, merged with
+            `DEFAULT_TTLS`. e.g. {"movie-details": 3600}.
+        """
+        super().__init__(default_ttl, ttls)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return (
+            f"MemoryCache(max_entries={self.max_entries}, "
+            f"max_bytes={self.max_bytes}, default_ttl={self.default_ttl})"
+        )
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """The total size of the cached bodies in bytes."""
+        return self._bytes
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if not (entry.is_fresh() or entry.is_revalidatable()):
+                self._pop(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry):
+        with self._lock:
+            if key in self._entries:
+                self._pop(key)
+            if entry.size > self.max_bytes:
+                return
+            self._entries[key] = entry
+            self._bytes += entry.size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._pop(next(iter(self._entries)))
+
+    def delete(self, key: str):
+        with self._lock:
+            if key in self._entries:
+                self._pop(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _pop(self, key: str):
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+
+class SQLiteCache(BaseCache):
+    """A persistent response cache in a local SQLite file.
+
+    The bodies are stored zlib-compressed. The database uses write-ahead
+    logging, so several processes can read and write the same file at once,
+    and the cache survives restarts. When the total compressed size exceeds
+    `max_bytes`, expired entries without validators and then the least
+    recently used entries are evicted.
+
+    Attributes
+    ----------
+    path : pathlib.Path
+        The path of the SQLite file.
+    max_bytes : int
+        The maximum total size of the compressed bodies in bytes.
+    default_ttl : float
+        The time-to-live in seconds of the endpoints not in `ttls`.
+    ttls : dict
+        The time-to-live in seconds by endpoint name.
+
+    """
+
+    # Evict at most once per this number of writes of a process.
+    _EVICT_INTERVAL = 100
+    # Record the access time of an entry at most once per this many seconds.
+    _ACCESS_RESOLUTION = 60
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 512 * 1024 * 1024,
+        default_ttl: float = 300,
+        ttls: Optional[dict] = None,
+        compress_level: int = 6,
+    ):
+        """Create or open the cache.
+
+        Parameters
+        ----------
+        path : str
+            The path of the SQLite file, created if it does not exist.
+        max_bytes : int, optional
+            The maximum total size of the compressed bodies, by default 512 MiB.
+        default_ttl : float, optional
+            The time-to-live in seconds of the endpoints not in `ttls`,
+            by default 300.
+        ttls : dict, optional
+            The time-to-live in seconds by endpoint name, merged with
+            `DEFAULT_TTLS`. e.g. {"tv-season-details": 86400}.
+        compress_level : int, optional
+            The zlib compression level from 1 (fast) to 9 (small), by default 6.
+        """
+        super().__init__(default_ttl, ttls)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.compress_level = compress_level
+        self._local = threading.local()
+        self._writes = 0
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, content BLOB, content_type TEXT, "
+                "expires REAL, etag TEXT, last_modified TEXT, size INTEGER, "
+                "accessed REAL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)"
+            )
+
+    def __repr__(self):
+        return (
+            f"SQLiteCache(path={str(self.path)!r}, max_bytes={self.max_bytes}, "
+            f"default_ttl={self.default_ttl})"
+        )
+
+    def __len__(self):
+        return self._connect().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    @property
+    def size(self) -> int:
+        """The total size of the compressed bodies in bytes."""
+        conn = self._connect()
+        return conn.execute("SELECT IFNULL(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def _connect(self) -> "sqlite3.Connection":
+        """Get the connection of the current thread."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            import sqlite3
+
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        conn = self._connect()
+        row = conn.execute(
+            "SELECT content, content_type, expires, etag, last_modified, accessed "
+            "FROM entries WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None
+        content, content_type, expires, etag, last_modified, accessed = row
+        now = time.time()
+        if expires <= now and etag is None and last_modified is None:
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            return None
+        if now - accessed > self._ACCESS_RESOLUTION:
+            conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+        import zlib
+
+        return CacheEntry(
+            zlib.decompress(content), content_type, expires, etag, last_modified
+        )
+
+    def set(self, key: str, entry: CacheEntry):
+        import zlib
+
+        content = zlib.compress(entry.content, self.compress_level)
+        conn = self._connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                key,
+                content,
+                entry.content_type,
+                entry.expires,
+                entry.etag,
+                entry.last_modified,
+                len(content),
+                time.time(),
+            ),
+        )
+        self._writes += 1
+        if self._writes % self._EVICT_INTERVAL == 1:
+            self.evict()
+
+    def delete(self, key: str):
+        self._connect().execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def clear(self):
+        self._connect().execute("DELETE FROM entries")
+
+    def evict(self):
+        """Delete the expired entries without validators, then the least
+        recently used entries until the total size is within `max_bytes`."""
+        conn = self._connect()
+        conn.execute(
+            "DELETE FROM entries WHERE expires <= ? "
+            "AND etag IS NULL AND last_modified IS NULL",
+            (time.time(),),
+        )
+        excess = self.size - self.max_bytes
+        if excess <= 0:
+            return
+        keys = []
+        for key, size in conn.execute(
+            "SELECT key, size FROM entries ORDER BY accessed, rowid"
+        ):
+            keys.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        conn.executemany("DELETE FROM entries WHERE key = ?", keys)
+
+    def close(self):
+        """Close the connection of the current thread."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
@@ -0,0 +1,204 @@
+"""Clients with Isolated Settings
+
+Provides `TmdbClient`, which carries its own settings: credential, pool,
+cache, rate limiter, retry policy and defaults. The API functions read
+`tmdbapi.setting`, which is the settings of the client activated in the
+current context, or the global settings by default. So the same functions
+serve many credentials in one process without sharing a pool, a cache or
+the requests in flight.
+
+    >>> import tmdbapi
+    >>> from tmdbapi.client import TmdbClient
+    >>> alice = TmdbClient(alice_cred, default_language="en-US")
+    >>> bob = TmdbClient(bob_cred, rate_limit=RateLimiter(calls=20))
+    >>> alice.api3.movies.details(550)["title"]
+    'Fight Club'
+    >>> with bob.activate():
+    ...     movie = tmdbapi.api3.movies.details(550)
+
+Activations are per thread and asyncio task; `tmdbapi.batch.map` and
+`tmdbapi.pages` carry them to their worker threads. Iterate the async
+generators, e.g. `tmdbapi.pages.aiter_results`, inside `activate`.
+"""
+
+import contextlib
+import contextvars
+import functools
+import inspect
+import types
+from typing import Optional
+
+import tmdbapi
+from tmdbapi._core import _CLIENT, Setting
+
+__all__ = ["TmdbClient", "current", "default"]
+
+# The modules bound to a client as its attributes.
+_BOUND = ("aio", "api3", "api4", "batch", "integration", "pages")
+
+_DEFAULT = None
+
+
+class TmdbClient:
+    """A TMDB client with its own settings.
+
+    Attributes
+    ----------
+    setting : tmdbapi._core.Setting
+        The settings of the client, changed like `tmdbapi.setting`, e.g.
+        `client.setting.cache(MemoryCache())`.
+
+    """
+
+    def __init__(self, credential=None, setting: Optional[Setting] = None, **kwargs):
+        """Create a client.
+
+        Parameters
+        ----------
+        credential : tmdbapi.Credential, optional
+            The credential of the client. If it has an access token, the
+            client uses it unless `use_access_token=False` is given.
+        setting : tmdbapi._core.Setting, optional
+            The settings to use. By default, new settings with the default
+            values.
+        **kwargs
+            The settings to change, as in `tmdbapi.setting.set`, e.g.
+            `pool_maxsize=32` or `cache=MemoryCache()`.
+        """
+        self.setting = Setting() if setting is None else setting
+        if credential is not None:
+            self.setting.use_cred(credential)
+            if credential.pass_check("access_token"):
+                self.setting.use_access_token(True)
+        if kwargs:
+            self.setting.set(**kwargs)
+
+    def __repr__(self):
+        return f"TmdbClient(setting={self.setting!r})"
+
+    def __getattr__(self, name):
+        # e.g. client.api3.movies.details(550)
+        if name in _BOUND:
+            return _Bound(self, getattr(tmdbapi, name))
+        raise AttributeError(f'"TmdbClient" object has no attribute "{name}"')
+
+    @contextlib.contextmanager
+    def activate(self):
+        """Make the requests inside the block with this client.
+
+        Example
+        -------
+        >>> with client.activate():
+        ...     movie = tmdbapi.api3.movies.details(550)
+
+        """
+        token = _CLIENT.set(self)
+        try:
+            yield self
+        finally:
+            _CLIENT.reset(token)
+
+    def call(self, func, *args, **kwargs):
+        """Call a function with this client.
+
+        Parameters
+        ----------
+        func : callable
+            An API function, e.g. `tmdbapi.api3.movies.details`.
+        *args, **kwargs
+            The arguments of `func`.
+
+        Returns
+        -------
+        Any
+            The return value of `func`.
+        """
+        with self.activate():
+            return func(*args, **kwargs)
+
+    async def acall(self, func, *args, **kwargs):
+        """Await a coroutine function, e.g. `tmdbapi.aio.api3.movies.details`,
+        with this client."""
+        with self.activate():
+            return await func(*args, **kwargs)
+
+    def close(self):
+        """Close the pooled connections of the client."""
+        if self.setting._transport is not None:
+            self.setting._transport.close()
+        if self.setting._session is not None:
+            self.setting._session.close()
+
+    async def aclose(self):
+        """Close the pooled asyncio connections of the client."""
+        if self.setting._async_transport is not None:
+            await self.setting._async_transport.close()
+
+
+class _Bound:
+    """A module whose functions are called with a client."""
+
+    __slots__ = ("_client", "_module")
+
+    def __init__(self, client: TmdbClient, module: types.ModuleType):
+        self._client = client
+        self._module = module
+
+    def __repr__(self):
+        return f"<{self._module.__name__} of {self._client!r}>"
+
+    def __dir__(self):
+        return dir(self._module)
+
+    def __getattr__(self, name):
+        value = getattr(self._module, name)
+        if isinstance(value, types.ModuleType):
+            return _Bound(self._client, value)
+        if isinstance(value, type) or not callable(value):
+            return value
+        client = self._client
+        if inspect.iscoroutinefunction(value):
+
+            @functools.wraps(value)
+            async def wrapper(*args, **kwargs):
+                return await client.acall(value, *args, **kwargs)
+
+        elif inspect.isgeneratorfunction(value):
+
+            @functools.wraps(value)
+            def wrapper(*args, **kwargs):
+                # each step runs with the client, not only the first one
+                context = contextvars.copy_context()
+                context.run(_CLIENT.set, client)
+                iterator = context.run(value, *args, **kwargs)
+                try:
+                    while True:
+                        try:
+                            item = context.run(next, iterator)
+                        except StopIteration:
+                            return
+                        yield item
+                finally:
+                    context.run(iterator.close)
+
+        else:
+
+            @functools.wraps(value)
+            def wrapper(*args, **kwargs):
+                return client.call(value, *args, **kwargs)
+
+        return wrapper
+
+
+def default() -> TmdbClient:
+    """Get the default client, which uses the global `tmdbapi.setting`."""
+    global _DEFAULT
+    if _DEFAULT is None or _DEFAULT.setting is not tmdbapi.setting:
+        _DEFAULT = TmdbClient(setting=tmdbapi.setting)
+    return _DEFAULT
+
+
+def current() -> TmdbClient:
+    """Get the client activated in the current context, or the default one."""
+    client = _CLIENT.get()
+    return default() if client is None else client
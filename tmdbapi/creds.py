@@ -9,13 +9,14 @@ import base64
 import getpass
 import os
 import pickle
+import threading
+import time
+import weakref
 from pathlib import Path
-
-from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from typing import Optional
 
 import tmdbapi
+from tmdbapi.ratelimit import RateLimiter
 
 SALT_LEN = 64
 
@@ -84,6 +85,8 @@ class Credential:
         self.file_update = True
         self.encrypt = False
         self.password = ""
+        # the settings which use the credential, by id, see `Setting.use_cred`
+        self._settings = weakref.WeakValueDictionary()
 
     def __getitem__(self, key):
         return self._cred[key]
@@ -118,12 +121,19 @@ class Credential:
                     self.save_encrypt(auto_update=self.file_update)
                 else:
                     self.save(auto_update=self.file_update)
-        # if access_token given then use access_token instead of api_key
-        if tmdbapi.setting["credential"] is not None:
-            if self._cred["access_token"] == "":
-                tmdbapi.setting.set(use_access_token=False)
-            else:
-                tmdbapi.setting.set(use_access_token=True)
+        # if access_token given then use access_token instead of api_key, in
+        # the settings using this credential only (see `tmdbapi.client`)
+        for setting in list(self._settings.values()):
+            if self._used_by(setting):
+                setting._use_access_token(self._cred["access_token"] != "")
+
+    def _used_by(self, setting) -> bool:
+        """Check whether the settings use this credential, alone or as the
+        first credential of a pool."""
+        credential = setting.setting["credential"]
+        if isinstance(credential, CredentialPool):
+            credential = credential.credentials[0]
+        return credential is self
 
     def set(
         self,
@@ -493,6 +503,227 @@ class Credential:
         self.encrypt = True
 
 
+class CredentialPool:
+    """A pool of the credentials of several TMDB applications.
+
+    Use it like a credential, `tmdbapi.setting.use_cred(pool)`. Every request
+    sent to TMDB takes the API key or access token of one credential of the
+    pool, so the rate limits of all the applications add up:
+
+    - "round_robin" takes the credentials in turn.
+    - "least_loaded" takes the credential with the fewest requests in
+      flight.
+
+    A credential answered with HTTP 429 (status code 25) cools down for the
+    Retry-After seconds while the others keep serving, and each credential
+    can have its own quota. The session ID, account ID and account object ID
+    are those of the first credential.
+
+    Attributes
+    ----------
+    credentials : list
+        The credentials, `tmdbapi.Credential`.
+    strategy : str
+        "round_robin" or "least_loaded".
+    cooldown : float
+        The seconds a credential is not used after HTTP 429 without a
+        Retry-After header.
+
+    """
+
+    STRATEGIES = ("round_robin", "least_loaded")
+
+    def __init__(
+        self,
+        credentials,
+        strategy: str = "round_robin",
+        calls: Optional[int] = None,
+        period: float = 1.0,
+        cooldown: float = 1.0,
+    ):
+        """Create the pool.
+
+        Parameters
+        ----------
+        credentials : Iterable[tmdbapi.Credential]
+            The credentials, each with an API key or an access token.
+        strategy : str, optional
+            "round_robin" (default) or "least_loaded".
+        calls : int, optional
+            The quota of each credential, in requests per `period`. By
+            default, no quota.
+        period : float, optional
+            The period of the quota in seconds, by default 1.0.
+        cooldown : float, optional
+            The seconds a credential is not used after HTTP 429 without a
+            Retry-After header, by default 1.0.
+        """
+        self.credentials = list(credentials)
+        if not self.credentials:
+            raise ValueError("The pool needs at least one credential.")
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"strategy should be one of {', '.join(self.STRATEGIES)}.")
+        self.strategy = strategy
+        self.cooldown = cooldown
+        n = len(self.credentials)
+        self._index = {id(cred): i for i, cred in enumerate(self.credentials)}
+        self._limiters = [
+            None if calls is None else RateLimiter(calls, period) for _ in range(n)
+        ]
+        self._lock = threading.Lock()
+        self._next = 0
+        self._in_flight = [0] * n
+        self._until = [0.0] * n  # the end of the cooldown, time.monotonic()
+        self._sent = [0] * n
+        self._throttled = [0] * n
+
+    def __repr__(self):
+        return (
+            f"CredentialPool(credentials={len(self.credentials)}, "
+            f"strategy={self.strategy!r})"
+        )
+
+    def __len__(self):
+        return len(self.credentials)
+
+    def __getitem__(self, key):
+        return self.credentials[0][key]
+
+    def pass_check(self, *args):
+        """Check the credentials of the first credential, see
+        `Credential.pass_check`."""
+        return self.credentials[0].pass_check(*args)
+
+    def set(self, **kwargs):
+        """Set the credentials of the first credential, see `Credential.set`.
+
+        The API functions keep the session ID, account ID and account
+        object ID they obtain here, e.g. `api3.account.details()`.
+        """
+        self.credentials[0].set(**kwargs)
+
+    def _select(self, now: float) -> int:
+        n = len(self.credentials)
+        ready = [i for i in range(n) if self._until[i] <= now]
+        if not ready:
+            # every credential cools down, take the first one back
+            return min(range(n), key=lambda i: self._until[i])
+        if self.strategy == "least_loaded":
+            return min(ready, key=lambda i: (self._in_flight[i], self._sent[i]))
+        i = min(ready, key=lambda i: (i - self._next) % n)
+        self._next = (i + 1) % n
+        return i
+
+    def reserve(self) -> tuple:
+        """Take a credential for a request without waiting.
+
+        Release it with `release` once the response is received.
+
+        Returns
+        -------
+        tuple
+            (credential, wait): the credential, and the seconds to wait for
+            its cooldown or quota before sending the request.
+        """
+        with self._lock:
+            now = time.monotonic()
+            i = self._select(now)
+            self._in_flight[i] += 1
+            self._sent[i] += 1
+            wait = max(0.0, self._until[i] - now)
+        if self._limiters[i] is not None:
+            wait = max(wait, self._limiters[i].reserve())
+        return self.credentials[i], wait
+
+    def acquire(self) -> "Credential":
+        """Take a credential for a request, waiting for its cooldown or quota.
+
+        Returns
+        -------
+        Credential
+        """
+        credential, wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return credential
+
+    def release(self, credential: "Credential", status_code=None, retry_after=None):
+        """Release a credential taken by `reserve` or `acquire`.
+
+        Parameters
+        ----------
+        credential : Credential
+            The credential.
+        status_code : int, optional
+            The HTTP status code of the response, None if it failed.
+        retry_after : float, optional
+            The seconds of the Retry-After header of the response.
+        """
+        i = self._index[id(credential)]
+        with self._lock:
+            self._in_flight[i] -= 1
+            if status_code == 429:
+                self._throttled[i] += 1
+                seconds = self.cooldown if retry_after is None else retry_after
+                self._until[i] = max(self._until[i], time.monotonic() + seconds)
+        if status_code == 429:
+            tmdbapi.LOGGER.warning(
+                f"Credential {i} of the pool is throttled, cool down for "
+                f"{seconds:.2f}s."
+            )
+
+    def authorize(self, credential: "Credential", headers: dict, params: dict):
+        """Authenticate a request with a credential of the pool.
+
+        Replaces the access token of the Authorization header, or the API key
+        of the query parameters.
+
+        Parameters
+        ----------
+        credential : Credential
+            The credential.
+        headers : dict
+            The request headers.
+        params : dict
+            The query parameters.
+
+        Returns
+        -------
+        tuple
+            (headers, params), the updated copies.
+        """
+        if "Authorization" in headers:
+            headers = {
+                **headers,
+                "Authorization": f"Bearer {credential['access_token']}",
+            }
+        elif "api_key" in params:
+            params = {**params, "api_key": credential["api_key"]}
+        return headers, params
+
+    def stats(self) -> list:
+        """Get the usage of each credential.
+
+        Returns
+        -------
+        list
+            [{"sent": int, "throttled": int, "in_flight": int, "cooldown":
+            float}], the requests sent, the HTTP 429 received, the requests
+            in flight and the seconds left of the cooldown.
+        """
+        with self._lock:
+            now = time.monotonic()
+            return [
+                {
+                    "sent": self._sent[i],
+                    "throttled": self._throttled[i],
+                    "in_flight": self._in_flight[i],
+                    "cooldown": max(0.0, self._until[i] - now),
+                }
+                for i in range(len(self.credentials))
+            ]
+
+
 class Encrypt:
     """A class for encrypting and decrypting pickled Python objects using PBKDF2 and Fernet.
 
@@ -530,6 +761,10 @@ class Encrypt:
         bytes
             the derived key
         """
+        # imported here, so only the encrypted credentials load cryptography
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
         kdf = PBKDF2HMAC(
             algorithm=hashes.SHA256(), salt=salt, iterations=self.iterations, length=32
         )
@@ -549,6 +784,10 @@ class Encrypt:
         bool
             _description_
         """
+        # imported here, so only the encrypted credentials load cryptography
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
         kdf = PBKDF2HMAC(
             algorithm=hashes.SHA256(), salt=salt, iterations=self.iterations, length=32
         )
@@ -569,6 +808,8 @@ class Encrypt:
             A Python object to be pickled and encrypted.
 
         """
+        from cryptography.fernet import Fernet
+
         pickled = pickle.dumps(obj)
         salt = os.urandom(SALT_LEN)
         key = self.generate_key_from_password(salt)
@@ -591,6 +832,8 @@ class Encrypt:
             A Python object that has been decrypted and loaded from the file.
 
         """
+        from cryptography.fernet import Fernet
+
         with open(filepath, "rb") as file:
             data = file.read()
         salt, encrypted_pickle = data[:SALT_LEN], data[SALT_LEN:]
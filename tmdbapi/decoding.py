@@ -0,0 +1,276 @@
+"""Fast JSON Decoding
+
+Provides the JSON decoders of the response bodies. orjson and msgspec decode
+the raw bytes directly and several times faster than the standard library,
+which matters for large `append_to_response` details. By default, the first
+installed of orjson, msgspec and the standard library is used.
+
+    >>> import tmdbapi
+    >>> tmdbapi.setting.json_decoder("orjson")  # or "msgspec", "json", "auto"
+    >>> from tmdbapi.decoding import available
+    >>> available()
+    ['orjson', 'json']
+
+Install orjson with `pip install TMDB-Py[json]`.
+
+A projection keeps only some paths of the responses. "a.b" selects the key
+"b" of the object "a", "a[].b" the key "b" of each item of the list "a":
+
+    >>> fields = ["id", "title", "credits.cast[].name"]
+    >>> with tmdbapi.setting.override(fields=fields):
+    ...     movie = api3.movies.details(550, append_to_response="credits")
+    >>> movie["credits"]["cast"][0]
+    {'name': 'Edward Norton'}
+
+With msgspec, the projection is decoded as typed structs, so the other keys
+are skipped without being built. Otherwise, the body is decoded, then pruned.
+"""
+
+import importlib.util
+import json
+from typing import Any, Callable, Union
+
+__all__ = ["BACKENDS", "Projection", "available", "get_decoder", "get_projection"]
+
+# The backends in the order of preference of "auto".
+BACKENDS = ("orjson", "msgspec", "json")
+
+# The decoder of each backend name, created on first use.
+_DECODERS = {}
+
+# The compiled projection of each tuple of paths.
+_PROJECTIONS = {}
+
+# The keys of the error responses, kept to check the success.
+_STATUS_KEYS = ("success", "status_code", "status_message")
+
+
+def _load(name: str) -> Callable:
+    if name == "orjson":
+        import orjson
+
+        return orjson.loads
+    if name == "msgspec":
+        import msgspec
+
+        return msgspec.json.Decoder().decode
+    if name == "json":
+        return json.loads
+    raise ValueError(f"decoder should be one of auto, {', '.join(BACKENDS)}.")
+
+
+def available() -> list:
+    """Get the installed backends.
+
+    Returns
+    -------
+    list
+        The names of the installed backends, in the order of preference.
+    """
+    return [
+        name
+        for name in BACKENDS
+        if name == "json" or importlib.util.find_spec(name) is not None
+    ]
+
+
+def get_decoder(decoder="auto") -> Callable:
+    """Get a JSON decoder.
+
+    Parameters
+    ----------
+    decoder : str or callable, optional
+        "auto" (default) for the first installed of orjson, msgspec and the
+        standard library, or "orjson", "msgspec", "json". A callable taking
+        the bytes of the body is returned as is.
+
+    Returns
+    -------
+    callable
+        The function decoding the bytes of a JSON document.
+
+    Raises
+    ------
+    ValueError
+        If the name is unknown.
+    ImportError
+        If the backend is not installed.
+    """
+    if callable(decoder):
+        return decoder
+    loads = _DECODERS.get(decoder)
+    if loads is None:
+        if decoder == "auto":
+            loads = _load(available()[0])
+        else:
+            loads = _load(decoder)
+        _DECODERS[decoder] = loads
+    return loads
+
+
+class Projection:
+    """The paths of the responses to keep, see `get_projection`.
+
+    Attributes
+    ----------
+    fields : tuple
+        The paths, e.g. ("id", "credits.cast[].name").
+    tree : dict
+        The paths as a tree {key: (is_list, subtree)}, where subtree is None
+        to keep the whole value.
+
+    """
+
+    __slots__ = ("fields", "tree", "_decoders")
+
+    def __init__(self, fields):
+        self.fields = tuple(fields)
+        self.tree = {}
+        for path in self.fields:
+            _add_path(self.tree, path)
+        self._decoders = {}
+
+    def __repr__(self):
+        return f"Projection({list(self.fields)!r})"
+
+    def prune(self, data):
+        """Keep only the paths of the projection.
+
+        Parameters
+        ----------
+        data : dict or list
+            The decoded response.
+
+        Returns
+        -------
+        dict or list
+            The projected copy. The missing keys are skipped.
+        """
+        return _prune(data, self.tree)
+
+    def decode(self, content: bytes, decoder="auto"):
+        """Decode only the paths of the projection.
+
+        Parameters
+        ----------
+        content : bytes
+            The JSON body.
+        decoder : str or callable, optional
+            The decoder, as in `get_decoder`. With "auto" or "msgspec" and
+            msgspec installed, the projection is decoded as typed structs.
+
+        Returns
+        -------
+        dict or list
+            The projected response. An error response keeps its
+            "success", "status_code" and "status_message".
+        """
+        loads = self._decoders.get(decoder)
+        if loads is None:
+            loads = self._compile(decoder)
+            self._decoders[decoder] = loads
+        if loads:
+            import msgspec
+
+            try:
+                data = msgspec.to_builtins(loads(content))
+            except msgspec.ValidationError:
+                # e.g. an object where the paths expect a list
+                pass
+            else:
+                if data.get("success") is not False:
+                    for key in _STATUS_KEYS:
+                        if key not in self.tree:
+                            data.pop(key, None)
+                return data
+        data = get_decoder("msgspec" if loads else decoder)(content)
+        if isinstance(data, dict) and data.get("success") is False:
+            return data
+        return self.prune(data)
+
+    def _compile(self, decoder):
+        # the decoder of the typed structs, or False to decode then prune
+        if decoder not in ("auto", "msgspec"):
+            return False
+        if decoder == "auto" and importlib.util.find_spec("msgspec") is None:
+            return False
+        import msgspec
+
+        tree = {**{key: (False, None) for key in _STATUS_KEYS}, **self.tree}
+        return msgspec.json.Decoder(_struct(msgspec, tree)).decode
+
+
+def _add_path(tree: dict, path: str):
+    keys = path.split(".")
+    for i, key in enumerate(keys):
+        is_list = key.endswith("[]")
+        if is_list:
+            key = key[:-2]
+        if not key:
+            raise ValueError(f'Invalid field path "{path}".')
+        last = i == len(keys) - 1
+        node = tree.get(key)
+        if node is not None and node[1] is None:
+            return  # the whole value is kept already
+        if last:
+            tree[key] = (is_list, None)
+            return
+        if node is None:
+            node = tree[key] = (is_list, {})
+        tree = node[1]
+
+
+def _prune(value, tree):
+    if isinstance(value, list):
+        return [_prune(item, tree) for item in value]
+    if not isinstance(value, dict):
+        return value
+    pruned = {}
+    for key, (_, subtree) in tree.items():
+        if key in value:
+            item = value[key]
+            pruned[key] = item if subtree is None else _prune(item, subtree)
+    return pruned
+
+
+def _struct(msgspec, tree: dict) -> type:
+    # a struct type whose fields are the keys, renamed as the keys may not
+    # be identifiers (e.g. "watch/providers")
+    fields = []
+    rename = {}
+    for i, (key, (is_list, subtree)) in enumerate(tree.items()):
+        kind = Any if subtree is None else _struct(msgspec, subtree)
+        if is_list:
+            kind = list[kind]
+        name = f"field{i}"
+        rename[name] = key
+        fields.append((name, Union[kind, None, msgspec.UnsetType], msgspec.UNSET))
+    return msgspec.defstruct("Projected", fields, rename=rename)
+
+
+def get_projection(fields) -> Projection:
+    """Get the compiled projection of some paths.
+
+    Parameters
+    ----------
+    fields : Iterable[str] or Projection
+        The paths to keep, e.g. ["id", "title", "credits.cast[].id"].
+
+    Returns
+    -------
+    Projection
+
+    Raises
+    ------
+    ValueError
+        If a path is empty.
+    """
+    if isinstance(fields, Projection):
+        return fields
+    if isinstance(fields, str):
+        fields = (fields,)
+    key = tuple(fields)
+    projection = _PROJECTIONS.get(key)
+    if projection is None:
+        projection = _PROJECTIONS[key] = Projection(key)
+    return projection
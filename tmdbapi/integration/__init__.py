@@ -1,6 +1,13 @@
 """Integrating APIs into application.
 """
 
-from . import auth
+import importlib as _importlib
 
-__all__ = ["auth"]
+__all__ = ["auth", "discover", "exports", "facets", "sync", "tv"]
+
+
+def __getattr__(name):
+    # the modules are imported on first access (PEP 562)
+    if name in __all__:
+        return _importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f'Package "{__name__}" has no attribute "{name}"')
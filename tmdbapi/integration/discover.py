@@ -0,0 +1,204 @@
+"""Crawl all results of a discover query.
+
+TMDB returns at most 500 pages (10000 results) for one query. These
+functions split the query into disjoint windows of a date or number field,
+halving every window with more than 500 pages until each one fits, and
+yield the de-duplicated union of the windows.
+
+    >>> from tmdbapi.integration import discover
+    >>> for movie in discover.movies({"with_genres": "878"}, concurrency=8):
+    ...     print(movie["id"], movie["title"])
+
+Items without a value for the field (e.g. movies without a release date)
+are not in any window.
+"""
+
+import datetime
+import itertools
+from typing import Callable, Iterator, Optional
+
+import tmdbapi
+from tmdbapi.pages import MAX_PAGE, iter_results
+
+__all__ = ["crawl", "movies", "tv"]
+
+_DATE_FIELDS = ("air_date", "first_air_date", "primary_release_date", "release_date")
+# The fields which are also sort options of TMDB.
+_SORT_FIELDS = ("first_air_date", "primary_release_date", "vote_count")
+
+
+def _to_number(value, is_date: bool) -> int:
+    if not is_date:
+        return int(value)
+    if isinstance(value, str):
+        value = datetime.date.fromisoformat(value)
+    return value.toordinal()
+
+
+def _to_param(value: int, is_date: bool):
+    if not is_date:
+        return value
+    return datetime.date.fromordinal(value).isoformat()
+
+
+def crawl(
+    func: Callable,
+    field: str,
+    start,
+    end,
+    params: Optional[dict] = None,
+    concurrency: int = 1,
+) -> Iterator[dict]:
+    """Crawl a discover query in windows of a field.
+
+    Parameters
+    ----------
+    func : callable
+        The discover method, `tmdbapi.api3.discover.movies` or
+        `tmdbapi.api3.discover.tv`.
+    field : str
+        The field to split, e.g. "primary_release_date", "first_air_date"
+        or "vote_count". The query uses its ".gte" and ".lte" parameters.
+    start : str, datetime.date or int
+        The lower bound of the field, inclusive. A date is a
+        `datetime.date` or a "YYYY-MM-DD" string.
+    end : str, datetime.date or int
+        The upper bound of the field, inclusive.
+    params : dict, optional
+        The other discover parameters. If the field is a sort option,
+        "sort_by" defaults to the field in ascending order, which keeps the
+        pages stable during the crawl.
+    concurrency : int, optional
+        The number of pages of a window fetched at once, by default 1.
+
+    Yields
+    ------
+    dict
+        Each result item, once per "id".
+    """
+    is_date = field in _DATE_FIELDS
+    params = dict(params or {})
+    params.pop("page", None)
+    if field in _SORT_FIELDS:
+        params.setdefault("sort_by", f"{field}.asc")
+    windows = [(_to_number(start, is_date), _to_number(end, is_date))]
+    seen = set()
+    while windows:
+        low, high = windows.pop()
+        window = {
+            **params,
+            f"{field}.gte": _to_param(low, is_date),
+            f"{field}.lte": _to_param(high, is_date),
+        }
+        first = func(window, page=1)
+        total_pages = first.get("total_pages", 1)
+        if total_pages > MAX_PAGE and low < high:
+            middle = (low + high) // 2
+            # the lower half is crawled first
+            windows.append((middle + 1, high))
+            windows.append((low, middle))
+            continue
+        if total_pages > MAX_PAGE:
+            tmdbapi.LOGGER.warning(
+                f"{field} {_to_param(low, is_date)} has {first.get('total_results')} "
+                f"results, only the first {MAX_PAGE} pages are crawled."
+            )
+        tmdbapi.LOGGER.debug(
+            f"Crawling {field} {_to_param(low, is_date)} to "
+            f"{_to_param(high, is_date)}: {total_pages} pages."
+        )
+        items = first.get("results", [])
+        if total_pages > 1:
+            rest = iter_results(
+                func,
+                window,
+                start_page=2,
+                max_pages=min(total_pages, MAX_PAGE) - 1,
+                concurrency=concurrency,
+            )
+            items = itertools.chain(items, rest)
+        for item in items:
+            if item["id"] not in seen:
+                seen.add(item["id"])
+                yield item
+
+
+def movies(
+    params: Optional[dict] = None,
+    field: str = "primary_release_date",
+    start=None,
+    end=None,
+    concurrency: int = 1,
+) -> Iterator[dict]:
+    """Crawl all movies of a discover query.
+
+    Parameters
+    ----------
+    params : dict, optional
+        The parameters of `tmdbapi.api3.discover.movies`.
+    field : str, optional
+        The field to split, by default "primary_release_date". Also
+        "release_date", "vote_count" or "with_runtime".
+    start : str, datetime.date or int, optional
+        The lower bound of the field. By default, "1870-01-01" for a date
+        field and 0 for a number field.
+    end : str, datetime.date or int, optional
+        The upper bound of the field. By default, 10 years from today for
+        a date field and 1000000 for a number field.
+    concurrency : int, optional
+        The number of pages of a window fetched at once, by default 1.
+
+    Yields
+    ------
+    dict
+        Each movie, once per "id".
+    """
+    start, end = _default_range(field, start, end, "1870-01-01")
+    return crawl(tmdbapi.api3.discover.movies, field, start, end, params, concurrency)
+
+
+def tv(
+    params: Optional[dict] = None,
+    field: str = "first_air_date",
+    start=None,
+    end=None,
+    concurrency: int = 1,
+) -> Iterator[dict]:
+    """Crawl all TV shows of a discover query.
+
+    Parameters
+    ----------
+    params : dict, optional
+        The parameters of `tmdbapi.api3.discover.tv`.
+    field : str, optional
+        The field to split, by default "first_air_date". Also "air_date",
+        "vote_count" or "with_runtime".
+    start : str, datetime.date or int, optional
+        The lower bound of the field. By default, "1920-01-01" for a date
+        field and 0 for a number field.
+    end : str, datetime.date or int, optional
+        The upper bound of the field. By default, 10 years from today for
+        a date field and 1000000 for a number field.
+    concurrency : int, optional
+        The number of pages of a window fetched at once, by default 1.
+
+    Yields
+    ------
+    dict
+        Each TV show, once per "id".
+    """
+    start, end = _default_range(field, start, end, "1920-01-01")
+    return crawl(tmdbapi.api3.discover.tv, field, start, end, params, concurrency)
+
+
+def _default_range(field: str, start, end, first_date: str) -> tuple:
+    """Fill in the missing bounds of the field."""
+    if field in _DATE_FIELDS:
+        today = datetime.date.today()
+        default = (first_date, today.replace(year=today.year + 10, day=1))
+    else:
+        default = (0, 1_000_000)
+    return (
+        default[0] if start is None else start,
+        default[1] if end is None else end,
+    )
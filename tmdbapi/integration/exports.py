@@ -0,0 +1,229 @@
+"""Bulk ingest of the TMDB daily ID exports.
+
+TMDB publishes the valid IDs of each kind of entity every day as gzipped
+newline-delimited JSON, e.g. `movie_ids_05_15_2024.json.gz`. `read` parses
+a downloaded file lazily, and `ingest` fetches the details of every ID
+concurrently with a checkpoint, so an interrupted ingest resumes where it
+stopped.
+
+    >>> from tmdbapi.integration import exports
+    >>> path = exports.download("movie", "exports/")
+    >>> for result in exports.ingest(path, "movie", "exports/movie.checkpoint"):
+    ...     if result.ok:
+    ...         save(result.value)
+
+Seeding a mirror from the export takes one request per entity, instead of
+paging through discover queries.
+"""
+
+import datetime
+import gzip
+import json
+import os
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+import tmdbapi
+from tmdbapi.batch import BatchResult
+from tmdbapi.batch import map as batch_map
+
+__all__ = ["KINDS", "download", "export_url", "ids", "ingest", "read"]
+
+EXPORT_BASE = "http://files.tmdb.org/p/exports"
+
+# The export name of each kind and its details method.
+KINDS = {
+    "movie": ("movie_ids", "movies"),
+    "tv_series": ("tv_series_ids", "tv_series"),
+    "person": ("person_ids", "people"),
+    "collection": ("collection_ids", "collections"),
+    "tv_network": ("tv_network_ids", "networks"),
+    "keyword": ("keyword_ids", "keywords"),
+    "production_company": ("production_company_ids", "companies"),
+}
+
+
+def _check_kind(kind: str):
+    if kind not in KINDS:
+        raise ValueError(f"kind should be one of {', '.join(KINDS)}.")
+
+
+def export_url(kind: str, date: Optional[datetime.date] = None) -> str:
+    """Get the URL of an export file.
+
+    Parameters
+    ----------
+    kind : str
+        The kind of entity, e.g. "movie" or "tv_series". See `KINDS`.
+    date : datetime.date, optional
+        The date of the export. By default, yesterday, which is always
+        available.
+
+    Returns
+    -------
+    str
+    """
+    _check_kind(kind)
+    if date is None:
+        date = datetime.date.today() - datetime.timedelta(1)
+    return f"{EXPORT_BASE}/{KINDS[kind][0]}_{date:%m_%d_%Y}.json.gz"
+
+
+def download(
+    kind: str, directory: str = ".", date: Optional[datetime.date] = None
+) -> Path:
+    """Download an export file through the pooled transport.
+
+    Parameters
+    ----------
+    kind : str
+        The kind of entity, e.g. "movie". See `KINDS`.
+    directory : str, optional
+        The directory to save the file in, by default the current directory.
+    date : datetime.date, optional
+        The date of the export, by default yesterday.
+
+    Returns
+    -------
+    pathlib.Path
+        The path of the downloaded file.
+    """
+    url = export_url(kind, date)
+    path = Path(directory) / url.rsplit("/", 1)[1]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp = path.with_name(path.name + ".part")
+    response = tmdbapi.setting.get_transport().request(
+        "GET", url, stream=True, timeout=tmdbapi.setting["timeout"]
+    )
+    response.raise_for_status()
+    with open(temp, "wb") as f:
+        for chunk in response.iter_content(1024 * 1024):
+            f.write(chunk)
+    os.replace(temp, path)
+    tmdbapi.LOGGER.info(f"Downloaded {url} to {path}.")
+    return path
+
+
+def read(
+    path: str,
+    min_popularity: Optional[float] = None,
+    include_adult: bool = True,
+    include_video: bool = True,
+) -> Iterator[dict]:
+    """Read an export file lazily.
+
+    Parameters
+    ----------
+    path : str
+        The path of the gzipped (.gz) or plain export file.
+    min_popularity : float, optional
+        Skip the entries less popular than this.
+    include_adult : bool, optional
+        Whether to include the adult entries, by default True.
+    include_video : bool, optional
+        Whether to include the video entries of the movie export, by
+        default True.
+
+    Yields
+    ------
+    dict
+        Each entry, e.g. {"adult": false, "id": 550, "original_title":
+        "Fight Club", "popularity": 61.4, "video": false}.
+    """
+    opener = gzip.open if str(path).endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            if (
+                min_popularity is not None
+                and entry.get("popularity", 0) < min_popularity
+            ):
+                continue
+            if not include_adult and entry.get("adult"):
+                continue
+            if not include_video and entry.get("video"):
+                continue
+            yield entry
+
+
+def ids(path: str, **kwargs) -> Iterator[int]:
+    """Read the IDs of an export file lazily.
+
+    Accepts the same filters as `read`.
+    """
+    for entry in read(path, **kwargs):
+        yield entry["id"]
+
+
+def ingest(
+    path: str,
+    kind: str,
+    checkpoint: Optional[str] = None,
+    fetch: Optional[Callable] = None,
+    concurrency: Optional[int] = None,
+    checkpoint_every: int = 1000,
+    **kwargs,
+) -> Iterator[BatchResult]:
+    """Fetch the details of every ID of an export file concurrently.
+
+    Parameters
+    ----------
+    path : str
+        The path of the export file.
+    kind : str
+        The kind of entity, e.g. "movie". See `KINDS`.
+    checkpoint : str, optional
+        The JSON checkpoint file with the number of entries done and the
+        IDs which failed. An ingest with the same checkpoint (and filters)
+        skips the entries already done. By default, no checkpoint.
+    fetch : callable, optional
+        The function called with each ID. By default, the details method of
+        the kind, e.g. `api3.movies.details`.
+    concurrency : int, optional
+        The maximum number of fetches in flight. By default, the pool size
+        `tmdbapi.setting["pool_maxsize"]`, see `tmdbapi.batch.map`.
+    checkpoint_every : int, optional
+        Save the checkpoint every this many entries, by default 1000.
+    **kwargs
+        The filters of `read`, e.g. `min_popularity=1`.
+
+    Yields
+    ------
+    tmdbapi.batch.BatchResult
+        The result of each ID, in the order of the file.
+    """
+    _check_kind(kind)
+    if fetch is None:
+        fetch = getattr(tmdbapi.api3, KINDS[kind][1]).details
+    state = {"done": 0, "failed": []}
+    if checkpoint is not None and Path(checkpoint).is_file():
+        with open(checkpoint, "r") as f:
+            state = json.load(f)
+        tmdbapi.LOGGER.info(f"Resuming the ingest of {path} after {state['done']}.")
+
+    entries = ids(path, **kwargs)
+    for _ in range(state["done"]):
+        if next(entries, None) is None:
+            break
+    for result in batch_map(fetch, entries, concurrency=concurrency):
+        state["done"] += 1
+        if not result.ok:
+            state["failed"].append(result.item)
+        yield result
+        # saved after the caller has handled the result
+        if checkpoint is not None and state["done"] % checkpoint_every == 0:
+            _save(checkpoint, state)
+    if checkpoint is not None:
+        _save(checkpoint, state)
+
+
+def _save(path: str, state: dict):
+    """Save the checkpoint atomically."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp = path.with_name(path.name + ".tmp")
+    with open(temp, "w") as f:
+        json.dump(state, f)
+    os.replace(temp, path)
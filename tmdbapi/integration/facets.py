@@ -0,0 +1,181 @@
+"""Fetch many facets of an entity in one request.
+
+The details methods can append up to 20 other methods of the same entity
+to the response with `append_to_response` (status code 27). `fetch` plans
+the fewest details requests for the facets asked, and splits the response
+back into one result per facet, shaped like the method of the facet.
+
+    >>> from tmdbapi.integration import facets
+    >>> movie = facets.movie(550, ["credits", "images", "keywords",
+    ...                            "external_ids", "watch/providers"])
+    >>> movie["details"]["title"]
+    'Fight Club'
+    >>> movie["credits"]["id"], len(movie["credits"]["cast"])
+    (550, 76)
+
+Facets are the method paths, e.g. "credits", "release_dates" or
+"watch/providers".
+"""
+
+from typing import Iterable, Optional
+
+import tmdbapi
+
+__all__ = [
+    "MAX_APPEND",
+    "episode",
+    "fetch",
+    "movie",
+    "person",
+    "plan",
+    "season",
+    "split",
+    "tv",
+]
+
+# The maximum number of methods appended to one request.
+MAX_APPEND = 20
+
+# The module of the details method of each kind.
+_MODULES = {
+    "movie": "movies",
+    "tv": "tv_series",
+    "season": "tv_seasons",
+    "episode": "tv_episodes",
+    "person": "people",
+}
+
+
+def plan(facets: Iterable[str], max_append: int = MAX_APPEND) -> list:
+    """Split the facets into the `append_to_response` of each request.
+
+    Parameters
+    ----------
+    facets : Iterable[str]
+        The facets, e.g. ["credits", "images"]. Duplicates are dropped.
+    max_append : int, optional
+        The maximum number of facets per request, by default 20.
+
+    Returns
+    -------
+    list
+        The `append_to_response` value of each request, at least one.
+    """
+    facets = list(dict.fromkeys(facets))
+    chunks = [
+        ",".join(facets[i : i + max_append]) for i in range(0, len(facets), max_append)
+    ]
+    return chunks or [""]
+
+
+def split(response: dict, facets: Iterable[str]) -> dict:
+    """Split a details response with appended facets.
+
+    Parameters
+    ----------
+    response : dict
+        The details response.
+    facets : Iterable[str]
+        The appended facets.
+
+    Returns
+    -------
+    dict
+        {"details": the details without the facets, facet: the facet, ...}.
+        A facet has the "id" of the entity, like the response of its method.
+    """
+    details = dict(response)
+    result = {"details": details}
+    for facet in facets:
+        value = details.pop(facet, None)
+        if isinstance(value, dict) and "id" in details:
+            value = {"id": details["id"], **value}
+        result[facet] = value
+    return result
+
+
+def fetch(
+    kind: str, *ids, facets: Iterable[str] = (), language: Optional[str] = None
+) -> dict:
+    """Fetch the details and facets of an entity with the fewest requests.
+
+    Parameters
+    ----------
+    kind : str
+        "movie", "tv", "season", "episode" or "person".
+    *ids
+        The ID, or the IDs of a season or an episode, e.g. 1399, 1, 2.
+    facets : Iterable[str], optional
+        The facets, e.g. ["credits", "images"].
+    language : str, optional
+        The language of the response.
+
+    Returns
+    -------
+    dict
+        {"details": the details, facet: the facet, ...}.
+    """
+    if kind not in _MODULES:
+        raise ValueError(f"kind should be one of {', '.join(_MODULES)}.")
+    details = getattr(tmdbapi.api3, _MODULES[kind]).details
+    result = {}
+    for append in plan(facets):
+        response = details(*ids, append_to_response=append, language=language)
+        part = split(response, append.split(",") if append else [])
+        # the details are the same in each request
+        result = {**part, **result}
+    return result
+
+
+def movie(
+    movie_id: int, facets: Iterable[str] = (), language: Optional[str] = None
+) -> dict:
+    """Fetch the details and facets of a movie, e.g. "credits", "images",
+    "keywords", "release_dates", "external_ids" or "watch/providers"."""
+    return fetch("movie", movie_id, facets=facets, language=language)
+
+
+def tv(
+    series_id: int, facets: Iterable[str] = (), language: Optional[str] = None
+) -> dict:
+    """Fetch the details and facets of a TV show, e.g. "credits",
+    "aggregate_credits", "content_ratings", "external_ids" or "watch/providers"."""
+    return fetch("tv", series_id, facets=facets, language=language)
+
+
+def season(
+    series_id: int,
+    season_number: int,
+    facets: Iterable[str] = (),
+    language: Optional[str] = None,
+) -> dict:
+    """Fetch the details and facets of a TV season, e.g. "credits",
+    "aggregate_credits", "images" or "videos"."""
+    return fetch("season", series_id, season_number, facets=facets, language=language)
+
+
+def episode(
+    series_id: int,
+    season_number: int,
+    episode_number: int,
+    facets: Iterable[str] = (),
+    language: Optional[str] = None,
+) -> dict:
+    """Fetch the details and facets of a TV episode, e.g. "credits",
+    "external_ids", "images" or "videos"."""
+    return fetch(
+        "episode",
+        series_id,
+        season_number,
+        episode_number,
+        facets=facets,
+        language=language,
+    )
+
+
+def person(
+    person_id: int, facets: Iterable[str] = (), language: Optional[str] = None
+) -> dict:
+    """Fetch the details and facets of a person, e.g. "combined_credits",
+    "external_ids" or "images"."""
+    return fetch("person", person_id, facets=facets, language=language)
@@ -0,0 +1,228 @@
+"""Incremental sync driven by the changes endpoints.
+
+`ChangeSync` keeps a high-water mark (the date of the last sync) in a
+state file. Each run walks the change lists since the mark in 14-day
+windows (the longest range TMDB accepts, status code 20), de-duplicates
+the IDs, and re-fetches only the changed entities concurrently.
+
+    >>> from tmdbapi.integration.sync import ChangeSync
+    >>> sync = ChangeSync("movie", "state/movie_sync.json", concurrency=16)
+    >>> for result in sync.run():
+    ...     if result.ok:
+    ...         save(result.value)
+
+The IDs which failed to fetch are kept in the state file and retried in
+the next runs, up to `max_retries` times, so an ID which always fails (e.g.
+a deleted movie, TMDB status code 34) is eventually dropped.
+"""
+
+import datetime
+import json
+import os
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+import tmdbapi
+from tmdbapi.batch import BatchResult
+from tmdbapi.batch import map as batch_map
+from tmdbapi.pages import iter_results
+
+__all__ = ["ChangeSync", "WINDOW_DAYS", "changed_ids"]
+
+# The longest date range of the changes endpoints.
+WINDOW_DAYS = 14
+
+
+def _change_list(kind: str) -> Callable:
+    return {
+        "movie": tmdbapi.api3.changes.movie_list,
+        "tv": tmdbapi.api3.changes.tv_list,
+        "person": tmdbapi.api3.changes.person_list,
+    }[kind]
+
+
+def _details(kind: str) -> Callable:
+    return {
+        "movie": tmdbapi.api3.movies.details,
+        "tv": tmdbapi.api3.tv_series.details,
+        "person": tmdbapi.api3.people.details,
+    }[kind]
+
+
+def _to_date(value) -> datetime.date:
+    if isinstance(value, str):
+        return datetime.date.fromisoformat(value)
+    return value
+
+
+def changed_ids(kind: str, start_date, end_date=None, concurrency: int = 1) -> list:
+    """Get the IDs changed between two dates.
+
+    Parameters
+    ----------
+    kind : str
+        "movie", "tv" or "person".
+    start_date : str or datetime.date
+        The first date, "YYYY-MM-DD".
+    end_date : str or datetime.date, optional
+        The last date. By default, today.
+    concurrency : int, optional
+        The number of pages of a window fetched at once, by default 1.
+
+    Returns
+    -------
+    list
+        The changed IDs without duplicates, in the order of the change lists.
+    """
+    func = _change_list(kind)
+    start = _to_date(start_date)
+    end = datetime.date.today() if end_date is None else _to_date(end_date)
+    ids = {}
+    while True:
+        window_end = min(start + datetime.timedelta(WINDOW_DAYS), end)
+        for item in iter_results(
+            func,
+            start_date=start.isoformat(),
+            end_date=window_end.isoformat(),
+            concurrency=concurrency,
+        ):
+            ids[item["id"]] = None
+        if window_end >= end:
+            break
+        # the windows overlap by a day, the duplicates are dropped
+        start = window_end
+    return list(ids)
+
+
+class ChangeSync:
+    """A change-driven sync of movies, TV shows or people.
+
+    Attributes
+    ----------
+    kind : str
+        "movie", "tv" or "person".
+    path : pathlib.Path
+        The JSON state file with the high-water mark and the failed IDs.
+    fetch : callable
+        The function called with each changed ID, by default the details
+        method of the kind, e.g. `api3.movies.details`.
+    concurrency : int
+        The maximum number of fetches in flight.
+    max_retries : int
+        The number of later runs retrying an ID which failed.
+
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        path: str,
+        fetch: Optional[Callable] = None,
+        concurrency: int = 8,
+        since=None,
+        max_retries: int = 3,
+    ):
+        """Create the sync.
+
+        Parameters
+        ----------
+        kind : str
+            "movie", "tv" or "person".
+        path : str
+            The JSON state file, created by the first run.
+        fetch : callable, optional
+            The function called with each changed ID. By default, the details
+            method of the kind.
+        concurrency : int, optional
+            The maximum number of fetches in flight, by default 8.
+        since : str or datetime.date, optional
+            The high-water mark of the first run, when there is no state
+            file. By default, yesterday.
+        max_retries : int, optional
+            The number of later runs retrying an ID which failed, by
+            default 3. The ID is then dropped from the state file.
+        """
+        if kind not in ("movie", "tv", "person"):
+            raise ValueError("kind should be 'movie', 'tv' or 'person'.")
+        self.kind = kind
+        self.path = Path(path)
+        self.fetch = _details(kind) if fetch is None else fetch
+        self.concurrency = concurrency
+        self._since = since
+        self.max_retries = max_retries
+
+    def __repr__(self):
+        return (
+            f"ChangeSync(kind={self.kind!r}, path={str(self.path)!r}, "
+            f"concurrency={self.concurrency})"
+        )
+
+    def load_state(self) -> dict:
+        """Load the state.
+
+        Returns
+        -------
+        dict
+            {"high_water_mark": "YYYY-MM-DD", "failed": [[id, attempts]]}
+        """
+        if self.path.is_file():
+            with open(self.path, "r") as f:
+                return json.load(f)
+        since = self._since
+        if since is None:
+            since = datetime.date.today() - datetime.timedelta(1)
+        return {"high_water_mark": _to_date(since).isoformat(), "failed": []}
+
+    def save_state(self, state: dict):
+        """Save the state atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp = self.path.with_name(self.path.name + ".tmp")
+        with open(temp, "w") as f:
+            json.dump(state, f)
+        os.replace(temp, self.path)
+
+    @property
+    def high_water_mark(self) -> datetime.date:
+        """The date up to which the changes have been synced."""
+        return _to_date(self.load_state()["high_water_mark"])
+
+    def run(self, until=None) -> Iterator[BatchResult]:
+        """Fetch the entities changed since the high-water mark.
+
+        The state is saved after the last result is consumed. If the run is
+        stopped early, the next run starts from the same mark.
+
+        Parameters
+        ----------
+        until : str or datetime.date, optional
+            The last date to sync. By default, today.
+
+        Yields
+        ------
+        tmdbapi.batch.BatchResult
+            The result of each changed ID, in no particular order.
+        """
+        state = self.load_state()
+        end = datetime.date.today() if until is None else _to_date(until)
+        ids = changed_ids(self.kind, state["high_water_mark"], end, self.concurrency)
+        # the failed IDs with the number of attempts, one if saved as a bare ID
+        attempts = dict(x if isinstance(x, list) else (x, 1) for x in state["failed"])
+        ids = list(dict.fromkeys(list(attempts) + ids))
+        tmdbapi.LOGGER.info(
+            f"Sync {self.kind}: {len(ids)} changed since {state['high_water_mark']}."
+        )
+        failed = []
+        for result in batch_map(
+            self.fetch, ids, concurrency=self.concurrency, ordered=False
+        ):
+            if not result.ok:
+                count = attempts.get(result.item, 0) + 1
+                if count <= self.max_retries:
+                    failed.append([result.item, count])
+                else:
+                    tmdbapi.LOGGER.warning(
+                        f"Sync {self.kind}: {result.item} dropped after {count} attempts."
+                    )
+            yield result
+        # the next run starts from the last date, which may have more changes
+        self.save_state({"high_water_mark": end.isoformat(), "failed": failed})
@@ -0,0 +1,94 @@
+"""Crawl a whole TV show.
+
+`crawl` fetches the details of a TV show, then all of its seasons
+concurrently, and optionally all of its episodes, each with its facets
+appended to the same request (see `tmdbapi.integration.facets`).
+
+    >>> from tmdbapi.integration import tv
+    >>> show = tv.crawl(1399, episode_facets=["external_ids"])
+    >>> show["details"]["name"]
+    'Game of Thrones'
+    >>> show["seasons"][1]["credits"]["cast"][0]["name"]
+    'Peter Dinklage'
+    >>> show["seasons"][1]["episodes"][0]["external_ids"]["imdb_id"]
+    'tt1480055'
+"""
+
+from typing import Iterable, Optional
+
+from tmdbapi.batch import map as batch_map
+from tmdbapi.integration import facets
+
+__all__ = ["crawl"]
+
+
+def crawl(
+    series_id: int,
+    series_facets: Iterable[str] = (),
+    season_facets: Iterable[str] = ("credits", "images", "external_ids"),
+    episode_facets: Optional[Iterable[str]] = None,
+    language: Optional[str] = None,
+    concurrency: int = 8,
+) -> dict:
+    """Fetch a TV show with all of its seasons and, optionally, episodes.
+
+    Parameters
+    ----------
+    series_id : int
+        The ID of the TV show.
+    series_facets : Iterable[str], optional
+        The facets of the TV show, e.g. ["credits", "external_ids"].
+    season_facets : Iterable[str], optional
+        The facets of each season, by default "credits", "images" and
+        "external_ids".
+    episode_facets : Iterable[str], optional
+        The facets of each episode, e.g. ["credits", "external_ids"]. By
+        default, the episodes are not fetched one by one; the season details
+        already list them.
+    language : str, optional
+        The language of the responses.
+    concurrency : int, optional
+        The maximum number of requests in flight, by default 8.
+
+    Returns
+    -------
+    dict
+        The tree {"details": ..., series facet: ..., "seasons": [season]}.
+        A season is {"details": ..., season facet: ...}, with "episodes":
+        [{"details": ..., episode facet: ...}] if `episode_facets` is given.
+
+    Raises
+    ------
+    TmdbApiException
+        If any request fails.
+    """
+    show = facets.tv(series_id, series_facets, language)
+    season_numbers = [s["season_number"] for s in show["details"].get("seasons", [])]
+    season_facets = list(season_facets)
+    show["seasons"] = [
+        result.unwrap()
+        for result in batch_map(
+            lambda n: facets.season(series_id, n, season_facets, language),
+            season_numbers,
+            concurrency=concurrency,
+        )
+    ]
+    if episode_facets is None:
+        return show
+
+    episode_facets = list(episode_facets)
+    numbers = [
+        (season["details"]["season_number"], episode["episode_number"])
+        for season in show["seasons"]
+        for episode in season["details"].get("episodes", [])
+    ]
+    episodes = {}
+    for result in batch_map(
+        lambda n: facets.episode(series_id, *n, episode_facets, language),
+        numbers,
+        concurrency=concurrency,
+    ):
+        episodes.setdefault(result.item[0], []).append(result.unwrap())
+    for season in show["seasons"]:
+        season["episodes"] = episodes.get(season["details"]["season_number"], [])
+    return show
@@ -0,0 +1,390 @@
+"""Typed Response Models
+
+Provides compact, slot-based models of the movies, TV shows, seasons,
+episodes and people returned by the API methods, as an opt-in alternative
+to the raw dicts:
+
+    >>> from tmdbapi import api3, models
+    >>> movie = models.Movie(api3.movies.details(550, append_to_response="credits"))
+    >>> movie.title, movie.release_date
+    ('Fight Club', '1999-10-15')
+    >>> movie.credits.cast[0].name
+    'Edward Norton'
+    >>> movies = models.parse("movie", api3.discover.movies()["results"])
+
+The scalar fields are kept in `__slots__` and the other keys of the
+response are dropped, so a model takes a fraction of the memory of its
+dict. The nested fields (credits, images, seasons, ...) stay as they were
+decoded until first accessed, then are converted to models (lists to
+tuples) once.
+"""
+
+__all__ = [
+    "MODELS",
+    "CastMember",
+    "Company",
+    "Credits",
+    "CrewMember",
+    "Episode",
+    "Genre",
+    "Image",
+    "Images",
+    "Model",
+    "Movie",
+    "Person",
+    "Season",
+    "TvSeries",
+    "WatchProvider",
+    "parse",
+]
+
+
+class _Nested:
+    """A nested field decoded to models on first access.
+
+    The value is kept in the slot of the same name prefixed by "_".
+    """
+
+    __slots__ = ("model", "name", "slot")
+
+    def __init__(self, model: type):
+        self.model = model
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.slot = getattr(owner, "_" + name)
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        value = self.slot.__get__(obj)
+        if type(value) is dict:
+            value = self.model(value)
+            self.slot.__set__(obj, value)
+        elif type(value) is list:
+            value = tuple(map(self.model, value))
+            self.slot.__set__(obj, value)
+        return value
+
+    def __set__(self, obj, value):
+        self.slot.__set__(obj, value)
+
+
+def _raw(value):
+    if isinstance(value, Model):
+        return value.to_dict()
+    if isinstance(value, tuple):
+        return [_raw(x) for x in value]
+    return value
+
+
+class Model:
+    """The base of the models.
+
+    A model is created from the dict of a response, e.g.
+    `Movie(api3.movies.details(550))`. The missing fields are None.
+    """
+
+    __slots__ = ()
+    _fields = ()  # the names of the scalar fields
+    _nested = ()  # the names of the nested fields
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._fields = tuple(s for s in cls.__slots__ if not s.startswith("_"))
+        cls._nested = tuple(
+            name for name, value in vars(cls).items() if isinstance(value, _Nested)
+        )
+
+    def __init__(self, data: dict):
+        get = data.get
+        for name in self._fields:
+            setattr(self, name, get(name))
+        for name in self._nested:
+            setattr(self, "_" + name, get(name))
+
+    def __repr__(self):
+        fields = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name in self._fields[:2]
+        )
+        return f"{type(self).__name__}({fields})"
+
+    def __eq__(self, other):
+        if type(self) is not type(other):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def to_dict(self) -> dict:
+        """Convert the model back to a dict of its fields.
+
+        Returns
+        -------
+        dict
+        """
+        data = {name: getattr(self, name) for name in self._fields}
+        for name in self._nested:
+            data[name] = _raw(getattr(self, "_" + name))
+        return data
+
+
+class Genre(Model):
+    __slots__ = ("id", "name")
+
+
+class Company(Model):
+    """A production company or a TV network."""
+
+    __slots__ = ("id", "name", "logo_path", "origin_country")
+
+
+class Image(Model):
+    __slots__ = (
+        "file_path",
+        "aspect_ratio",
+        "height",
+        "width",
+        "iso_639_1",
+        "vote_average",
+        "vote_count",
+    )
+
+
+class Images(Model):
+    """The images of a movie, TV show, season, episode or person."""
+
+    __slots__ = ("id", "_backdrops", "_logos", "_posters", "_profiles", "_stills")
+    backdrops = _Nested(Image)
+    logos = _Nested(Image)
+    posters = _Nested(Image)
+    profiles = _Nested(Image)
+    stills = _Nested(Image)
+
+
+class CastMember(Model):
+    __slots__ = (
+        "id",
+        "name",
+        "original_name",
+        "character",
+        "credit_id",
+        "order",
+        "cast_id",
+        "gender",
+        "adult",
+        "known_for_department",
+        "popularity",
+        "profile_path",
+        "total_episode_count",
+    )
+
+
+class CrewMember(Model):
+    __slots__ = (
+        "id",
+        "name",
+        "original_name",
+        "department",
+        "job",
+        "credit_id",
+        "gender",
+        "adult",
+        "known_for_department",
+        "popularity",
+        "profile_path",
+    )
+
+
+class Credits(Model):
+    """The cast and crew of a movie, TV show, season or episode."""
+
+    __slots__ = ("id", "_cast", "_crew", "_guest_stars")
+    cast = _Nested(CastMember)
+    crew = _Nested(CrewMember)
+    guest_stars = _Nested(CastMember)
+
+
+class WatchProvider(Model):
+    """A streaming, rental or purchase provider of a country, e.g. an item
+    of `api3.movies.watch_providers(550)["results"]["US"]["flatrate"]`."""
+
+    __slots__ = ("provider_id", "provider_name", "logo_path", "display_priority")
+
+
+class Movie(Model):
+    """A movie, from the details or from a list of results."""
+
+    __slots__ = (
+        "id",
+        "title",
+        "original_title",
+        "original_language",
+        "overview",
+        "tagline",
+        "release_date",
+        "status",
+        "runtime",
+        "budget",
+        "revenue",
+        "popularity",
+        "vote_average",
+        "vote_count",
+        "adult",
+        "video",
+        "imdb_id",
+        "homepage",
+        "poster_path",
+        "backdrop_path",
+        "genre_ids",
+        "_genres",
+        "_production_companies",
+        "_credits",
+        "_images",
+    )
+    genres = _Nested(Genre)
+    production_companies = _Nested(Company)
+    credits = _Nested(Credits)
+    images = _Nested(Images)
+
+
+class Episode(Model):
+    __slots__ = (
+        "id",
+        "name",
+        "overview",
+        "air_date",
+        "season_number",
+        "episode_number",
+        "episode_type",
+        "production_code",
+        "runtime",
+        "show_id",
+        "still_path",
+        "vote_average",
+        "vote_count",
+        "_crew",
+        "_guest_stars",
+        "_credits",
+        "_images",
+    )
+    crew = _Nested(CrewMember)
+    guest_stars = _Nested(CastMember)
+    credits = _Nested(Credits)
+    images = _Nested(Images)
+
+
+class Season(Model):
+    __slots__ = (
+        "id",
+        "name",
+        "overview",
+        "air_date",
+        "season_number",
+        "episode_count",
+        "poster_path",
+        "vote_average",
+        "_episodes",
+        "_credits",
+        "_images",
+    )
+    episodes = _Nested(Episode)
+    credits = _Nested(Credits)
+    images = _Nested(Images)
+
+
+class TvSeries(Model):
+    """A TV show, from the details or from a list of results."""
+
+    __slots__ = (
+        "id",
+        "name",
+        "original_name",
+        "original_language",
+        "origin_country",
+        "overview",
+        "tagline",
+        "first_air_date",
+        "last_air_date",
+        "status",
+        "type",
+        "in_production",
+        "number_of_seasons",
+        "number_of_episodes",
+        "popularity",
+        "vote_average",
+        "vote_count",
+        "adult",
+        "homepage",
+        "poster_path",
+        "backdrop_path",
+        "genre_ids",
+        "_genres",
+        "_networks",
+        "_production_companies",
+        "_seasons",
+        "_credits",
+        "_images",
+    )
+    genres = _Nested(Genre)
+    networks = _Nested(Company)
+    production_companies = _Nested(Company)
+    seasons = _Nested(Season)
+    credits = _Nested(Credits)
+    images = _Nested(Images)
+
+
+class Person(Model):
+    """A person, from the details or from a list of results."""
+
+    __slots__ = (
+        "id",
+        "name",
+        "also_known_as",
+        "biography",
+        "birthday",
+        "deathday",
+        "place_of_birth",
+        "gender",
+        "adult",
+        "known_for_department",
+        "popularity",
+        "imdb_id",
+        "homepage",
+        "profile_path",
+        "_images",
+    )
+    images = _Nested(Images)
+
+
+# The model of each kind, named like the kinds of `tmdbapi.store`.
+MODELS = {
+    "movie": Movie,
+    "tv": TvSeries,
+    "season": Season,
+    "episode": Episode,
+    "person": Person,
+    "company": Company,
+}
+
+
+def parse(kind: str, data):
+    """Convert a response, or a list of results, to models.
+
+    Parameters
+    ----------
+    kind : str
+        "movie", "tv", "season", "episode", "person" or "company".
+    data : dict or list
+        The response, e.g. `api3.movies.details(550)`, or the results of a
+        list, e.g. `api3.discover.movies()["results"]`.
+
+    Returns
+    -------
+    Model or list
+        The model, or the list of models.
+    """
+    if kind not in MODELS:
+        raise ValueError(f"kind should be one of {', '.join(MODELS)}.")
+    model = MODELS[kind]
+    if isinstance(data, list):
+        return [model(x) for x in data]
+    return model(data)
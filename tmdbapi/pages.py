@@ -0,0 +1,277 @@
+"""Auto-pagination
+
+Provides iterators over the items of the paged API methods, e.g.
+`api3.search.movies`, `api3.discover.movies` or `api4.account.watchlist_movies`.
+The next page is fetched in the background while the current page is
+consumed, or all remaining pages are fetched concurrently with
+`concurrency` once the first page tells `total_pages`.
+
+    >>> from tmdbapi import api3, pages
+    >>> for movie in pages.iter_results(api3.search.movies, "alien"):
+    ...     print(movie["title"])
+
+The coroutine versions in `tmdbapi.aio` are iterated with `aiter_results`.
+"""
+
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Iterator, Optional
+
+from tmdbapi import batch
+
+__all__ = ["MAX_PAGE", "aiter_pages", "aiter_results", "iter_pages", "iter_results"]
+
+# TMDB rejects the requests for pages after 500 (status code 22).
+MAX_PAGE = 500
+
+
+def _last_page(
+    response: dict, start_page: int, max_pages: Optional[int]
+) -> Optional[int]:
+    """Get the last page to fetch, None if it is unknown."""
+    last = response.get("total_pages")
+    if last is not None:
+        last = min(last, MAX_PAGE)
+    if max_pages is not None:
+        limit = start_page + max_pages - 1
+        last = limit if last is None else min(last, limit)
+    return last
+
+
+def _has_next(response: dict, page: int, last: Optional[int]) -> bool:
+    if last is None:
+        return bool(response.get("results")) and page < MAX_PAGE
+    return page < last
+
+
+def iter_pages(
+    func: Callable,
+    *args,
+    start_page: int = 1,
+    max_pages: Optional[int] = None,
+    prefetch: bool = True,
+    concurrency: int = 1,
+    ordered: bool = True,
+    **kwargs,
+) -> Iterator[dict]:
+    """Iterate over the pages of a paged API method.
+
+    Parameters
+    ----------
+    func : callable
+        The paged API method, called as `func(*args, page=page, **kwargs)`.
+    *args
+        The positional arguments of `func`.
+    start_page : int, optional
+        The first page, by default 1.
+    max_pages : int, optional
+        The maximum number of pages. By default, all pages up to
+        `total_pages` (at most 500).
+    prefetch : bool, optional
+        Whether to fetch the next page in the background while the current
+        one is consumed, by default True.
+    concurrency : int, optional
+        The number of pages fetched at once after the first page, by default
+        1. When more than 1 and the first page has `total_pages`, the
+        remaining pages are fetched concurrently instead of one by one.
+    ordered : bool, optional
+        Whether to yield the pages in order (default), or as soon as they
+        arrive when `concurrency` is more than 1.
+    **kwargs
+        The other keyword arguments of `func`.
+
+    Yields
+    ------
+    dict
+        The response of each page.
+    """
+    if max_pages is not None and max_pages < 1:
+        return
+    page = start_page
+    response = func(*args, page=page, **kwargs)
+    last = _last_page(response, start_page, max_pages)
+    if concurrency > 1 and last is not None:
+        yield response
+        results = batch.map(
+            lambda p: func(*args, page=p, **kwargs),
+            range(page + 1, last + 1),
+            concurrency=concurrency,
+            ordered=ordered,
+        )
+        for result in results:
+            yield result.unwrap()
+        return
+    if not prefetch:
+        while True:
+            yield response
+            if not _has_next(response, page, last):
+                return
+            page += 1
+            response = func(*args, page=page, **kwargs)
+
+    executor = ThreadPoolExecutor(1, thread_name_prefix="tmdbapi-pages")
+    try:
+        while True:
+            future = None
+            if _has_next(response, page, last):
+                # run in the context of the caller, e.g. `setting.override`
+                context = contextvars.copy_context()
+                future = executor.submit(
+                    context.run, func, *args, page=page + 1, **kwargs
+                )
+            yield response
+            if future is None:
+                return
+            page += 1
+            response = future.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_results(
+    func: Callable,
+    *args,
+    start_page: int = 1,
+    max_pages: Optional[int] = None,
+    prefetch: bool = True,
+    concurrency: int = 1,
+    ordered: bool = True,
+    **kwargs,
+) -> Iterator:
+    """Iterate over the result items of a paged API method across pages.
+
+    Parameters
+    ----------
+    func : callable
+        The paged API method, called as `func(*args, page=page, **kwargs)`.
+    *args
+        The positional arguments of `func`.
+    start_page : int, optional
+        The first page, by default 1.
+    max_pages : int, optional
+        The maximum number of pages. By default, all pages up to
+        `total_pages` (at most 500).
+    prefetch : bool, optional
+        Whether to fetch the next page in the background while the current
+        one is consumed, by default True.
+    concurrency : int, optional
+        The number of pages fetched at once after the first page, by default
+        1. When more than 1 and the first page has `total_pages`, the
+        remaining pages are fetched concurrently instead of one by one.
+    ordered : bool, optional
+        Whether to yield the pages in order (default), or as soon as they
+        arrive when `concurrency` is more than 1.
+    **kwargs
+        The other keyword arguments of `func`.
+
+    Yields
+    ------
+    Any
+        The items in the "results" of each page.
+
+    Example
+    -------
+    >>> movies = pages.iter_results(api3.discover.movies, with_genres="878")
+    >>> first_100 = list(itertools.islice(movies, 100))
+
+    To fetch all pages with 16 requests at once:
+    >>> movies = list(pages.iter_results(api3.discover.movies, concurrency=16))
+
+    """
+    for response in iter_pages(
+        func,
+        *args,
+        start_page=start_page,
+        max_pages=max_pages,
+        prefetch=prefetch,
+        concurrency=concurrency,
+        ordered=ordered,
+        **kwargs,
+    ):
+        yield from response.get("results", [])
+
+
+async def aiter_pages(
+    func: Callable,
+    *args,
+    start_page: int = 1,
+    max_pages: Optional[int] = None,
+    prefetch: bool = True,
+    concurrency: int = 1,
+    ordered: bool = True,
+    **kwargs,
+) -> AsyncIterator[dict]:
+    """The asynchronous version of `iter_pages` for the `tmdbapi.aio`
+    methods, e.g. `aio.api3.search.movies`."""
+    if max_pages is not None and max_pages < 1:
+        return
+    page = start_page
+    response = await func(*args, page=page, **kwargs)
+    last = _last_page(response, start_page, max_pages)
+    if concurrency > 1 and last is not None:
+        yield response
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(p):
+            async with semaphore:
+                return await func(*args, page=p, **kwargs)
+
+        tasks = [asyncio.ensure_future(fetch(p)) for p in range(page + 1, last + 1)]
+        try:
+            for task in tasks if ordered else asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+        return
+    task = None
+    try:
+        while True:
+            task = None
+            if _has_next(response, page, last):
+                next_page = func(*args, page=page + 1, **kwargs)
+                task = asyncio.ensure_future(next_page) if prefetch else next_page
+            yield response
+            if task is None:
+                return
+            page += 1
+            response = await task
+    finally:
+        if isinstance(task, asyncio.Future):
+            task.cancel()
+        elif task is not None:
+            task.close()
+
+
+async def aiter_results(
+    func: Callable,
+    *args,
+    start_page: int = 1,
+    max_pages: Optional[int] = None,
+    prefetch: bool = True,
+    concurrency: int = 1,
+    ordered: bool = True,
+    **kwargs,
+) -> AsyncIterator:
+    """The asynchronous version of `iter_results` for the `tmdbapi.aio`
+    methods.
+
+    Example
+    -------
+    >>> async for movie in pages.aiter_results(aio.api3.search.movies, "alien"):
+    ...     print(movie["title"])
+
+    """
+    async for response in aiter_pages(
+        func,
+        *args,
+        start_page=start_page,
+        max_pages=max_pages,
+        prefetch=prefetch,
+        concurrency=concurrency,
+        ordered=ordered,
+        **kwargs,
+    ):
+        for item in response.get("results", []):
+            yield item
@@ -0,0 +1,228 @@
+"""Client-side Rate Limiting
+
+Provides token bucket rate limiters to keep requests under the TMDB rate
+limit (HTTP 429, status code 25). `RateLimiter` is shared by the threads of
+one process and `FileRateLimiter` by all processes on one host.
+
+    >>> import tmdbapi
+    >>> from tmdbapi.ratelimit import RateLimiter
+    >>> tmdbapi.setting.rate_limit(RateLimiter(calls=40, period=1.0))
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+__all__ = ["RateLimiter", "FileRateLimiter"]
+
+
+class RateLimiter:
+    """A thread-safe token bucket rate limiter.
+
+    The bucket holds up to `burst` tokens and refills at `calls / period`
+    tokens per second. Every request takes one token, and waits for it when
+    the bucket is empty. Waiting requests reserve their tokens in order, so
+    the limiter is fair across threads.
+
+    Attributes
+    ----------
+    calls : int
+        The number of requests allowed per `period`.
+    period : float
+        The length of the period in seconds.
+    burst : int
+        The maximum number of requests sent at once after being idle.
+
+    """
+
+    def __init__(
+        self, calls: int = 40, period: float = 1.0, burst: Optional[int] = None
+    ):
+        """Create the rate limiter.
+
+        Parameters
+        ----------
+        calls : int, optional
+            The number of requests allowed per `period`, by default 40.
+        period : float, optional
+            The length of the period in seconds, by default 1.0.
+        burst : int, optional
+            The bucket size. By default, the same as `calls`.
+        """
+        if calls <= 0 or period <= 0:
+            raise ValueError("calls and period should be positive.")
+        self.calls = calls
+        self.period = period
+        self.burst = calls if burst is None else burst
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+
+    def __repr__(self):
+        return (
+            f"{type(self).__name__}(calls={self.calls}, period={self.period}, "
+            f"burst={self.burst})"
+        )
+
+    @property
+    def rate(self) -> float:
+        """The refill rate in tokens per second."""
+        return self.calls / self.period
+
+    def _take(self, tokens: float, updated: float, now: float) -> tuple:
+        """Refill the bucket and take one token.
+
+        Returns
+        -------
+        tuple
+            (tokens, wait): the tokens left and the seconds to wait.
+        """
+        tokens = min(self.burst, tokens + (now - updated) * self.rate) - 1
+        wait = -tokens / self.rate if tokens < 0 else 0.0
+        return tokens, wait
+
+    def reserve(self) -> float:
+        """Reserve a token without waiting.
+
+        Returns
+        -------
+        float
+            The seconds to wait before sending the request.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens, wait = self._take(self._tokens, self._updated, now)
+            self._updated = now
+        return wait
+
+    def acquire(self):
+        """Wait until a request may be sent."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    def penalize(self, seconds: float):
+        """Hold back all requests for `seconds`.
+
+        Called when TMDB still answers with HTTP 429, e.g. because other
+        clients share the same API key.
+
+        Parameters
+        ----------
+        seconds : float
+            The seconds to wait, usually from the Retry-After header.
+        """
+        with self._lock:
+            now = time.monotonic()
+            tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._tokens = min(tokens, -seconds * self.rate)
+            self._updated = now
+
+
+class FileRateLimiter(RateLimiter):
+    """A token bucket rate limiter shared by processes through a file.
+
+    The bucket state is kept in a small file and updated under an exclusive
+    file lock, so all worker processes on one host using the same file share
+    one rate limit. It is also safe across threads.
+
+    Attributes
+    ----------
+    path : pathlib.Path
+        The file path of the bucket state.
+
+    """
+
+    def __init__(
+        self,
+        path: str,
+        calls: int = 40,
+        period: float = 1.0,
+        burst: Optional[int] = None,
+    ):
+        """Create the rate limiter.
+
+        Parameters
+        ----------
+        path : str
+            The file path of the bucket state. Processes using the same path
+            share the limit. The file is created if it does not exist.
+        calls : int, optional
+            The number of requests allowed per `period`, by default 40.
+        period : float, optional
+            The length of the period in seconds, by default 1.0.
+        burst : int, optional
+            The bucket size. By default, the same as `calls`.
+        """
+        super().__init__(calls, period, burst)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.touch(exist_ok=True)
+
+    def __repr__(self):
+        return (
+            f"FileRateLimiter(path={str(self.path)!r}, calls={self.calls}, "
+            f"period={self.period}, burst={self.burst})"
+        )
+
+    @contextmanager
+    def _state(self):
+        """Lock the file and yield the state, written back on exit.
+
+        The state is a list [tokens, updated], with time from `time.time()`
+        which is the same for all processes.
+        """
+        with self._lock, open(self.path, "r+b") as f:
+            _lock_file(f)
+            try:
+                raw = f.read().split()
+                if len(raw) == 2:
+                    state = [float(raw[0]), float(raw[1])]
+                else:
+                    state = [float(self.burst), time.time()]
+                yield state
+                f.seek(0)
+                f.truncate()
+                f.write(f"{state[0]!r} {state[1]!r}".encode())
+                f.flush()
+            finally:
+                _unlock_file(f)
+
+    def reserve(self) -> float:
+        with self._state() as state:
+            now = time.time()
+            state[0], wait = self._take(state[0], state[1], now)
+            state[1] = now
+        return wait
+
+    def penalize(self, seconds: float):
+        with self._state() as state:
+            now = time.time()
+            tokens = min(self.burst, state[0] + (now - state[1]) * self.rate)
+            state[0] = min(tokens, -seconds * self.rate)
+            state[1] = now
+
+
+def _lock_file(f):
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        f.seek(0)
+
+
+def _unlock_file(f):
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
@@ -0,0 +1,346 @@
+"""Local Mirror Store
+
+Provides `Store`, a local SQLite mirror of the fetched movies, TV shows,
+seasons, episodes, people, companies and collections. Each payload is kept
+as a JSON column next to indexed fields (IMDb ID, date, popularity, title),
+so warm data is read locally instead of from the TMDB API.
+
+    >>> import tmdbapi
+    >>> from tmdbapi.store import Store
+    >>> store = Store("mirror.sqlite")
+    >>> tmdbapi.setting.store(store)  # upsert every fetched details payload
+    >>> movie = tmdbapi.api3.movies.details(550)
+    >>> store.movie(550)["title"]
+    'Fight Club'
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlparse
+
+__all__ = ["KINDS", "Store"]
+
+# The kind of entity of each details endpoint.
+KINDS = {
+    "movie-details": "movie",
+    "tv-series-details": "tv",
+    "tv-season-details": "season",
+    "tv-episode-details": "episode",
+    "person-details": "person",
+    "company-details": "company",
+    "collection-details": "collection",
+}
+
+# The payload fields extracted into the indexed columns.
+_DATE_FIELDS = ("release_date", "first_air_date", "air_date", "birthday")
+_TITLE_FIELDS = ("title", "name")
+
+
+def _key(*ids) -> str:
+    return "/".join(str(x) for x in ids)
+
+
+def _url_key(url: str) -> str:
+    """Get the key from the IDs in a URL, e.g. "1399/1/2" from
+    "https://api.themoviedb.org/3/tv/1399/season/1/episode/2"."""
+    segments = urlparse(url).path.split("/")[2:]
+    return _key(*(s for s in segments if s.isdigit()))
+
+
+def _first(data: dict, fields: tuple):
+    for field in fields:
+        if data.get(field):
+            return data[field]
+    return None
+
+
+class Store:
+    """A local SQLite mirror of TMDB entities.
+
+    The entities are keyed by kind, their IDs in the URL (e.g. "1399/1" for
+    season 1 of the TV show 1399) and language. Like `tmdbapi.cache.SQLiteCache`,
+    it uses write-ahead logging and one connection per thread, so it can be
+    shared by threads and processes.
+
+    Attributes
+    ----------
+    path : pathlib.Path
+        The path of the SQLite file.
+
+    """
+
+    def __init__(self, path: str):
+        """Create or open the store.
+
+        Parameters
+        ----------
+        path : str
+            The path of the SQLite file, created if it does not exist.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        conn = self._connect()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS entities ("
+            "kind TEXT, key TEXT, language TEXT, imdb_id TEXT, title TEXT, "
+            "date TEXT, popularity REAL, data TEXT, updated REAL, "
+            "PRIMARY KEY (kind, key, language))"
+        )
+        for column in ("imdb_id", "date", "popularity"):
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS entities_{column} "
+                f"ON entities (kind, {column})"
+            )
+
+    def __repr__(self):
+        return f"Store(path={str(self.path)!r})"
+
+    def __len__(self):
+        return self._connect().execute("SELECT COUNT(*) FROM entities").fetchone()[0]
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get the connection of the current thread."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def save(self, request, content: bytes):
+        """Upsert the response of a details request.
+
+        Called by the API methods for every response fetched from TMDB when
+        the store is set with `tmdbapi.setting.store`. The responses of the
+        other endpoints are ignored.
+
+        The response is merged into the stored payload, so the sections of
+        an earlier `append_to_response` (e.g. "credits") which the response
+        does not include are kept.
+
+        Parameters
+        ----------
+        request : tmdbapi._core.Request
+            The prepared request.
+        content : bytes
+            The JSON response body.
+        """
+        kind = KINDS.get(request.endpoint)
+        if kind is None or request.method != "GET":
+            return
+        key = _url_key(request.url)
+        language = request.params.get("language")
+        data = json.loads(content)
+        conn = self._connect()
+        # read and write in one transaction, not to lose a concurrent save
+        conn.execute("BEGIN IMMEDIATE")
+        with conn:
+            stored = self.get(kind, key, language=language)
+            if stored is not None:
+                data = {**stored, **data}
+            self.upsert(kind, key, data, language)
+
+    def upsert(self, kind: str, key, data: dict, language: Optional[str] = None):
+        """Insert or replace an entity.
+
+        Parameters
+        ----------
+        kind : str
+            "movie", "tv", "season", "episode", "person", "company" or
+            "collection".
+        key : int or str
+            The ID, or the IDs joined by "/" for a season or an episode,
+            e.g. "1399/1/2".
+        data : dict
+            The payload.
+        language : str, optional
+            The language of the payload.
+        """
+        imdb_id = data.get("imdb_id") or data.get("external_ids", {}).get("imdb_id")
+        self._connect().execute(
+            "INSERT OR REPLACE INTO entities VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                kind,
+                str(key),
+                language or "",
+                imdb_id,
+                _first(data, _TITLE_FIELDS),
+                _first(data, _DATE_FIELDS),
+                data.get("popularity"),
+                json.dumps(data, ensure_ascii=False),
+                time.time(),
+            ),
+        )
+
+    def get(
+        self,
+        kind: str,
+        *ids,
+        language: Optional[str] = None,
+        max_age: Optional[float] = None,
+    ) -> Optional[dict]:
+        """Get an entity.
+
+        Parameters
+        ----------
+        kind : str
+            The kind of entity, e.g. "movie".
+        *ids
+            The ID, or the IDs of a season or an episode, e.g. 1399, 1, 2.
+        language : str, optional
+            The language of the payload.
+        max_age : float, optional
+            The maximum seconds since the entity was stored.
+
+        Returns
+        -------
+        dict or None
+            The payload, or None if it is not stored or too old.
+        """
+        row = (
+            self._connect()
+            .execute(
+                "SELECT data, updated FROM entities "
+                "WHERE kind = ? AND key = ? AND language = ?",
+                (kind, _key(*ids), language or ""),
+            )
+            .fetchone()
+        )
+        if row is None or (max_age is not None and time.time() - row[1] > max_age):
+            return None
+        return json.loads(row[0])
+
+    def movie(self, movie_id: int, language: Optional[str] = None) -> Optional[dict]:
+        """Get a movie, shaped like `api3.movies.details`."""
+        return self.get("movie", movie_id, language=language)
+
+    def tv(self, series_id: int, language: Optional[str] = None) -> Optional[dict]:
+        """Get a TV show, shaped like `api3.tv_series.details`."""
+        return self.get("tv", series_id, language=language)
+
+    def season(
+        self, series_id: int, season_number: int, language: Optional[str] = None
+    ) -> Optional[dict]:
+        """Get a TV season, shaped like `api3.tv_seasons.details`."""
+        return self.get("season", series_id, season_number, language=language)
+
+    def episode(
+        self,
+        series_id: int,
+        season_number: int,
+        episode_number: int,
+        language: Optional[str] = None,
+    ) -> Optional[dict]:
+        """Get a TV episode, shaped like `api3.tv_episodes.details`."""
+        return self.get(
+            "episode", series_id, season_number, episode_number, language=language
+        )
+
+    def person(self, person_id: int, language: Optional[str] = None) -> Optional[dict]:
+        """Get a person, shaped like `api3.people.details`."""
+        return self.get("person", person_id, language=language)
+
+    def company(self, company_id: int) -> Optional[dict]:
+        """Get a company, shaped like `api3.companies.details`."""
+        return self.get("company", company_id)
+
+    def collection(
+        self, collection_id: int, language: Optional[str] = None
+    ) -> Optional[dict]:
+        """Get a collection, shaped like `api3.collections.details`."""
+        return self.get("collection", collection_id, language=language)
+
+    def find_imdb_id(self, imdb_id: str, kind: Optional[str] = None) -> Optional[dict]:
+        """Get an entity by IMDb ID.
+
+        Parameters
+        ----------
+        imdb_id : str
+            The IMDb ID, e.g. "tt0137523".
+        kind : str, optional
+            The kind of entity. By default, any kind.
+
+        Returns
+        -------
+        dict or None
+        """
+        sql = "SELECT data FROM entities WHERE imdb_id = ?"
+        args = [imdb_id]
+        if kind is not None:
+            sql += " AND kind = ?"
+            args.append(kind)
+        row = self._connect().execute(sql + " LIMIT 1", args).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def query(
+        self,
+        kind: str,
+        date_gte: Optional[str] = None,
+        date_lte: Optional[str] = None,
+        popularity_gte: Optional[float] = None,
+        language: Optional[str] = None,
+        order_by: str = "popularity.desc",
+        limit: Optional[int] = 100,
+    ) -> list:
+        """Query the entities of a kind by the indexed fields.
+
+        Parameters
+        ----------
+        kind : str
+            The kind of entity, e.g. "movie".
+        date_gte, date_lte : str, optional
+            The range of the release, first air, air or birth date,
+            "YYYY-MM-DD".
+        popularity_gte : float, optional
+            The minimum popularity.
+        language : str, optional
+            The language of the payloads.
+        order_by : str, optional
+            "popularity.desc" (default), "popularity.asc", "date.desc" or
+            "date.asc".
+        limit : int, optional
+            The maximum number of entities, by default 100. None for all.
+
+        Returns
+        -------
+        list
+            The payloads.
+        """
+        column, _, direction = order_by.partition(".")
+        if column not in ("popularity", "date") or direction not in ("asc", "desc"):
+            raise ValueError(f"order_by {order_by} is not supported.")
+        sql = "SELECT data FROM entities WHERE kind = ? AND language = ?"
+        args = [kind, language or ""]
+        for condition, value in (
+            ("date >= ?", date_gte),
+            ("date <= ?", date_lte),
+            ("popularity >= ?", popularity_gte),
+        ):
+            if value is not None:
+                sql += f" AND {condition}"
+                args.append(value)
+        sql += f" ORDER BY {column} {direction.upper()}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            args.append(limit)
+        return [json.loads(row[0]) for row in self._connect().execute(sql, args)]
+
+    def delete(self, kind: str, *ids, language: Optional[str] = None):
+        """Delete an entity if it exists."""
+        self._connect().execute(
+            "DELETE FROM entities WHERE kind = ? AND key = ? AND language = ?",
+            (kind, _key(*ids), language or ""),
+        )
+
+    def close(self):
+        """Close the connection of the current thread."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
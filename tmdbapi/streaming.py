@@ -0,0 +1,196 @@
+"""Streaming JSON Parsing
+
+Parses the items of one list of a response while its body arrives, so the
+peak memory stays about the size of one item, not of the whole response.
+The list is given by the path of its keys, e.g. "cast" or "images.posters":
+
+    >>> import tmdbapi
+    >>> with tmdbapi.setting.override(stream="cast"):
+    ...     cast = api3.tv_series.aggregate_credits(1399)
+    >>> for member in cast:
+    ...     print(member["name"])
+
+The values before and after the list are skipped without being decoded.
+"""
+
+import codecs
+import json
+import re
+from typing import Iterable, Iterator
+
+__all__ = ["iter_items"]
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_STRING = re.compile(r'"(?:[^"\\]|\\.)*"', re.DOTALL)
+_SCALAR = re.compile(r"[^,:{}\[\]\s]+")
+# the text up to the next bracket, the strings included
+_PLAIN = re.compile(r'(?:[^"{}\[\]]+|"(?:[^"\\]|\\.)*")*', re.DOTALL)
+_DECODER = json.JSONDecoder()
+_NUMBER = frozenset("0123456789+-.eE")
+
+
+class _Reader:
+    """A buffer over the chunks of a JSON body."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._decode = codecs.getincrementaldecoder("utf-8")().decode
+        self.buffer = ""
+        self.pos = 0
+        self.mark = None  # the start of the item being read
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Read the next chunk, dropping the text already parsed."""
+        if self.eof:
+            return False
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self.eof = True
+            text = self._decode(b"", final=True)
+        else:
+            text = self._decode(chunk)
+        cut = self.pos if self.mark is None else self.mark
+        self.buffer = self.buffer[cut:] + text
+        self.pos -= cut
+        if self.mark is not None:
+            self.mark -= cut
+        return True
+
+    def error(self, message: str):
+        raise ValueError(f"{message} at character {self.pos} of the buffer.")
+
+    def next_char(self) -> str:
+        """Skip the whitespace and get the next character."""
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                self.error("Unexpected end of the body")
+
+    def expect(self, char: str):
+        if self.next_char() != char:
+            self.error(f'Expected "{char}"')
+        self.pos += 1
+
+    def string(self) -> str:
+        if self.next_char() != '"':
+            self.error("Expected a string")
+        while True:
+            match = _STRING.match(self.buffer, self.pos)
+            if match is not None:
+                self.pos = match.end()
+                return json.loads(match.group())
+            if not self.fill():
+                self.error("Unterminated string")
+
+    def skip(self):
+        """Move after the next value."""
+        char = self.next_char()
+        if char == '"':
+            self.string()
+        elif char in "{[":
+            depth = 0
+            while True:
+                # jump over the strings and the other characters at once
+                self.pos = _PLAIN.match(self.buffer, self.pos).end()
+                if self.pos == len(self.buffer) or self.buffer[self.pos] == '"':
+                    # the end of the buffer, or a string continued in the next chunk
+                    if not self.fill():
+                        self.error("Unexpected end of the body")
+                    continue
+                depth += 1 if self.buffer[self.pos] in "{[" else -1
+                self.pos += 1
+                if depth == 0:
+                    return
+        else:
+            while True:
+                match = _SCALAR.match(self.buffer, self.pos)
+                if match is None:
+                    self.error("Expected a value")
+                # a number may continue in the next chunk
+                if match.end() < len(self.buffer) or not self.fill():
+                    self.pos = match.end()
+                    return
+
+    def value(self):
+        """Decode the next value."""
+        self.next_char()
+        self.mark = self.pos
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buffer, self.mark)
+            except json.JSONDecodeError:
+                # the value may continue in the next chunk
+                if not self.fill():
+                    raise
+                continue
+            # e.g. "1" of "1.5" continued in the next chunk
+            if end < len(self.buffer) and self.buffer[end] not in _NUMBER:
+                break
+            if not self.fill():
+                break
+        self.pos = end
+        self.mark = None
+        return value
+
+    def find(self, keys: list) -> bool:
+        """Move inside the list at the path of keys, or return False if a
+        key is missing or its value is null."""
+        for i, key in enumerate(keys):
+            self.expect("{")
+            while True:
+                if self.next_char() == "}":
+                    return False
+                name = self.string()
+                self.expect(":")
+                if name == key:
+                    break
+                self.skip()
+                if self.next_char() == ",":
+                    self.pos += 1
+            char = self.next_char()
+            if char == "n":
+                return False  # null
+            if i == len(keys) - 1 and char != "[":
+                self.error(f'"{key}" is not a list')
+        self.expect("[")
+        return True
+
+
+def iter_items(chunks: Iterable[bytes], path: str = "") -> Iterator:
+    """Iterate over the items of a list of a JSON body.
+
+    Parameters
+    ----------
+    chunks : Iterable[bytes]
+        The chunks of the body, e.g. `response.iter_content(65536)`.
+    path : str, optional
+        The keys to the list, separated by ".", e.g. "credits.cast". By
+        default, the body is the list.
+
+    Yields
+    ------
+    Any
+        The decoded items. Nothing if a key of the path is missing.
+
+    Raises
+    ------
+    ValueError
+        If the body is not valid JSON or the value at the path is not a list.
+    """
+    reader = _Reader(chunks)
+    if not reader.find(path.split(".") if path else []):
+        return
+    if reader.next_char() == "]":
+        reader.pos += 1
+        return
+    while True:
+        yield reader.value()
+        char = reader.next_char()
+        reader.pos += 1
+        if char == "]":
+            return
+        if char != ",":
+            reader.error('Expected "," or "]"')
@@ -9,6 +9,7 @@ Package Structure:
 Usage:
 1. Uncomment the test you want to run in `pytest.ini`
 2. Put you the credential file at the top of the repository name as `test.credential`
+    (ignored by git). Without it, a dummy credential is written for the offline tests.
 3. If the current directory is at the repository run by `pytest --pyargs tmdbapi`
     of specify your credential if not set as (2.) , use `pytest --pyargs tmdbapi --cred cred_filename`
 
@@ -3,6 +3,9 @@ from pathlib import Path
 
 import pytest
 
+CREDENTIAL_PATH = "tmdbapi/tests/temp/test.credential"
+
+
 # @pytest.fixture(autouse=True)
 # def run_before_and_after_tests(tmpdir):
 #     """Fixture to execute before and after tests is run"""
@@ -30,13 +33,21 @@ def pytest_configure(config):
     Allows plugins and conftest files to perform initial configuration.
     This hook is called for every plugin and initial conftest
     file after command line options have been parsed.
+
+    The credential is copied to `tmdbapi/tests/temp/test.credential`. Without
+    `--cred` or a local `test.credential`, a dummy one is written there so the
+    offline tests can run.
     """
     try:
         path = config.getoption("--cred")
     except:
         path = None
+    Path("tmdbapi/tests/temp").mkdir(parents=True, exist_ok=True)
     if path is None:
         cred_path = Path("test.credential")
+        if not cred_path.is_file():
+            write_dummy_credential(CREDENTIAL_PATH)
+            return
     else:
         cred_path = path
     if cred_path.is_file():
@@ -44,8 +55,19 @@ def pytest_configure(config):
     else:
         raise FileNotFoundError(f"Not found: {cred_path.absolute()}")
 
-    Path("tmdbapi/tests/temp").mkdir(parents=True, exist_ok=True)
-    shutil.copyfile(path_text, "tmdbapi/tests/temp/test.credential")
+    shutil.copyfile(path_text, CREDENTIAL_PATH)
+
+
+def write_dummy_credential(filepath):
+    """Write a credential with a placeholder API key to `filepath`
+
+    `Credential.save` appends the ".credential" suffix itself.
+    """
+    from tmdbapi.creds import Credential
+
+    cred = Credential()
+    cred.set(api_key="dummy")
+    cred.save(str(Path(filepath).with_suffix("")), auto_update=False)
 
 
 def pytest_unconfigure():
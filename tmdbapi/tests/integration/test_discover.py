@@ -0,0 +1,51 @@
+import datetime
+
+import pytest
+
+from tmdbapi.integration import discover
+
+
+def fake_discover(movies_per_day=3):
+    """A discover method over 1000 days with `movies_per_day` movies a day."""
+    calls = []
+    start = datetime.date(2000, 1, 1)
+
+    def func(params, page=1):
+        calls.append(params)
+        low = datetime.date.fromisoformat(params["primary_release_date.gte"])
+        high = datetime.date.fromisoformat(params["primary_release_date.lte"])
+        low, high = max(low, start), min(high, start + datetime.timedelta(999))
+        ids = [
+            (day - start.toordinal()) * movies_per_day + i
+            for day in range(low.toordinal(), high.toordinal() + 1)
+            for i in range(movies_per_day)
+        ]
+        total_pages = max(1, -(-len(ids) // 20))
+        return {
+            "page": page,
+            "results": [{"id": x} for x in ids[(page - 1) * 20 : page * 20]],
+            "total_pages": total_pages,
+            "total_results": len(ids),
+        }
+
+    return func, calls
+
+
+def test_crawl_split():
+    func, calls = fake_discover(movies_per_day=30)
+    items = list(
+        discover.crawl(func, "primary_release_date", "2000-01-01", "2002-12-31")
+    )
+    pytest.assume(sorted(x["id"] for x in items) == list(range(30000)))
+    pytest.assume(all(c["sort_by"] == "primary_release_date.asc" for c in calls))
+
+
+def test_crawl_no_split():
+    func, calls = fake_discover(movies_per_day=3)
+    items = list(
+        discover.crawl(
+            func, "primary_release_date", datetime.date(2000, 1, 1), "2000-12-31", {}, 4
+        )
+    )
+    pytest.assume(len(items) == 3 * 366)
+    pytest.assume(len(calls) == -(-3 * 366 // 20))
@@ -0,0 +1,48 @@
+import datetime
+import gzip
+import json
+
+import pytest
+
+from tmdbapi.integration import exports
+
+EXPORT_PATH = "tmdbapi/tests/temp/movie_ids_01_02_2024.json.gz"
+CHECKPOINT_PATH = "tmdbapi/tests/temp/movie_ids.checkpoint"
+
+
+@pytest.fixture
+def export():
+    with gzip.open(EXPORT_PATH, "wt") as f:
+        for i in range(1, 11):
+            entry = {"adult": i == 5, "id": i, "popularity": i / 2, "video": False}
+            f.write(json.dumps(entry) + "\n")
+    return EXPORT_PATH
+
+
+def test_export_url():
+    url = exports.export_url("tv_series", datetime.date(2024, 1, 2))
+    assert url == "http://files.tmdb.org/p/exports/tv_series_ids_01_02_2024.json.gz"
+
+
+def test_read(export):
+    pytest.assume(list(exports.ids(export)) == list(range(1, 11)))
+    pytest.assume(list(exports.ids(export, min_popularity=4)) == [8, 9, 10])
+    pytest.assume(5 not in exports.ids(export, include_adult=False))
+
+
+def test_ingest_checkpoint(export):
+    def fetch(x):
+        if x == 3:
+            raise ValueError("failed")
+        return {"id": x}
+
+    kwargs = {"checkpoint": CHECKPOINT_PATH, "fetch": fetch, "checkpoint_every": 2}
+    exports.Path(CHECKPOINT_PATH).unlink(missing_ok=True)
+    results = exports.ingest(export, "movie", concurrency=2, **kwargs)
+    first = [next(results).item for _ in range(5)]
+    results.close()
+    rest = [r.item for r in exports.ingest(export, "movie", **kwargs)]
+    pytest.assume(first == [1, 2, 3, 4, 5])
+    pytest.assume(rest == [5, 6, 7, 8, 9, 10])
+    with open(CHECKPOINT_PATH) as f:
+        pytest.assume(json.load(f) == {"done": 10, "failed": [3]})
@@ -0,0 +1,34 @@
+import pytest
+
+import tmdbapi
+from tmdbapi.integration import facets
+
+
+def test_plan():
+    names = [f"facet{i}" for i in range(25)] + ["facet0"]
+    chunks = facets.plan(names)
+    pytest.assume(len(chunks) == 2)
+    pytest.assume(len(chunks[0].split(",")) == 20)
+    pytest.assume(chunks[1] == "facet20,facet21,facet22,facet23,facet24")
+    pytest.assume(facets.plan([]) == [""])
+
+
+def test_movie(monkeypatch):
+    calls = []
+
+    def details(movie_id, append_to_response="", language=None):
+        calls.append(append_to_response)
+        response = {"id": movie_id, "title": "Fight Club"}
+        for facet in filter(None, append_to_response.split(",")):
+            response[facet] = {"results": [facet]}
+        return response
+
+    monkeypatch.setattr(tmdbapi.api3.movies, "details", details)
+    names = ["credits", "watch/providers"] + [f"facet{i}" for i in range(20)]
+    movie = facets.movie(550, names)
+    pytest.assume(len(calls) == 2)
+    pytest.assume(movie["details"] == {"id": 550, "title": "Fight Club"})
+    pytest.assume(
+        movie["watch/providers"] == {"id": 550, "results": ["watch/providers"]}
+    )
+    pytest.assume(all(name in movie for name in names))
@@ -0,0 +1,60 @@
+import datetime
+
+import pytest
+
+import tmdbapi
+from tmdbapi.integration import sync
+
+STATE_PATH = "tmdbapi/tests/temp/sync_state.json"
+
+
+@pytest.fixture
+def changes(monkeypatch):
+    windows = []
+
+    def movie_list(start_date="", end_date="", page=1):
+        windows.append((start_date, end_date, page))
+        return {
+            "page": page,
+            "results": [{"id": page}, {"id": 10 + page}],
+            "total_pages": 2,
+        }
+
+    monkeypatch.setattr(tmdbapi.api3.changes, "movie_list", movie_list)
+    return windows
+
+
+def test_changed_ids(changes):
+    ids = sync.changed_ids("movie", "2024-01-01", "2024-01-31")
+    pytest.assume(ids == [1, 11, 2, 12])
+    starts = sorted({w[0] for w in changes})
+    pytest.assume(starts == ["2024-01-01", "2024-01-15", "2024-01-29"])
+    pytest.assume(all(w[1] <= "2024-01-31" for w in changes))
+
+
+def test_run(changes):
+    def fetch(x):
+        if x == 2:
+            raise ValueError("failed")
+        return {"id": x}
+
+    job = sync.ChangeSync("movie", STATE_PATH, fetch, concurrency=2, since="2024-01-01")
+    job.path.unlink(missing_ok=True)
+    results = list(job.run(until="2024-01-10"))
+    pytest.assume(sorted(r.item for r in results if r.ok) == [1, 11, 12])
+    pytest.assume(job.high_water_mark == datetime.date(2024, 1, 10))
+    pytest.assume(job.load_state()["failed"] == [[2, 1]])
+
+
+def test_run_max_retries(changes):
+    def fetch(x):
+        if x in (2, 404):
+            raise tmdbapi.exceptions.TmdbApiException("Not found.")
+        return {"id": x}
+
+    job = sync.ChangeSync("movie", STATE_PATH, fetch, max_retries=1)
+    job.save_state({"high_water_mark": "2024-01-01", "failed": [404]})
+    list(job.run(until="2024-01-10"))
+    pytest.assume(job.load_state()["failed"] == [[2, 1]])
+    list(job.run(until="2024-01-10"))
+    pytest.assume(job.load_state()["failed"] == [])
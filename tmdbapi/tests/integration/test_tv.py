@@ -0,0 +1,48 @@
+import pytest
+
+import tmdbapi
+from tmdbapi.integration import tv
+
+
+@pytest.fixture
+def show(monkeypatch):
+    def series_details(series_id, append_to_response="", language=None):
+        seasons = [{"season_number": n} for n in range(3)]
+        return {"id": series_id, "name": "Show", "seasons": seasons}
+
+    def season_details(series_id, season_number, append_to_response="", language=None):
+        episodes = [{"episode_number": n} for n in range(1, season_number + 2)]
+        response = {"id": season_number, "season_number": season_number}
+        response["episodes"] = episodes
+        for facet in filter(None, append_to_response.split(",")):
+            response[facet] = {"season": season_number}
+        return response
+
+    def episode_details(
+        series_id, season_number, episode_number, append_to_response="", language=None
+    ):
+        response = {"id": season_number * 100 + episode_number}
+        for facet in filter(None, append_to_response.split(",")):
+            response[facet] = {"episode": episode_number}
+        return response
+
+    monkeypatch.setattr(tmdbapi.api3.tv_series, "details", series_details)
+    monkeypatch.setattr(tmdbapi.api3.tv_seasons, "details", season_details)
+    monkeypatch.setattr(tmdbapi.api3.tv_episodes, "details", episode_details)
+
+
+def test_crawl(show):
+    result = tv.crawl(1399, season_facets=["credits"])
+    pytest.assume(result["details"]["name"] == "Show")
+    pytest.assume(
+        [s["details"]["season_number"] for s in result["seasons"]] == [0, 1, 2]
+    )
+    pytest.assume(result["seasons"][2]["credits"] == {"id": 2, "season": 2})
+    pytest.assume("episodes" not in result["seasons"][0])
+
+
+def test_crawl_episodes(show):
+    result = tv.crawl(1399, episode_facets=["external_ids"], concurrency=4)
+    episodes = result["seasons"][2]["episodes"]
+    pytest.assume([e["details"]["id"] for e in episodes] == [201, 202, 203])
+    pytest.assume(episodes[0]["external_ids"] == {"id": 201, "episode": 1})
@@ -0,0 +1,96 @@
+import asyncio
+import sys
+
+import pytest
+
+import tmdbapi
+
+
+def setup_module():
+    loaded_package_modules = [
+        key for key, value in sys.modules.items() if "tmdbapi" in str(value)
+    ]
+    for key in loaded_package_modules:
+        del sys.modules[key]
+    global tmdbapi  # reach the global scope
+    import tmdbapi  # reimport package every before test
+
+
+def test_mirror():
+    for name in tmdbapi.aio.api3.movies.__all__:
+        func = getattr(tmdbapi.aio.api3.movies, name)
+        pytest.assume(asyncio.iscoroutinefunction(func))
+        pytest.assume(func.__wrapped__ is getattr(tmdbapi.api3.movies, name))
+
+
+def test_account_details(monkeypatch):
+    class Response:
+        status_code = 200
+        headers = {"Content-Type": "application/json"}
+        content = b'{"id": 42, "results": []}'
+        url = ""
+
+    class Transport:
+        retry_exceptions = ()
+        urls = []
+
+        async def request(self, url, **kwargs):
+            self.urls.append(url)
+            return Response()
+
+    def get_transport():
+        raise AssertionError("blocking request in the event loop")
+
+    transport = Transport()
+    monkeypatch.setattr(tmdbapi.setting, "get_async_transport", lambda: transport)
+    monkeypatch.setattr(tmdbapi.setting, "get_transport", get_transport)
+    cred = tmdbapi.Credential()
+    cred.set(api_key="key", session_id="session")
+    tmdbapi.setting.use_cred(cred)
+    # the account ID is obtained before the first account request
+    asyncio.run(tmdbapi.aio.api3.account.favorite_movies())
+    pytest.assume(cred["account_id"] == 42)
+    pytest.assume(transport.urls[0].endswith("/3/account"))
+    pytest.assume(transport.urls[-1].endswith("/3/account/42/favorite/movies"))
+    cred.set(account_id=1)
+    account = asyncio.run(tmdbapi.aio.api3.account.details())
+    pytest.assume(account["id"] == 42)
+    pytest.assume(cred["account_id"] == 42)
+    pytest.assume(transport.urls[-1].endswith("/3/account"))
+    tmdbapi.setting.use_cred(None)
+
+
+def test_transport_sessions_per_loop():
+    import threading
+
+    from tmdbapi.aio.transport import AsyncTransport
+
+    async def get_session():
+        return transport._get_session()
+
+    transport = AsyncTransport()
+    # a loop running in another thread
+    running = asyncio.new_event_loop()
+    thread = threading.Thread(target=running.run_forever)
+    thread.start()
+    # a loop stopped but not closed
+    stopped = asyncio.new_event_loop()
+    try:
+        first = asyncio.run_coroutine_threadsafe(get_session(), running).result()
+        second = stopped.run_until_complete(get_session())
+
+        async def main():
+            session = transport._get_session()
+            pytest.assume(session is transport._get_session())
+            pytest.assume(len({id(first), id(second), id(session)}) == 3)
+            await transport.close()
+            return session
+
+        third = asyncio.run(main())
+        pytest.assume(first.closed and second.closed and third.closed)
+        pytest.assume(transport._sessions == {})
+    finally:
+        running.call_soon_threadsafe(running.stop)
+        thread.join()
+        running.close()
+        stopped.close()
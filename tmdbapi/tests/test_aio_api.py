@@ -0,0 +1,49 @@
+import asyncio
+import sys
+
+import pytest
+
+import tmdbapi
+
+
+def setup_module():
+    loaded_package_modules = [
+        key for key, value in sys.modules.items() if "tmdbapi" in str(value)
+    ]
+    for key in loaded_package_modules:
+        del sys.modules[key]
+    global tmdbapi  # reach the global scope
+    import tmdbapi  # reimport package every before test
+
+    cred = tmdbapi.Credential()
+    cred.load("tmdbapi/tests/temp/test.credential")
+    tmdbapi.setting.use_cred(cred)
+
+
+MOVIE_ID = 372058
+
+
+def run(*coroutines):
+    async def main():
+        try:
+            return await asyncio.gather(*coroutines)
+        finally:
+            await tmdbapi.aio.close()
+
+    return asyncio.run(main())
+
+
+def test_details():
+    pytest.importorskip("aiohttp")
+    (movie,) = run(tmdbapi.aio.api3.movies.details(MOVIE_ID))
+    assert movie["id"] == MOVIE_ID
+
+
+def test_gather():
+    pytest.importorskip("aiohttp")
+    movie, search = run(
+        tmdbapi.aio.api3.movies.credits(MOVIE_ID),
+        tmdbapi.aio.api3.search.multi("Your Name"),
+    )
+    pytest.assume(movie["id"] == MOVIE_ID)
+    pytest.assume("results" in search)
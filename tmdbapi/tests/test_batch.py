@@ -0,0 +1,74 @@
+import threading
+import time
+
+import pytest
+
+import tmdbapi
+from tmdbapi import batch
+
+
+def square(x, offset=0):
+    time.sleep(0.01 * (x % 3))
+    if x == 3:
+        raise ValueError("three")
+    return x * x + offset
+
+
+def test_map_ordered():
+    results = list(batch.map(square, range(10), concurrency=4, offset=1))
+    pytest.assume([r.item for r in results] == list(range(10)))
+    pytest.assume(results[2].value == 5)
+    pytest.assume(not results[3].ok)
+    pytest.assume(isinstance(results[3].error, ValueError))
+    with pytest.raises(ValueError):
+        results[3].unwrap()
+
+
+def test_map_as_completed():
+    results = list(batch.map(square, range(10), concurrency=4, ordered=False))
+    assert sorted(r.item for r in results) == list(range(10))
+
+
+def test_map_concurrency():
+    lock = threading.Lock()
+    running = [0, 0]
+
+    def func(x):
+        with lock:
+            running[0] += 1
+            running[1] = max(running)
+        time.sleep(0.01)
+        with lock:
+            running[0] -= 1
+        return x
+
+    list(batch.map(func, range(50), concurrency=5))
+    assert running[1] <= 5
+
+
+def test_map_override():
+    def func(x):
+        return tmdbapi.setting["timeout"]
+
+    with tmdbapi.setting.override(timeout=7):
+        results = list(batch.map(func, range(3)))
+    assert [r.value for r in results] == [7, 7, 7]
+
+
+def test_map_pool_size():
+    threads = set()
+
+    def func(x):
+        threads.add(threading.current_thread().name)
+        time.sleep(0.01)
+        return x
+
+    tmdbapi.setting.pool(maxsize=3)
+    try:
+        list(batch.map(func, range(20)))
+        pytest.assume(len(threads) <= 3)
+        pytest.assume(tmdbapi.setting["pool_maxsize"] == 3)
+        list(batch.map(func, range(20), concurrency=6))
+        pytest.assume(tmdbapi.setting["pool_maxsize"] == 6)
+    finally:
+        tmdbapi.setting.pool(maxsize=10)
@@ -0,0 +1,136 @@
+import time
+
+import pytest
+
+from tmdbapi._core import Request
+from tmdbapi.cache import CacheEntry, MemoryCache, SQLiteCache, cache_key
+
+SQLITE_PATH = "tmdbapi/tests/temp/cache.sqlite"
+
+
+class Response:
+    def __init__(self, content, status_code=200, **headers):
+        self.status_code = status_code
+        self.headers = {"Content-Type": "application/json;charset=utf-8", **headers}
+        self.content = content
+
+
+def request(endpoint="movie-details", method="GET", **params):
+    url = "https://api.themoviedb.org/3/movie/550"
+    return Request(endpoint, method, url, params, {})
+
+
+def test_cache_key():
+    key1 = cache_key(request(api_key="1", language="en-US", page=1))
+    key2 = cache_key(request(page=1, language="en-US", api_key="2"))
+    pytest.assume(key1 == key2)
+    pytest.assume(key1 != cache_key(request(language="zh-TW", page=1)))
+
+
+def test_store_lookup():
+    cache = MemoryCache()
+    cache.store(request(), Response(b'{"id": 550}'))
+    entry = cache.lookup(request())
+    pytest.assume(entry.content == b'{"id": 550}')
+    pytest.assume(entry.headers["Content-Type"].startswith("application/json"))
+
+
+def test_not_cached():
+    cache = MemoryCache()
+    cache.store(request(method="POST"), Response(b"{}"))
+    cache.store(request(), Response(b"{}", status_code=404))
+    cache.store(request("authentication-create-request-token"), Response(b"{}"))
+    cache.store(request("movie-account-states"), Response(b"{}"))
+    assert len(cache) == 0
+
+
+def test_ttl():
+    cache = MemoryCache(default_ttl=300, ttls={"movie-details": 0})
+    pytest.assume(cache.get_ttl("movie-details") == 0)
+    pytest.assume(cache.get_ttl("movie-credits") == 300)
+    pytest.assume(cache.get_ttl("genre-movie-list") == 86400)
+
+
+def test_expired():
+    cache = MemoryCache()
+    cache.set("key", CacheEntry(b"{}", "application/json", time.time() - 1))
+    pytest.assume(cache.get("key") is None)
+    pytest.assume(len(cache) == 0)
+
+
+def test_revalidate():
+    cache = MemoryCache(ttls={"movie-details": 60})
+    headers = {"ETag": '"v1"', "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"}
+    cache.store(request(), Response(b'{"id": 550}', **headers))
+    cache.get(cache_key(request())).expires = time.time() - 1
+    stale = cache.lookup(request())
+    pytest.assume(not stale.is_fresh())
+    pytest.assume(stale.validators["If-None-Match"] == '"v1"')
+    pytest.assume(stale.validators["If-Modified-Since"] == headers["Last-Modified"])
+    entry = cache.store(request(), Response(b"", 304, ETag='"v2"'), stale)
+    pytest.assume(entry.content == b'{"id": 550}')
+    pytest.assume(entry.etag == '"v2"')
+    pytest.assume(cache.lookup(request()).is_fresh())
+
+
+def test_lru_entries():
+    cache = MemoryCache(max_entries=2)
+    expires = time.time() + 60
+    cache.set("a", CacheEntry(b"a", "", expires))
+    cache.set("b", CacheEntry(b"b", "", expires))
+    cache.get("a")
+    cache.set("c", CacheEntry(b"c", "", expires))
+    pytest.assume(cache.get("a") is not None)
+    pytest.assume(cache.get("b") is None)
+    pytest.assume(cache.get("c") is not None)
+
+
+def test_lru_bytes():
+    cache = MemoryCache(max_bytes=10)
+    expires = time.time() + 60
+    cache.set("a", CacheEntry(b"a" * 6, "", expires))
+    cache.set("b", CacheEntry(b"b" * 6, "", expires))
+    cache.set("c", CacheEntry(b"c" * 11, "", expires))
+    pytest.assume(cache.get("a") is None)
+    pytest.assume(cache.get("b") is not None)
+    pytest.assume(cache.get("c") is None)
+    pytest.assume(cache.size == 6)
+
+
+def test_sqlite_store_lookup():
+    cache = SQLiteCache(SQLITE_PATH)
+    cache.clear()
+    cache.store(request(), Response(b'{"id": 550}'))
+    cache2 = SQLiteCache(SQLITE_PATH)
+    entry = cache2.lookup(request())
+    pytest.assume(entry.content == b'{"id": 550}')
+    pytest.assume(entry.headers["Content-Type"].startswith("application/json"))
+
+
+def test_sqlite_expired():
+    cache = SQLiteCache(SQLITE_PATH)
+    cache.set("key", CacheEntry(b"{}", "application/json", time.time() - 1))
+    pytest.assume(cache.get("key") is None)
+    pytest.assume(cache.get("missing") is None)
+
+
+def test_sqlite_revalidate():
+    cache = SQLiteCache(SQLITE_PATH)
+    cache.clear()
+    cache.set("key", CacheEntry(b"{}", "", time.time() - 1, etag='"v1"'))
+    cache.evict()
+    entry = cache.get("key")
+    pytest.assume(entry.etag == '"v1"')
+    pytest.assume(not entry.is_fresh())
+
+
+def test_sqlite_evict():
+    cache = SQLiteCache(SQLITE_PATH, max_bytes=100)
+    cache.clear()
+    expires = time.time() + 60
+    cache.set("a", CacheEntry(bytes(range(60)), "", expires))
+    cache.set("b", CacheEntry(bytes(range(60, 120)), "", expires))
+    cache.evict()
+    pytest.assume(cache.get("a") is None)
+    pytest.assume(cache.get("b") is not None)
+    pytest.assume(cache.size <= 100)
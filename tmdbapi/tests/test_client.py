@@ -0,0 +1,139 @@
+import asyncio
+import sys
+
+import pytest
+
+import tmdbapi
+
+
+def setup_module():
+    loaded_package_modules = [
+        key for key, value in sys.modules.items() if "tmdbapi" in str(value)
+    ]
+    for key in loaded_package_modules:
+        del sys.modules[key]
+    global tmdbapi  # reach the global scope
+    import tmdbapi  # reimport package every before test
+
+
+def credential(api_key, access_token=""):
+    cred = tmdbapi.Credential()
+    cred.set(access_token=access_token, api_key=api_key)
+    return cred
+
+
+@pytest.fixture(autouse=True)
+def global_credential():
+    tmdbapi.setting.use_cred(credential("global"))
+    yield
+    tmdbapi.setting.use_cred(None)
+
+
+def paged(page=1):
+    return {"page": page, "total_pages": 2, "results": [tmdbapi.setting["timeout"]]}
+
+
+def test_isolated_settings():
+    client = tmdbapi.TmdbClient(credential("client"), timeout=5)
+    pytest.assume(client.setting["timeout"] == 5)
+    pytest.assume(tmdbapi.setting["timeout"] is None)
+    with client.activate():
+        pytest.assume(tmdbapi.setting["timeout"] == 5)
+        with tmdbapi.setting.override(timeout=7):
+            pytest.assume(client.setting["timeout"] == 7)
+        pytest.assume(tmdbapi.setting.get_transport() is client.setting.get_transport())
+    pytest.assume(tmdbapi.setting["timeout"] is None)
+    pytest.assume(tmdbapi.setting.get_transport() is not client.setting.get_transport())
+
+
+def test_bound_functions():
+    client = tmdbapi.TmdbClient(credential("client"))
+    with tmdbapi._core.prepare_only():
+        request = client.api3.movies.details(550)
+        global_request = tmdbapi.api3.movies.details(550)
+    pytest.assume(request.params["api_key"] == "client")
+    pytest.assume(global_request.params["api_key"] == "global")
+    pytest.assume(client.api3.movies.details.__name__ == "details")
+
+
+def test_bound_generator():
+    client = tmdbapi.TmdbClient(credential("client"), timeout=3)
+    items = list(client.pages.iter_results(paged))
+    assert items == [3, 3]
+
+
+def test_bound_coroutine():
+    client = tmdbapi.TmdbClient(credential("client"), timeout=3)
+
+    async def timeout():
+        return tmdbapi.setting["timeout"]
+
+    assert asyncio.run(client.acall(timeout)) == 3
+
+
+def test_batch_map():
+    client = tmdbapi.TmdbClient(credential("client"), timeout=3)
+    results = client.batch.map(lambda _: tmdbapi.setting["timeout"], range(3))
+    assert [r.value for r in results] == [3, 3, 3]
+
+
+def test_current():
+    client = tmdbapi.TmdbClient(credential("client"))
+    pytest.assume(tmdbapi.client.current() is tmdbapi.client.default())
+    pytest.assume(tmdbapi.client.default().setting is tmdbapi.setting)
+    with client.activate():
+        pytest.assume(tmdbapi.client.current() is client)
+
+
+def test_v4_access_token():
+    client = tmdbapi.TmdbClient(credential("client", access_token="token"))
+    client.setting.use_access_token(False)
+    with tmdbapi._core.prepare_only():
+        request = client.api4.lists.details(1)
+    pytest.assume(request.headers["Authorization"] == "Bearer token")
+    pytest.assume(client.setting["use_access_token"] is False)
+
+
+def test_writes_inside_activate():
+    global_cred = credential("global", access_token="token")
+    tmdbapi.setting.use_cred(global_cred)
+    tmdbapi.setting.use_access_token(True)
+    client_cred = credential("client")
+    client = tmdbapi.TmdbClient(client_cred)
+    with client.activate():
+        # e.g. api3.account.details() keeps the account ID
+        client_cred.set(account_id=5)
+        tmdbapi.setting.timeout(9)
+        tmdbapi.setting.set(default_language="fr-FR")
+        pytest.assume(tmdbapi.setting["timeout"] == 9)
+    pytest.assume(client.setting["timeout"] == 9)
+    pytest.assume(client.setting["default_language"] == "fr-FR")
+    pytest.assume(client.setting["use_access_token"] is False)
+    pytest.assume(tmdbapi.setting["use_access_token"] is True)
+    pytest.assume(tmdbapi.setting["timeout"] is None)
+    pytest.assume(tmdbapi.setting["default_language"] is None)
+    # a credential not in use does not change the global settings
+    client_cred.set(account_id=6)
+    pytest.assume(tmdbapi.setting["use_access_token"] is True)
+    tmdbapi.setting.use_access_token(False)
+
+
+def test_credential_update_inside_activate():
+    global_cred = credential("global")
+    tmdbapi.setting.use_cred(global_cred)
+    client = tmdbapi.TmdbClient(credential("client"))
+    with client.activate():
+        global_cred.set(access_token="token")
+    pytest.assume(tmdbapi.setting.setting["use_access_token"] is True)
+    pytest.assume(client.setting["use_access_token"] is False)
+    tmdbapi.setting.use_access_token(False)
+
+
+def test_client_credential_update():
+    client_cred = credential("client")
+    client = tmdbapi.TmdbClient(client_cred)
+    client_cred.set(access_token="token")
+    pytest.assume(client.setting["use_access_token"] is True)
+    pytest.assume(tmdbapi.setting["use_access_token"] is False)
+    client_cred.set(access_token="", api_key="client", overwrite=True)
+    pytest.assume(client.setting["use_access_token"] is False)
@@ -0,0 +1,129 @@
+import sys
+
+import pytest
+
+import tmdbapi
+
+
+def setup_module():
+    loaded_package_modules = [
+        key for key, value in sys.modules.items() if "tmdbapi" in str(value)
+    ]
+    for key in loaded_package_modules:
+        del sys.modules[key]
+    global tmdbapi  # reach the global scope
+    import tmdbapi  # reimport package every before test
+
+
+@pytest.fixture(autouse=True)
+def reset_credential():
+    yield
+    tmdbapi.setting.use_cred(None)
+
+
+class TestCredentialPool:
+    def pool(self, *keys, **kwargs):
+        creds = []
+        for key in keys:
+            cred = tmdbapi.Credential()
+            cred.set(access_token="token-" + key, api_key=key, session_id="s")
+            creds.append(cred)
+        return tmdbapi.CredentialPool(creds, **kwargs)
+
+    def test_round_robin(self):
+        pool = self.pool("a", "b", "c")
+        keys = []
+        for _ in range(6):
+            cred = pool.acquire()
+            keys.append(cred["api_key"])
+            pool.release(cred, 200)
+        pytest.assume(keys == ["a", "b", "c", "a", "b", "c"])
+        pytest.assume(pool["session_id"] == "s")
+        pytest.assume(pool.pass_check("api_key", "access_token"))
+
+    def test_least_loaded(self):
+        pool = self.pool("a", "b", strategy="least_loaded")
+        first = pool.acquire()
+        second = pool.acquire()
+        pytest.assume(first["api_key"] == "a")
+        pytest.assume(second["api_key"] == "b")
+        pool.release(second, 200)
+        pytest.assume(pool.acquire()["api_key"] == "b")
+
+    def test_cooldown(self):
+        pool = self.pool("a", "b")
+        cred = pool.acquire()
+        pool.release(cred, 429, 30)
+        pytest.assume([pool.acquire()["api_key"] for _ in range(3)] == ["b"] * 3)
+        stats = pool.stats()
+        pytest.assume(stats[0]["throttled"] == 1)
+        pytest.assume(stats[0]["cooldown"] > 29)
+        pytest.assume(stats[1]["in_flight"] == 3)
+        # every credential cools down, wait for the first one back
+        pool.release(pool.acquire(), 429, 60)
+        cred, wait = pool.reserve()
+        pytest.assume(cred["api_key"] == "a")
+        pytest.assume(29 < wait <= 30)
+
+    def test_quota(self):
+        pool = self.pool("a", calls=2, period=10.0)
+        waits = [pool.reserve()[1] for _ in range(3)]
+        pytest.assume(waits[:2] == [0.0, 0.0])
+        pytest.assume(waits[2] > 4)
+
+    def test_authorize(self):
+        pool = self.pool("a")
+        cred = pool.acquire()
+        headers, params = pool.authorize(cred, {"Authorization": "Bearer x"}, {})
+        pytest.assume(headers["Authorization"] == "Bearer token-a")
+        headers, params = pool.authorize(cred, {}, {"api_key": "x", "page": 1})
+        pytest.assume(params == {"api_key": "a", "page": 1})
+
+    def test_send(self, monkeypatch):
+        class Response:
+            def __init__(self, status_code):
+                self.status_code = status_code
+                self.headers = {"Content-Type": "application/json", "Retry-After": "30"}
+                self.content = b'{"id": 550}'
+                self.url = ""
+
+        class Session:
+            keys = []
+
+            def request(self, params, **kwargs):
+                self.keys.append(params["api_key"])
+                return Response(429 if params["api_key"] == "a" else 200)
+
+        session = Session()
+        monkeypatch.setattr(tmdbapi.setting, "get_transport", lambda: session)
+        pool = self.pool("a", "b")
+        tmdbapi.setting.use_cred(pool)
+        movie = tmdbapi.api3.movies.details(550)
+        pytest.assume(movie == {"id": 550})
+        pytest.assume(session.keys == ["a", "b"])
+        tmdbapi.api3.movies.details(550)
+        pytest.assume(session.keys == ["a", "b", "b"])
+
+    def test_account_details(self, monkeypatch):
+        class Response:
+            status_code = 200
+            headers = {"Content-Type": "application/json"}
+            content = b'{"id": 42}'
+            url = ""
+
+        class Session:
+            urls = []
+
+            def request(self, url, **kwargs):
+                self.urls.append(url)
+                return Response()
+
+        session = Session()
+        monkeypatch.setattr(tmdbapi.setting, "get_transport", lambda: session)
+        pool = self.pool("a", "b")
+        tmdbapi.setting.use_cred(pool)
+        pytest.assume(tmdbapi.api3.account.details() == {"id": 42})
+        pytest.assume(pool["account_id"] == 42)
+        pytest.assume(pool.credentials[1]["account_id"] == 0)
+        tmdbapi.api3.account.favorite_movies()
+        pytest.assume(session.urls[-1].endswith("/3/account/42/favorite/movies"))
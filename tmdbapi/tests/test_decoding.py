@@ -0,0 +1,115 @@
+import json
+
+import pytest
+
+import tmdbapi
+from tmdbapi._core import handle_response
+from tmdbapi.decoding import available, get_decoder, get_projection
+
+BODY = '{"id": 550, "title": "Fight Club", "genres": [{"id": 18, "name": "Drame"}]}'
+HEADERS = {"Content-Type": "application/json;charset=utf-8"}
+
+
+def test_stdlib():
+    loads = get_decoder("json")
+    pytest.assume(loads is json.loads)
+    pytest.assume(loads(BODY.encode()) == json.loads(BODY))
+    pytest.assume(get_decoder("auto") is get_decoder("auto"))
+    pytest.assume(available()[-1] == "json")
+
+
+@pytest.mark.parametrize("name", ["orjson", "msgspec"])
+def test_backend(name):
+    pytest.importorskip(name)
+    pytest.assume(name in available())
+    pytest.assume(get_decoder(name)(BODY.encode()) == json.loads(BODY))
+
+
+def test_auto():
+    assert get_decoder("auto") is get_decoder(available()[0])
+
+
+def test_invalid():
+    with pytest.raises(ValueError):
+        get_decoder("yaml")
+
+
+def test_setting():
+    decoded = []
+
+    def loads(content):
+        decoded.append(content)
+        return json.loads(content)
+
+    with tmdbapi.setting.override(json_decoder=loads):
+        content = handle_response(HEADERS, BODY.encode())
+    pytest.assume(content["title"] == "Fight Club")
+    pytest.assume(decoded == [BODY.encode()])
+    tmdbapi.setting.json_decoder("json")
+    pytest.assume(handle_response(HEADERS, BODY.encode())["id"] == 550)
+    tmdbapi.setting.json_decoder("auto")
+    with pytest.raises(ValueError):
+        tmdbapi.setting.json_decoder("yaml")
+
+
+DETAILS = {
+    "id": 550,
+    "title": "Fight Club",
+    "belongs_to_collection": None,
+    "credits": {
+        "cast": [
+            {"id": 819, "name": "Edward Norton", "order": 0},
+            {"id": 287, "name": "Brad Pitt", "order": 1},
+        ],
+        "crew": [{"id": 7467, "job": "Director"}],
+    },
+}
+FIELDS = ["id", "belongs_to_collection", "credits.cast[].name", "tagline"]
+PROJECTED = {
+    "id": 550,
+    "belongs_to_collection": None,
+    "credits": {"cast": [{"name": "Edward Norton"}, {"name": "Brad Pitt"}]},
+}
+
+
+def test_projection():
+    projection = get_projection(FIELDS)
+    pytest.assume(projection is get_projection(FIELDS))
+    pytest.assume(projection.prune(DETAILS) == PROJECTED)
+    pytest.assume(projection.prune([DETAILS]) == [PROJECTED])
+    pytest.assume(
+        get_projection(["credits.cast[].id", "credits"]).tree
+        == {"credits": (False, None)}
+    )
+    with pytest.raises(ValueError):
+        get_projection(["credits..id"])
+
+
+@pytest.mark.parametrize("decoder", ["json", "auto", "msgspec"])
+def test_projection_decode(decoder):
+    if decoder == "msgspec":
+        pytest.importorskip("msgspec")
+    projection = get_projection(FIELDS)
+    content = json.dumps(DETAILS).encode()
+    pytest.assume(projection.decode(content, decoder) == PROJECTED)
+    error = {"success": False, "status_code": 34, "status_message": "Not found."}
+    content = json.dumps(error).encode()
+    pytest.assume(projection.decode(content, decoder) == error)
+    # an object where a list is expected
+    content = json.dumps({"credits": {"cast": {"name": "x"}}}).encode()
+    pytest.assume(
+        projection.decode(content, decoder) == {"credits": {"cast": {"name": "x"}}}
+    )
+
+
+def test_projection_setting():
+    content = json.dumps(DETAILS).encode()
+    with tmdbapi.setting.override(fields=["title"]):
+        pytest.assume(handle_response(HEADERS, content) == {"title": "Fight Club"})
+    pytest.assume(handle_response(HEADERS, content) == DETAILS)
+    error = b'{"success": false, "status_code": 34, "status_message": "Not found."}'
+    with tmdbapi.setting.override(fields=["title"]):
+        with pytest.raises(tmdbapi.exceptions.TmdbApiException):
+            handle_response(HEADERS, error)
+    with pytest.raises(ValueError):
+        tmdbapi.setting.fields([""])
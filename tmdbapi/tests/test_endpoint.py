@@ -0,0 +1,83 @@
+import sys
+
+import pytest
+
+import tmdbapi
+
+
+def setup_module():
+    loaded_package_modules = [
+        key for key, value in sys.modules.items() if "tmdbapi" in str(value)
+    ]
+    for key in loaded_package_modules:
+        del sys.modules[key]
+    global tmdbapi  # reach the global scope
+    import tmdbapi  # reimport package every before test
+
+
+@pytest.fixture(autouse=True)
+def reset_credential():
+    yield
+    tmdbapi.setting.use_cred(None)
+
+
+class TestEndpoint:
+    def test_compile(self):
+        from tmdbapi._core import compile_endpoints
+        from tmdbapi.api3.movies import _MOVIES_V3
+
+        endpoints = compile_endpoints(_MOVIES_V3)
+        pytest.assume(endpoints is compile_endpoints(_MOVIES_V3))
+        endpoint = endpoints["movie-details"]
+        pytest.assume(endpoint.method == "GET")
+        pytest.assume(endpoint.url == "/{movie_id}")
+        pytest.assume(endpoint.params == {"movie_id", "append_to_response", "language"})
+        pytest.assume(endpoint.template == "https://api.themoviedb.org/3/{movie_id}")
+        with pytest.raises(AttributeError):
+            endpoint.other = 1
+        with pytest.raises(AttributeError):
+            endpoint.url = "/{other_id}"
+        with pytest.raises(AttributeError):
+            endpoint.method = "POST"
+        with pytest.raises(AttributeError):
+            del endpoint.name
+
+    def test_compile_at_import(self):
+        from tmdbapi._core import compile_endpoints
+        from tmdbapi.api3 import movies
+
+        endpoints = compile_endpoints(movies._MOVIES_V3, 3, "/movie")
+        pytest.assume(movies._ENDPOINTS is endpoints)
+        endpoint = endpoints["movie-credits"]
+        pytest.assume(
+            endpoint.build_url({"movie_id": 550})
+            == "https://api.themoviedb.org/3/movie/550/credits"
+        )
+
+    def test_prepare(self):
+        from tmdbapi.api3 import movies
+
+        cred = tmdbapi.Credential()
+        cred.set(api_key="key")
+        tmdbapi.setting.use_cred(cred)
+        request = movies._ENDPOINTS["movie-details"].prepare(
+            {"movie_id": 550}, {"language": None, "include_adult": True}
+        )
+        pytest.assume(request.url == "https://api.themoviedb.org/3/movie/550")
+        pytest.assume(request.params == {"include_adult": "true", "api_key": "key"})
+        tmdbapi.setting.use_cred(None)
+        with pytest.raises(Exception, match="No credential given."):
+            movies._ENDPOINTS["movie-details"].prepare({"movie_id": 550})
+
+    def test_build_url(self):
+        cred = tmdbapi.Credential()
+        cred.set(access_token="token", api_key="key", account_object_id="abc")
+        tmdbapi.setting.use_cred(cred)
+        with tmdbapi._core.prepare_only():
+            movie = tmdbapi.api3.movies.details(550)
+            popular = tmdbapi.api3.movie_lists.popular()
+            lists = tmdbapi.api4.account.lists()
+        pytest.assume(movie.url == "https://api.themoviedb.org/3/movie/550")
+        pytest.assume(movie.method == "GET")
+        pytest.assume(popular.url == "https://api.themoviedb.org/3/movie/popular")
+        pytest.assume(lists.url == "https://api.themoviedb.org/4/account/abc/lists")
@@ -0,0 +1,37 @@
+import sys
+
+import pytest
+
+import tmdbapi
+
+
+def setup_module():
+    loaded_package_modules = [
+        key for key, value in sys.modules.items() if "tmdbapi" in str(value)
+    ]
+    for key in loaded_package_modules:
+        del sys.modules[key]
+    global tmdbapi  # reach the global scope
+    import tmdbapi  # reimport package every before test
+
+
+class TestImport:
+    def test_lazy_import(self):
+        import subprocess
+
+        code = (
+            "import sys, tmdbapi; "
+            "print(sorted(m for m in ('requests', 'cryptography', 'sqlite3', "
+            "'tmdbapi.api3', 'tmdbapi.integration') if m in sys.modules))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert output.strip() == "[]"
+
+    def test_submodule_access(self):
+        pytest.assume(tmdbapi.api3.search.__name__ == "tmdbapi.api3.search")
+        pytest.assume(tmdbapi.integration.facets.MAX_APPEND == 20)
+        pytest.assume(tmdbapi.creds.Credential is tmdbapi.Credential)
+        with pytest.raises(AttributeError):
+            tmdbapi.api3.wrong_name
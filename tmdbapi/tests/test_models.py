@@ -0,0 +1,78 @@
+import pickle
+import sys
+
+import pytest
+
+from tmdbapi import models
+
+
+def setup_module():
+    loaded_package_modules = [
+        key for key, value in sys.modules.items() if "tmdbapi" in str(value)
+    ]
+    for key in loaded_package_modules:
+        del sys.modules[key]
+    global models  # reach the global scope
+    from tmdbapi import models  # reimport package every before test
+
+
+MOVIE = {
+    "id": 550,
+    "title": "Fight Club",
+    "release_date": "1999-10-15",
+    "genres": [{"id": 18, "name": "Drama"}],
+    "credits": {
+        "id": 550,
+        "cast": [{"id": 819, "name": "Edward Norton", "character": "Narrator"}],
+        "crew": [{"id": 7467, "name": "David Fincher", "job": "Director"}],
+    },
+    "belongs_to_collection": None,
+}
+
+
+def test_fields():
+    movie = models.Movie(MOVIE)
+    pytest.assume(movie.id == 550)
+    pytest.assume(movie.title == "Fight Club")
+    pytest.assume(movie.runtime is None)
+    pytest.assume(not hasattr(movie, "__dict__"))
+    pytest.assume(not hasattr(movie, "belongs_to_collection"))
+    pytest.assume(repr(movie) == "Movie(id=550, title='Fight Club')")
+
+
+def test_lazy_nested():
+    movie = models.Movie(MOVIE)
+    pytest.assume(movie._credits is MOVIE["credits"])
+    credits = movie.credits
+    pytest.assume(isinstance(credits, models.Credits))
+    pytest.assume(movie.credits is credits)
+    pytest.assume(credits.cast[0].name == "Edward Norton")
+    pytest.assume(credits.crew[0].job == "Director")
+    pytest.assume(credits.guest_stars is None)
+    pytest.assume(movie.genres == (models.Genre({"id": 18, "name": "Drama"}),))
+    pytest.assume(movie.images is None)
+
+
+def test_to_dict():
+    movie = models.Movie(MOVIE)
+    data = movie.to_dict()
+    pytest.assume(data["credits"] is MOVIE["credits"])  # not decoded yet
+    movie.credits
+    pytest.assume(movie.to_dict()["credits"]["cast"][0]["name"] == "Edward Norton")
+    pytest.assume(models.Movie(movie.to_dict()) == movie)
+    pytest.assume("belongs_to_collection" not in data)
+
+
+def test_pickle():
+    movie = models.Movie(MOVIE)
+    movie.genres
+    assert pickle.loads(pickle.dumps(movie)) == movie
+
+
+def test_parse():
+    results = [{"id": 1, "name": "A"}, {"id": 2, "name": "B"}]
+    shows = models.parse("tv", results)
+    pytest.assume([s.name for s in shows] == ["A", "B"])
+    pytest.assume(isinstance(models.parse("person", results[0]), models.Person))
+    with pytest.raises(ValueError):
+        models.parse("unknown", results)
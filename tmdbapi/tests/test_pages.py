@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+
+from tmdbapi import pages
+
+
+def paged(query, page=1, total_pages=3):
+    return {
+        "page": page,
+        "results": [f"{query}-{page}-{i}" for i in range(2)],
+        "total_pages": total_pages,
+    }
+
+
+def test_iter_results():
+    results = list(pages.iter_results(paged, "q"))
+    pytest.assume(len(results) == 6)
+    pytest.assume(results[0] == "q-1-0" and results[-1] == "q-3-1")
+
+
+def test_iter_results_no_prefetch():
+    results = list(pages.iter_results(paged, "q", prefetch=False))
+    assert len(results) == 6
+
+
+def test_iter_pages_limit():
+    responses = list(pages.iter_pages(paged, "q", start_page=2, max_pages=1))
+    pytest.assume([r["page"] for r in responses] == [2])
+    responses = list(pages.iter_pages(paged, "q", total_pages=1000, max_pages=None))
+    pytest.assume(len(responses) == pages.MAX_PAGE)
+
+
+def test_aiter_results():
+    async def apaged(query, page=1):
+        return paged(query, page)
+
+    async def main():
+        return [item async for item in pages.aiter_results(apaged, "q")]
+
+    async def main_concurrent():
+        items = pages.aiter_results(apaged, "q", concurrency=4, ordered=False)
+        return [item async for item in items]
+
+    pytest.assume(len(asyncio.run(main())) == 6)
+    pytest.assume(sorted(asyncio.run(main_concurrent())) == sorted(asyncio.run(main())))
+
+
+def test_iter_results_concurrent():
+    results = list(pages.iter_results(paged, "q", total_pages=20, concurrency=4))
+    pytest.assume(len(results) == 40)
+    pytest.assume(results == list(pages.iter_results(paged, "q", total_pages=20)))
+    responses = pages.iter_pages(
+        paged, "q", total_pages=20, max_pages=5, concurrency=4, ordered=False
+    )
+    pytest.assume(sorted(r["page"] for r in responses) == [1, 2, 3, 4, 5])
@@ -0,0 +1,41 @@
+import time
+
+import pytest
+
+from tmdbapi.ratelimit import FileRateLimiter, RateLimiter
+
+STATE_PATH = "tmdbapi/tests/temp/ratelimit.state"
+
+
+def test_burst():
+    limiter = RateLimiter(calls=10, period=1.0)
+    waits = [limiter.reserve() for _ in range(10)]
+    assert max(waits) == 0
+
+
+def test_wait():
+    limiter = RateLimiter(calls=10, period=1.0, burst=1)
+    limiter.reserve()
+    assert limiter.reserve() == pytest.approx(0.1, abs=0.01)
+
+
+def test_acquire():
+    limiter = RateLimiter(calls=100, period=1.0, burst=1)
+    start = time.monotonic()
+    for _ in range(6):
+        limiter.acquire()
+    assert time.monotonic() - start >= 0.05
+
+
+def test_penalize():
+    limiter = RateLimiter(calls=10, period=1.0)
+    limiter.penalize(2.0)
+    assert limiter.reserve() == pytest.approx(2.1, abs=0.01)
+
+
+def test_file_shared():
+    limiter1 = FileRateLimiter(STATE_PATH, calls=10, period=1.0, burst=2)
+    limiter2 = FileRateLimiter(STATE_PATH, calls=10, period=1.0, burst=2)
+    pytest.assume(limiter1.reserve() == 0)
+    pytest.assume(limiter2.reserve() == 0)
+    pytest.assume(limiter1.reserve() > 0)
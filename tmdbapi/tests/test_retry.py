@@ -0,0 +1,137 @@
+import sys
+
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+
+import tmdbapi
+
+
+def setup_module():
+    loaded_package_modules = [
+        key for key, value in sys.modules.items() if "tmdbapi" in str(value)
+    ]
+    for key in loaded_package_modules:
+        del sys.modules[key]
+    global tmdbapi  # reach the global scope
+    import tmdbapi  # reimport package every before test
+
+
+@pytest.fixture(autouse=True)
+def reset_setting():
+    cred = tmdbapi.Credential()
+    cred.set(api_key="key")
+    tmdbapi.setting.use_cred(cred)
+    yield
+    tmdbapi.setting.use_cred(None)
+    tmdbapi.setting.retry(3)
+    tmdbapi.setting.rate_limit(None)
+    tmdbapi.setting.timeout(None)
+
+
+class Response:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(
+            {"Content-Type": "application/json", **(headers or {})}
+        )
+        if status_code == 200:
+            self.content = b'{"id": 550}'
+        else:
+            self.content = b'{"success": false, "status_message": "unavailable"}'
+        self.url = "https://api.themoviedb.org/3/movie/550"
+
+
+class Session:
+    """Return the given responses, or raise the given errors, in turn."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def request(self, **kwargs):
+        self.calls += 1
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+class Limiter:
+    def __init__(self):
+        self.acquired = 0
+        self.penalties = []
+
+    def acquire(self):
+        self.acquired += 1
+
+    def penalize(self, seconds):
+        self.penalties.append(seconds)
+
+
+@pytest.fixture
+def waits(monkeypatch):
+    waits = []
+    monkeypatch.setattr(tmdbapi._core.time, "sleep", waits.append)
+    # the backoff without jitter
+    monkeypatch.setattr(tmdbapi.transport.random, "uniform", lambda low, high: high)
+    return waits
+
+
+def test_retry():
+    tmdbapi.setting.retry(5)
+    pytest.assume(tmdbapi.setting["retry"].total == 5)
+    tmdbapi.setting.retry(None)
+    pytest.assume(tmdbapi.setting["retry"].total == 0)
+
+
+def test_override():
+    tmdbapi.setting.timeout(10)
+    with tmdbapi.setting.override(timeout=3):
+        pytest.assume(tmdbapi.setting["timeout"] == 3)
+    pytest.assume(tmdbapi.setting["timeout"] == 10)
+    with pytest.raises(KeyError):
+        with tmdbapi.setting.override(wrong_name=True):
+            pass
+
+
+def test_request_retry(monkeypatch, waits):
+    session = Session(
+        Response(503),
+        Response(429, {"Retry-After": "7"}),
+        requests.ConnectionError("reset"),
+        Response(200),
+    )
+    monkeypatch.setattr(tmdbapi.setting, "get_transport", lambda: session)
+    limiter = Limiter()
+    tmdbapi.setting.rate_limit(limiter)
+    tmdbapi.setting.retry(tmdbapi.transport.Retry(total=3, backoff_factor=0.5))
+    pytest.assume(tmdbapi.api3.movies.details(550) == {"id": 550})
+    pytest.assume(session.calls == 4)
+    pytest.assume(limiter.acquired == 4)
+    # the backoff of attempt 0, the Retry-After, the backoff of attempt 2
+    pytest.assume(waits == [0.5, 7.0, 2.0])
+    pytest.assume(limiter.penalties == [7.0])
+
+
+def test_request_retry_exhausted(monkeypatch, waits):
+    session = Session(Response(503), Response(503), Response(503))
+    monkeypatch.setattr(tmdbapi.setting, "get_transport", lambda: session)
+    limiter = Limiter()
+    tmdbapi.setting.rate_limit(limiter)
+    tmdbapi.setting.retry(2)
+    with pytest.raises(tmdbapi.exceptions.TmdbApiException):
+        tmdbapi.api3.movies.details(550)
+    pytest.assume(session.calls == 3)
+    pytest.assume(waits == [0.5, 1.0])
+    # only a 429 slows the limiter down
+    pytest.assume(limiter.penalties == [])
+
+
+def test_request_retry_post(monkeypatch, waits):
+    session = Session(Response(503), Response(200))
+    monkeypatch.setattr(tmdbapi.setting, "get_transport", lambda: session)
+    with pytest.raises(tmdbapi.exceptions.TmdbApiException):
+        tmdbapi.api3.movies.add_rating(550, 8.5, guest_session_id="guest")
+    pytest.assume(session.calls == 1)
+    pytest.assume(waits == [])
@@ -0,0 +1,83 @@
+import json
+
+import pytest
+
+from tmdbapi._core import Request
+from tmdbapi.store import Store
+
+STORE_PATH = "tmdbapi/tests/temp/store.sqlite"
+
+
+def request(endpoint, path, **params):
+    url = f"https://api.themoviedb.org/3{path}"
+    return Request(endpoint, "GET", url, params, {})
+
+
+@pytest.fixture
+def store():
+    store = Store(STORE_PATH)
+    store._connect().execute("DELETE FROM entities")
+    return store
+
+
+def test_save(store):
+    movie = {
+        "id": 550,
+        "imdb_id": "tt0137523",
+        "title": "Fight Club",
+        "release_date": "1999-10-15",
+        "popularity": 61.4,
+    }
+    store.save(request("movie-details", "/movie/550"), json.dumps(movie).encode())
+    episode = {"id": 63056, "name": "Winter Is Coming", "air_date": "2011-04-17"}
+    store.save(
+        request("tv-episode-details", "/tv/1399/season/1/episode/1", language="en"),
+        json.dumps(episode).encode(),
+    )
+    store.save(request("movie-credits", "/movie/550/credits"), b'{"id": 550}')
+    pytest.assume(len(store) == 2)
+    pytest.assume(store.movie(550) == movie)
+    pytest.assume(store.episode(1399, 1, 1, language="en") == episode)
+    pytest.assume(store.episode(1399, 1, 1) is None)
+    pytest.assume(store.find_imdb_id("tt0137523")["id"] == 550)
+    pytest.assume(store.get("movie", 550, max_age=0) is None)
+
+
+def test_query(store):
+    for i in range(10):
+        movie = {"id": i, "release_date": f"200{i}-01-01", "popularity": i}
+        store.upsert("movie", i, movie)
+    movies = store.query("movie", date_gte="2003-01-01", limit=3)
+    pytest.assume([m["id"] for m in movies] == [9, 8, 7])
+    movies = store.query("movie", date_lte="2003-01-01", order_by="date.asc")
+    pytest.assume([m["id"] for m in movies] == [0, 1, 2, 3])
+    with pytest.raises(ValueError):
+        store.query("movie", order_by="title")
+
+
+def test_save_append_to_response(store):
+    rich = {"id": 550, "title": "Fight Club", "credits": {"cast": []}, "images": {}}
+    store.save(
+        request("movie-details", "/movie/550", append_to_response="credits,images"),
+        json.dumps(rich).encode(),
+    )
+    smaller = {"id": 550, "title": "Fight Club!", "videos": {"results": []}}
+    store.save(
+        request("movie-details", "/movie/550", append_to_response="videos"),
+        json.dumps(smaller).encode(),
+    )
+    store.save(
+        request("movie-details", "/movie/550"),
+        json.dumps({"id": 550, "title": "Fight Club"}).encode(),
+    )
+    pytest.assume(len(store) == 1)
+    pytest.assume(
+        store.movie(550)
+        == {
+            "id": 550,
+            "title": "Fight Club",
+            "credits": {"cast": []},
+            "images": {},
+            "videos": {"results": []},
+        }
+    )
@@ -0,0 +1,148 @@
+import json
+import sys
+
+import pytest
+
+import tmdbapi
+from tmdbapi.streaming import iter_items
+
+CREDITS = {
+    "id": 1399,
+    "crew": [{"id": 1, "name": ']}\\"', "jobs": [{"job": "Writer"}]}],
+    "cast": [
+        {"id": 22970, "name": "Peter Dinklage", "popularity": 1.5e3},
+        {"id": 239019, "name": "Kit Harington", "roles": []},
+        {"id": 1223786, "name": "Émilia Clarke", "order": -2},
+    ],
+    "empty": [],
+    "missing": None,
+}
+
+
+def setup_module():
+    loaded_package_modules = [
+        key for key, value in sys.modules.items() if "tmdbapi" in str(value)
+    ]
+    for key in loaded_package_modules:
+        del sys.modules[key]
+    global tmdbapi, iter_items  # reach the global scope
+    import tmdbapi  # reimport package every before test
+    from tmdbapi.streaming import iter_items
+
+
+def chunked(data, size: int) -> list:
+    body = json.dumps(data, ensure_ascii=False).encode()
+    return [body[i : i + size] for i in range(0, len(body), size)]
+
+
+@pytest.mark.parametrize("size", [1, 3, 64, 65536])
+def test_items(size):
+    chunks = chunked(CREDITS, size)
+    pytest.assume(list(iter_items(chunks, "cast")) == CREDITS["cast"])
+    pytest.assume(list(iter_items(chunks, "empty")) == [])
+    pytest.assume(list(iter_items(chunks, "missing")) == [])
+    pytest.assume(list(iter_items(chunks, "unknown")) == [])
+    chunks = chunked({"credits": CREDITS}, size)
+    pytest.assume(list(iter_items(chunks, "credits.crew")) == CREDITS["crew"])
+    pytest.assume(list(iter_items(chunked([1, 2.5, "3"], size))) == [1, 2.5, "3"])
+
+
+@pytest.mark.parametrize(
+    "body",
+    [b'{"cast": {"id": 1}}', b'{"cast": [1, 2', b'{"cast": [1 2]}', b'{"cast": 1}'],
+)
+def test_invalid(body):
+    with pytest.raises(ValueError):
+        list(iter_items([body], "cast"))
+
+
+def test_request(monkeypatch):
+    class Response:
+        def __init__(self, status_code, content):
+            self.status_code = status_code
+            self.headers = {"Content-Type": "application/json"}
+            self.content = content
+            self.url = ""
+            self.closed = False
+
+        def iter_content(self, chunk_size):
+            return iter(chunked(CREDITS, 5))
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            self.closed = True
+
+    class Session:
+        responses = []
+
+        def request(self, url, stream=False, **kwargs):
+            status_code = 404 if url.endswith("/0/aggregate_credits") else 200
+            content = b'{"success": false, "status_message": "Not found."}'
+            response = Response(status_code, content)
+            self.responses.append((stream, response))
+            return response
+
+    session = Session()
+    monkeypatch.setattr(tmdbapi.setting, "get_transport", lambda: session)
+    cred = tmdbapi.Credential()
+    cred.set(api_key="key")
+    tmdbapi.setting.use_cred(cred)
+    with tmdbapi.setting.override(stream="cast"):
+        cast = tmdbapi.api3.tv_series.aggregate_credits(1399)
+        with pytest.raises(tmdbapi.exceptions.TmdbApiException):
+            tmdbapi.api3.tv_series.aggregate_credits(0)
+    stream, response = session.responses[0]
+    pytest.assume(stream is True)
+    pytest.assume([member["id"] for member in cast] == [22970, 239019, 1223786])
+    pytest.assume(response.closed)
+    tmdbapi.setting.use_cred(None)
+
+
+def test_internal_request(monkeypatch):
+    class Response:
+        def __init__(self, url, stream):
+            self.status_code = 200
+            self.headers = {"Content-Type": "application/json"}
+            self.content = b'{"id": 42, "results": [{"id": 550}]}'
+            self.url = url
+            self.stream = stream
+
+        def iter_content(self, chunk_size):
+            return iter([self.content])
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            pass
+
+    class Session:
+        responses = []
+
+        def request(self, url, stream=False, **kwargs):
+            response = Response(url, stream)
+            self.responses.append(response)
+            return response
+
+    session = Session()
+    monkeypatch.setattr(tmdbapi.setting, "get_transport", lambda: session)
+    cred = tmdbapi.Credential()
+    cred.set(api_key="key", session_id="session")
+    tmdbapi.setting.use_cred(cred)
+    tmdbapi.setting.stream("results")
+    tmdbapi.setting.fields(["results"])
+    try:
+        # the account ID is looked up with the whole response
+        movies = tmdbapi.api3.account.favorite_movies()
+    finally:
+        tmdbapi.setting.stream(None)
+        tmdbapi.setting.fields(None)
+        tmdbapi.setting.use_cred(None)
+    lookup, request = session.responses
+    pytest.assume(lookup.url.endswith("/3/account") and not lookup.stream)
+    pytest.assume(cred["account_id"] == 42)
+    pytest.assume(request.url.endswith("/3/account/42/favorite/movies"))
+    pytest.assume(request.stream)
+    pytest.assume(list(movies) == [{"id": 550}])
@@ -201,6 +201,17 @@ class TestSettings:
             "use_session": False,
             "log_file": None,
             "credential": None,
+            "pool_connections": 10,
+            "pool_maxsize": 10,
+            "pool_idle_timeout": 30.0,
+            "rate_limit": None,
+            "retry": tmdbapi.transport.Retry(),
+            "cache": None,
+            "coalesce": True,
+            "store": None,
+            "json_decoder": "auto",
+            "fields": None,
+            "stream": None,
         }
 
     def test_error(self):
@@ -0,0 +1,130 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from requests.structures import CaseInsensitiveDict
+
+import tmdbapi
+from tmdbapi.transport import (
+    AsyncSingleFlight,
+    Retry,
+    SingleFlight,
+    Transport,
+    retry_after,
+)
+
+
+def test_transport_reuse_session():
+    transport = Transport(idle_timeout=None)
+    session = transport._acquire()
+    transport._release()
+    assert transport._acquire() is session
+
+
+def test_transport_idle_timeout():
+    transport = Transport(idle_timeout=0)
+    session = transport._acquire()
+    transport._release()
+    assert transport._acquire() is not session
+
+
+def test_setting_pool():
+    transport = tmdbapi.setting.get_transport()
+    pytest.assume(transport is tmdbapi.setting.get_transport())
+    tmdbapi.setting.set(pool_maxsize=32, pool_idle_timeout=None)
+    try:
+        new_transport = tmdbapi.setting.get_transport()
+        pytest.assume(new_transport is not transport)
+        pytest.assume(new_transport.pool_maxsize == 32)
+        pytest.assume(new_transport.idle_timeout is None)
+        pytest.assume(tmdbapi.setting["pool_connections"] == 10)
+    finally:
+        tmdbapi.setting.pool(maxsize=10, idle_timeout=30.0)
+
+
+def test_retry_after_seconds():
+    assert retry_after(CaseInsensitiveDict({"retry-after": "3"})) == 3
+
+
+def test_retry_after_date():
+    headers = CaseInsensitiveDict({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+    assert retry_after(headers) == 0
+
+
+def test_retry_after_missing():
+    assert retry_after(CaseInsensitiveDict()) is None
+
+
+def test_retry_status():
+    retry = Retry(total=2)
+    pytest.assume(retry.is_retry("GET", 0, 503))
+    pytest.assume(retry.is_retry("GET", 1, 429))
+    pytest.assume(not retry.is_retry("GET", 2, 503))
+    pytest.assume(not retry.is_retry("GET", 0, 404))
+    pytest.assume(not retry.is_retry("POST", 0, 503))
+
+
+def test_retry_connection_error():
+    assert Retry().is_retry("GET", 0)
+
+
+def test_retry_backoff():
+    retry = Retry(backoff_factor=1.0, backoff_max=5.0)
+    for attempt in range(6):
+        pytest.assume(0 <= retry.get_backoff(attempt) <= min(5.0, 2**attempt))
+
+
+def test_retry_backoff_retry_after():
+    headers = CaseInsensitiveDict({"Retry-After": "7"})
+    pytest.assume(Retry().get_backoff(0, headers) == 7)
+    pytest.assume(Retry(respect_retry_after=False).get_backoff(0, headers) <= 0.5)
+
+
+def test_single_flight():
+    flight = SingleFlight()
+    calls = []
+
+    def func():
+        calls.append(1)
+        time.sleep(0.2)
+        return b"{}"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(flight.do("key", func)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    pytest.assume(len(calls) == 1)
+    pytest.assume(results == [b"{}"] * 8)
+    pytest.assume(flight.do("key", func) == b"{}" and len(calls) == 2)
+
+
+def test_single_flight_error():
+    flight = SingleFlight()
+
+    def func():
+        raise ValueError("error")
+
+    with pytest.raises(ValueError):
+        flight.do("key", func)
+
+
+def test_async_single_flight():
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def func():
+        calls.append(1)
+        await asyncio.sleep(0.1)
+        return b"{}"
+
+    async def main():
+        return await asyncio.gather(*(flight.do("key", func) for _ in range(8)))
+
+    pytest.assume(asyncio.run(main()) == [b"{}"] * 8)
+    pytest.assume(len(calls) == 1)
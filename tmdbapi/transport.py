@@ -0,0 +1,371 @@
+"""HTTP Transport
+
+Provides the pooled, keep-alive HTTP transport shared by every `api3` and
+`api4` request. Reusing connections saves the TCP and TLS handshake that
+a bare `requests.request` call pays on every request.
+"""
+
+import random
+import threading
+import time
+from typing import Optional
+
+import tmdbapi
+from tmdbapi.cache import cache_key
+
+
+class Transport:
+    """A pooled HTTP transport.
+
+    The transport keeps one `requests.Session` with an `HTTPAdapter` mounted
+    for http and https, so the connections to api.themoviedb.org are kept
+    alive and reused across requests and threads.
+
+    Attributes
+    ----------
+    pool_connections : int
+        The number of connection pools (one per host) to cache.
+    pool_maxsize : int
+        The maximum number of connections kept alive per host.
+    idle_timeout : float or None
+        The number of seconds the transport may stay idle before the pooled
+        connections are dropped and reopened. The remote server closes idle
+        connections, so reusing one after a long pause usually fails.
+        None to never recycle the pool.
+
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        idle_timeout: Optional[float] = 30.0,
+    ):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.idle_timeout = idle_timeout
+        self._session = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._last_used = 0.0
+
+    def __repr__(self):
+        return (
+            f"Transport(pool_connections={self.pool_connections}, "
+            f"pool_maxsize={self.pool_maxsize}, idle_timeout={self.idle_timeout})"
+        )
+
+    def _new_session(self) -> "requests.Session":
+        # imported here, so `import tmdbapi` does not load requests
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def _acquire(self) -> "requests.Session":
+        """Get the session, recycling it if it has been idle for too long."""
+        with self._lock:
+            now = time.monotonic()
+            idle = now - self._last_used
+            if (
+                self._session is not None
+                and self._in_flight == 0
+                and self.idle_timeout is not None
+                and idle > self.idle_timeout
+            ):
+                tmdbapi.LOGGER.debug(
+                    f"Transport idle for {idle:.1f}s, recycling the connection pool."
+                )
+                self._session.close()
+                self._session = None
+            if self._session is None:
+                self._session = self._new_session()
+            self._in_flight += 1
+            self._last_used = now
+            return self._session
+
+    def _release(self):
+        with self._lock:
+            self._in_flight -= 1
+            self._last_used = time.monotonic()
+
+    def request(self, method: str, url: str, **kwargs) -> "requests.Response":
+        """Send a request through the connection pool.
+
+        Accepts the same arguments as `requests.Session.request`.
+
+        Parameters
+        ----------
+        method : str
+            The request method.
+        url : str
+            The request URL.
+
+        Returns
+        -------
+        requests.Response
+        """
+        session = self._acquire()
+        try:
+            return session.request(method, url, **kwargs)
+        finally:
+            self._release()
+
+    def close(self):
+        """Close all pooled connections."""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+
+class Retry:
+    """The retry policy for transient failures.
+
+    Idempotent requests are retried on connection errors, timeouts and the
+    HTTP status codes in `status_forcelist`. The default status codes cover
+    the TMDB status codes 9 and 46 (503, service offline or maintenance),
+    24 (504, backend timeout), 25 (429, rate limit) and 43 (502, backend
+    unreachable).
+
+    The wait before each retry is the Retry-After header when the response
+    has one, otherwise a random time between 0 and
+    `backoff_factor * 2 ** attempt` seconds, capped at `backoff_max`.
+
+    Attributes
+    ----------
+    total : int
+        The maximum number of retries. 0 to disable retries.
+    backoff_factor : float
+        The base of the exponential backoff in seconds.
+    backoff_max : float
+        The maximum backoff in seconds.
+    status_forcelist : tuple
+        The HTTP status codes to retry.
+    allowed_methods : tuple
+        The request methods to retry.
+    respect_retry_after : bool
+        Whether to wait for the time in the Retry-After header.
+
+    """
+
+    def __init__(
+        self,
+        total: int = 3,
+        backoff_factor: float = 0.5,
+        backoff_max: float = 30.0,
+        status_forcelist: tuple = (429, 502, 503, 504),
+        allowed_methods: tuple = ("GET", "HEAD"),
+        respect_retry_after: bool = True,
+    ):
+        self.total = total
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.status_forcelist = tuple(status_forcelist)
+        self.allowed_methods = tuple(m.upper() for m in allowed_methods)
+        self.respect_retry_after = respect_retry_after
+
+    def __repr__(self):
+        return (
+            f"Retry(total={self.total}, backoff_factor={self.backoff_factor}, "
+            f"backoff_max={self.backoff_max}, "
+            f"status_forcelist={self.status_forcelist}, "
+            f"allowed_methods={self.allowed_methods}, "
+            f"respect_retry_after={self.respect_retry_after})"
+        )
+
+    def __eq__(self, other):
+        return isinstance(other, Retry) and vars(self) == vars(other)
+
+    def is_retry(self, method: str, attempt: int, status_code: int = None) -> bool:
+        """Check whether the request should be retried.
+
+        Parameters
+        ----------
+        method : str
+            The request method.
+        attempt : int
+            The number of retries already done.
+        status_code : int, optional
+            The HTTP status code, or None for a connection error or timeout.
+
+        Returns
+        -------
+        bool
+        """
+        if attempt >= self.total or method.upper() not in self.allowed_methods:
+            return False
+        return status_code is None or status_code in self.status_forcelist
+
+    def get_backoff(self, attempt: int, headers=None) -> float:
+        """Get the seconds to wait before the next retry.
+
+        Parameters
+        ----------
+        attempt : int
+            The number of retries already done.
+        headers : Mapping, optional
+            The response headers.
+
+        Returns
+        -------
+        float
+        """
+        if self.respect_retry_after and headers is not None:
+            seconds = retry_after(headers)
+            if seconds is not None:
+                return seconds
+        return random.uniform(
+            0, min(self.backoff_max, self.backoff_factor * 2**attempt)
+        )
+
+
+def retry_after(headers) -> Optional[float]:
+    """Get the seconds to wait from the Retry-After header.
+
+    Parameters
+    ----------
+    headers : Mapping
+        The case-insensitive response headers.
+
+    Returns
+    -------
+    float or None
+        The seconds to wait, or None if the header is missing or invalid.
+    """
+    value = headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    from email.utils import parsedate_to_datetime
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def flight_key(request) -> tuple:
+    """Get the key of the identical requests to coalesce.
+
+    Unlike the cache key, it includes the credentials, so the requests of
+    different users are never shared.
+
+    Parameters
+    ----------
+    request : tmdbapi._core.Request
+        The prepared request.
+
+    Returns
+    -------
+    tuple
+    """
+    return (
+        cache_key(request),
+        request.params.get("api_key"),
+        request.headers.get("Authorization"),
+    )
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Run identical concurrent calls once.
+
+    The first thread calling `do` with a key runs the function, and the
+    other threads calling with the same key meanwhile wait for it and get
+    the same result or exception.
+
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, func):
+        """Call `func`, or wait for the call in flight with the same key.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key of the identical calls.
+        func : callable
+            The function without arguments.
+
+        Returns
+        -------
+        Any
+            The return value of `func`.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = func()
+        except BaseException as err:
+            call.error = err
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+class AsyncSingleFlight:
+    """Run identical concurrent coroutines once.
+
+    The asyncio version of `SingleFlight`. The call runs in a task, so a
+    cancelled caller does not cancel it for the other callers.
+
+    """
+
+    def __init__(self):
+        self._calls = {}
+
+    async def do(self, key, func):
+        """Await `func()`, or the call in flight with the same key.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key of the identical calls.
+        func : callable
+            The coroutine function without arguments.
+
+        Returns
+        -------
+        Any
+            The return value of `func()`.
+        """
+        import asyncio
+
+        key = (asyncio.get_running_loop(), key)
+        task = self._calls.get(key)
+        if task is None:
+            task = self._calls[key] = asyncio.ensure_future(func())
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        return await asyncio.shield(task)